@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import asdict, fields
+from pathlib import Path
+
+from scripts.check_governance_core._synthetic_repo import SyntheticProfile, generate_repository
+
+
+BENCHMARK_VERSION = 1
+PRESET_PROFILES = {
+    "small": SyntheticProfile(routed_docs=50, python_files=25, tracked_paths=100, manifest_profiles=5),
+    "medium": SyntheticProfile(routed_docs=500, python_files=250, tracked_paths=2_000, manifest_profiles=25),
+    "large": SyntheticProfile(
+        routed_docs=3_000,
+        router_depth=4,
+        python_files=1_000,
+        tracked_paths=20_000,
+        manifest_profiles=100,
+    ),
+}
+CASES = ("run_checks:full", "run_checks:docs", "run_checks:project_docs", "resolve_documents")
+DEFAULT_TOLERANCE = 0.25
+MIN_REGRESSION_SECONDS = 0.005
+MIN_REGRESSION_BYTES = 256 * 1024
+
+logger = logging.getLogger("check_governance_core")
+
+
+def _case_call(case: str, root: Path) -> Callable[[], Mapping[str, object]]:
+    from scripts.check_governance_core.check_governance_core_main import resolve_documents, run_checks
+
+    request = {"repo_root": str(root), "governance_root": str(root)}
+    if case == "resolve_documents":
+        return lambda: resolve_documents(request)
+    return lambda: run_checks({**request, "mode": case.split(":", 1)[1]})
+
+
+def _measure_case(call: Callable[[], Mapping[str, object]], repeats: int) -> dict[str, object]:
+    timings: list[float] = []
+    status = ""
+    for _repeat in range(repeats):
+        started = time.perf_counter()
+        result = call()
+        timings.append(time.perf_counter() - started)
+        status = str(result["status"])
+    tracemalloc.start()
+    try:
+        call()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "status": status,
+        "wall_seconds": {"min": min(timings), "median": statistics.median(timings), "max": max(timings)},
+        "peak_bytes": peak,
+    }
+
+
+def run_benchmarks(
+    profiles: Mapping[str, SyntheticProfile],
+    *,
+    repeats: int = 3,
+) -> tuple[dict[str, object] | None, str | None]:
+    """Generate each profile once and time every public entry point against it.
+
+    Each timed call parses its own documents; peak memory comes from one further traced call,
+    so tracing overhead never reaches the timings.
+    """
+
+    if repeats < 1:
+        return None, "repeats must be a positive integer"
+    results: list[dict[str, object]] = []
+    for name, profile in profiles.items():
+        with tempfile.TemporaryDirectory(prefix="governance-bench-") as temp:
+            root = Path(temp) / "repo"
+            root.mkdir()
+            generate_started = time.perf_counter()
+            file_count, generate_error = generate_repository(root, profile)
+            if generate_error:
+                return None, f"profile {name}: {generate_error}"
+            generate_seconds = time.perf_counter() - generate_started
+            for case in CASES:
+                results.append(
+                    {
+                        "profile": name,
+                        "case": case,
+                        "shape": asdict(profile),
+                        "files": file_count,
+                        "generate_seconds": generate_seconds,
+                        **_measure_case(_case_call(case, root), repeats),
+                    }
+                )
+    return {
+        "version": BENCHMARK_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "repeats": repeats,
+        "results": results,
+    }, None
+
+
+def compare_benchmarks(
+    baseline: Mapping[str, object],
+    current: Mapping[str, object],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> tuple[list[str], list[str]]:
+    """Return ``(regressions, notes)`` for every case both runs measured on the same shape.
+
+    A case regresses when its median wall time or peak memory grows by more than
+    ``tolerance`` and by more than a small absolute floor, or when its status changes.
+    """
+
+    regressions: list[str] = []
+    notes: list[str] = []
+    if baseline.get("version") != BENCHMARK_VERSION or current.get("version") != BENCHMARK_VERSION:
+        return [f"benchmark results must both be version {BENCHMARK_VERSION}"], notes
+    for key in ("python", "machine", "cpus"):
+        if baseline.get(key) != current.get(key):
+            notes.append(f"{key} differs: {baseline.get(key)} -> {current.get(key)}")
+    measured = {(str(item["profile"]), str(item["case"])): item for item in current["results"]}  # type: ignore[index]
+    for before in baseline["results"]:  # type: ignore[attr-defined]
+        label = f"{before['profile']}/{before['case']}"
+        after = measured.get((str(before["profile"]), str(before["case"])))
+        if after is None:
+            regressions.append(f"{label}: missing from current results")
+            continue
+        if after["shape"] != before["shape"]:
+            notes.append(f"{label}: profile shape differs; not compared")
+            continue
+        if after["status"] != before["status"]:
+            regressions.append(f"{label}: status {before['status']} -> {after['status']}")
+        old_seconds = float(before["wall_seconds"]["median"])
+        new_seconds = float(after["wall_seconds"]["median"])
+        if new_seconds > old_seconds * (1 + tolerance) and new_seconds - old_seconds > MIN_REGRESSION_SECONDS:
+            regressions.append(
+                f"{label}: median wall {old_seconds * 1000:.1f}ms -> {new_seconds * 1000:.1f}ms "
+                f"(+{(new_seconds / old_seconds - 1) * 100 if old_seconds else float('inf'):.0f}%)"
+            )
+        old_peak = int(before["peak_bytes"])
+        new_peak = int(after["peak_bytes"])
+        if new_peak > old_peak * (1 + tolerance) and new_peak - old_peak > MIN_REGRESSION_BYTES:
+            regressions.append(f"{label}: peak memory {old_peak:,} -> {new_peak:,} bytes")
+    return regressions, notes
+
+
+def load_results(path: Path) -> tuple[dict[str, object] | None, str | None]:
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError) as exc:
+        return None, f"benchmark results could not be read from {path}: {exc}"
+    if not isinstance(payload, dict) or not isinstance(payload.get("results"), list):
+        return None, f"benchmark results are malformed: {path}"
+    return payload, None
+
+
+def write_results(path: Path, payload: Mapping[str, object]) -> str | None:
+    """Atomically replace ``path`` with the results; return an explicit error when that fails."""
+
+    temporary: str | None = None
+    failure: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=path.parent)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        os.replace(temporary, path)
+        temporary = None
+    except (OSError, TypeError, ValueError) as exc:
+        failure = f"benchmark results were not written to {path}: {exc}"
+    if temporary is not None:
+        try:
+            os.unlink(temporary)
+        except OSError as exc:
+            failure = f"{failure}; its temporary file was not removed: {exc}"
+    return failure
+
+
+def _custom_profile(args: argparse.Namespace) -> SyntheticProfile | None:
+    values = {
+        field.name: getattr(args, field.name)
+        for field in fields(SyntheticProfile)
+        if getattr(args, field.name, None) is not None
+    }
+    return SyntheticProfile(**values) if values else None
+
+
+def benchmark_main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="check_governance_core_main.py benchmark",
+        description="Time the public governance-core API on generated repositories.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="generate synthetic repositories and write JSON timings")
+    run.add_argument("--profile", action="append", choices=sorted(PRESET_PROFILES), help="preset shape (repeatable)")
+    for field in fields(SyntheticProfile):
+        run.add_argument(f"--{field.name.replace('_', '-')}", dest=field.name, type=int, help="custom shape")
+    run.add_argument("--repeats", type=int, default=3)
+    run.add_argument("--output", required=True, help="JSON results file")
+    run.add_argument("--baseline", help="compare against this stored result file after the run")
+    run.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    compare = commands.add_parser("compare", help="flag regressions between two stored result files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+    if args.tolerance < 0:
+        parser.error("--tolerance must not be negative")
+
+    if args.command == "run":
+        profiles = {name: PRESET_PROFILES[name] for name in args.profile or ()}
+        custom = _custom_profile(args)
+        if custom is not None:
+            profiles["custom"] = custom
+        payload, run_error = run_benchmarks(profiles or {"small": PRESET_PROFILES["small"]}, repeats=args.repeats)
+        if run_error:
+            logger.error("ERROR: %s", run_error)
+            return 2
+        assert payload is not None
+        for item in payload["results"]:  # type: ignore[attr-defined]
+            logger.info(
+                "%-8s %-24s %-7s median %8.1fms  peak %12s bytes",
+                item["profile"],
+                item["case"],
+                item["status"],
+                item["wall_seconds"]["median"] * 1000,
+                f"{item['peak_bytes']:,}",
+            )
+        write_error = write_results(Path(args.output), payload)
+        if write_error:
+            logger.error("ERROR: %s", write_error)
+            return 2
+        if args.baseline is None:
+            return 0
+        current: Mapping[str, object] = payload
+    else:
+        loaded, load_error = load_results(Path(args.current))
+        if load_error:
+            logger.error("ERROR: %s", load_error)
+            return 2
+        assert loaded is not None
+        current = loaded
+    baseline, baseline_error = load_results(Path(args.baseline))
+    if baseline_error:
+        logger.error("ERROR: %s", baseline_error)
+        return 2
+    assert baseline is not None
+    regressions, notes = compare_benchmarks(baseline, current, tolerance=args.tolerance)
+    for note in notes:
+        logger.warning("NOTE: %s", note)
+    for regression in regressions:
+        logger.error("REGRESSION: %s", regression)
+    logger.info("Benchmark comparison: %s", "FAILED" if regressions else "PASSED")
+    return 1 if regressions else 0
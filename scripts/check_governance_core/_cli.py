@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+
+from scripts.check_governance_core._inventory import INVENTORY_SOURCES
+
+
+def parse_command_line(argv: Sequence[str]) -> tuple[dict[str, object], argparse.Namespace]:
+    """Parse CLI arguments into a public ``run_checks`` request and the options that shape output."""
+
+    parser = argparse.ArgumentParser(description="Run the governance-core public validation contract.")
+    parser.add_argument("--repo-root")
+    parser.add_argument("--governance-root")
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument("--only-docs-ssot", action="store_true")
+    modes.add_argument("--only-project-docs", action="store_true")
+    parser.add_argument("--fail-on-safety-warnings", action="store_true")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--scan-workers", type=int, default=1, help="threads that enumerate the repository tree")
+    parser.add_argument(
+        "--inventory-source",
+        choices=INVENTORY_SOURCES,
+        default="walk",
+        help="git_index reads a clean worktree's tree from the Git index instead of walking it",
+    )
+    parser.add_argument("--profile", action="store_true", help="print per-check timing and I/O metrics")
+    parser.add_argument("--prune-ignored", action="store_true", help="skip Git-ignored directories in tree walks")
+    parser.add_argument(
+        "--cache-dir",
+        help="replay unchanged check results from this directory outside tracked content",
+    )
+    parser.add_argument("--watch", action="store_true", help="re-run changed checks until interrupted")
+    parser.add_argument("--changed", nargs="+", metavar="PATH", help="validate only what these paths affect")
+    parser.add_argument("--range", dest="revision_range", metavar="BASE..HEAD", help="validate only this diff")
+    parser.add_argument(
+        "--format",
+        choices=("text", "ndjson"),
+        default="text",
+        help="ndjson prints one JSON record per completed check, then a summary line",
+    )
+    args = parser.parse_args(argv)
+    if args.format == "ndjson" and args.watch:
+        parser.error("--format=ndjson cannot be combined with --watch")
+    mode = "docs" if args.only_docs_ssot else "project_docs" if args.only_project_docs else "full"
+    request: dict[str, object] = {
+        "repo_root": args.repo_root,
+        "governance_root": args.governance_root,
+        "mode": mode,
+        "fail_on_safety_warnings": args.fail_on_safety_warnings,
+        "workers": args.workers,
+        "scan_workers": args.scan_workers,
+        "inventory_source": args.inventory_source,
+        "prune_ignored": args.prune_ignored,
+        "metrics": args.profile,
+        "cache_dir": args.cache_dir,
+        "changed_paths": args.changed,
+        "revision_range": args.revision_range,
+    }
+    return request, args
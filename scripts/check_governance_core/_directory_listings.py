@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from scripts.check_governance_core._single_flight import SingleFlightCache
+
+
+Listing = dict[str, bool]
+
+
+class DirectoryListings:
+    """Per-run cache of directory listings for exactly spelled path lookups.
+
+    Each directory is listed once, single-flight, into a map from exact child name to whether
+    that child is a symlink, so resolving an exactly spelled path costs one dict hit per
+    component after the first listing. Listings are never revalidated, so one instance serves
+    one run only.
+    """
+
+    def __init__(self) -> None:
+        self._listings: SingleFlightCache[Path, tuple[Listing, str | None]] = SingleFlightCache("inventory")
+
+    def listing(self, directory: Path) -> tuple[Listing, str | None]:
+        """Return ``directory``'s children by exact name, or the OS error that listing it raised."""
+
+        return self._listings.get(directory, lambda: _list(directory))
+
+
+def _list(directory: Path) -> tuple[Listing, str | None]:
+    try:
+        with os.scandir(directory) as iterator:
+            return {item.name: item.is_symlink() for item in iterator}, None
+    except OSError as exc:
+        return {}, str(exc)
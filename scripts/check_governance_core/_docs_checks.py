@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from scripts.check_governance_core import _inputs
 from scripts.check_governance_core._documents import (
     DocumentStore,
     code_paths,
@@ -23,15 +24,27 @@ def _router(store: DocumentStore, path: Path) -> tuple[list[str], list[str]]:
     return targets, [f"{path}: {error}" for error in errors]
 
 
+def _changed_scope(docs_root: Path, changed: frozenset[Path]) -> set[Path]:
+    """Return each changed docs path plus every docs directory above it."""
+
+    return {
+        candidate
+        for path in changed
+        for candidate in (path, *path.parents)
+        if candidate == docs_root or docs_root in candidate.parents
+    }
+
+
 def check_docs(
     repo_root: Path,
     governance_root: Path,
     store: DocumentStore,
     inventory: RepositoryInventory,
+    changed: frozenset[Path] | None = None,
 ) -> tuple[list[str], list[str]]:
     errors: list[str] = []
     docs_root = repo_root / "docs"
-    if not docs_root.is_dir():
+    if not _inputs.is_dir(docs_root):
         return [f"Missing required docs directory: {docs_root}"], []
     _markdown_files, markdown_error = inventory.markdown_files(docs_root)
     if markdown_error:
@@ -41,6 +54,7 @@ def check_docs(
     if policy_error:
         errors.append(policy_error)
         policy_text = ""
+    scope = None if changed is None or policy in changed else _changed_scope(docs_root, changed)
     allowed_doc_types = declared_doc_types(policy_text or "")
     if not allowed_doc_types:
         errors.append(f"Docs policy does not declare one consistent doc_type domain: {policy}")
@@ -48,9 +62,10 @@ def check_docs(
     tree, inventory_error = inventory.tree_entries(docs_root)
     if inventory_error:
         return [inventory_error, *errors], []
-    entries = tuple(entry for entry in tree if entry.path == docs_root or docs_root in entry.path.parents)
-    directories = [docs_root, *(entry.path for entry in entries if entry.is_directory and entry.path != docs_root)]
+    directories = [docs_root, *(entry.path for entry in tree if entry.is_directory)]
     for directory in directories:
+        if scope is not None and directory not in scope:
+            continue
         router_name = router_filename(directory.name)
         router_path = directory / router_name
         targets, route_errors = _router(store, router_path)
@@ -59,10 +74,8 @@ def check_docs(
             continue
         direct_children = [
             entry
-            for entry in entries
-            if entry.path.parent == directory
-            and entry.path.name != router_name
-            and not entry.path.name.startswith(".")
+            for entry in inventory.children_of(directory)
+            if entry.path.name != router_name and not entry.path.name.startswith(".")
         ]
         leaves = [
             entry.path
@@ -94,8 +107,8 @@ def check_docs(
             if target not in allowed_targets:
                 errors.append(f"{router_path}: route target is not a direct child contract: {target}")
 
-    for path in (entry.path for entry in entries if not entry.is_directory and entry.path.suffix.lower() == ".md"):
-        if path.name in {router_filename(path.parent.name), "SKILL.md"}:
+    for path in (entry.path for entry in tree if not entry.is_directory and entry.path.suffix.lower() == ".md"):
+        if path.name in {router_filename(path.parent.name), "SKILL.md"} or (scope is not None and path not in scope):
             continue
         text, read_error = store.read_text(path)
         if read_error:
@@ -173,18 +186,11 @@ def check_project_docs(
     project_router = project_root / router_filename(project_root.name)
     project_targets, route_errors = _router(store, project_router)
     errors.extend(route_errors)
-    if project_root.is_dir():
-        tree, inventory_error = inventory.tree_entries(docs_root)
+    if _inputs.is_dir(project_root):
+        _tree, inventory_error = inventory.tree_entries(docs_root)
         if inventory_error:
             return [*errors, inventory_error]
-        entries = tuple(
-            entry for entry in tree if entry.path == project_root or project_root in entry.path.parents
-        )
-        for branch in (
-            entry.path
-            for entry in entries
-            if entry.is_directory and entry.path.parent == project_root
-        ):
+        for branch in (entry.path for entry in inventory.children_of(project_root) if entry.is_directory):
             branch_router_name = router_filename(branch.name)
             if f"{branch.name}/{branch_router_name}" not in project_targets:
                 errors.append(f"{project_router}: missing branch route {branch.name}/{branch_router_name}")
@@ -194,10 +200,8 @@ def check_project_docs(
             if not branch_errors:
                 for leaf in (
                     entry.path
-                    for entry in entries
-                    if not entry.is_directory
-                    and entry.path.parent == branch
-                    and entry.path.suffix.lower() == ".md"
+                    for entry in inventory.children_of(branch)
+                    if not entry.is_directory and entry.path.suffix.lower() == ".md"
                 ):
                     if leaf.name != branch_router_name and leaf.name not in targets:
                         errors.append(f"{branch_router}: orphan project doc {leaf.name}")
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+import os
 import re
+import time
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
 from typing import Iterable
 from urllib.parse import unquote
 
+from scripts.check_governance_core import _inputs, _metrics
+from scripts.check_governance_core._inputs import RACY_NANOSECONDS, FileStamp, file_stamp
+from scripts.check_governance_core._inventory import RepositoryInventory
+from scripts.check_governance_core._parse_memo import memoized
+from scripts.check_governance_core._path_resolution import PathResolutions
+from scripts.check_governance_core._single_flight import SingleFlightCache
+
 
 _HEADING = re.compile(r"^[ ]{0,3}(#{1,6})[ \t]+(.+?)[ \t]*#*[ \t]*$")
 _FENCE = re.compile(r"^[ ]{0,3}(`{3,}|~{3,})(.*)$")
 _NUMBERED_FOLDER = re.compile(r"^[0-9]{2}-(?P<name>.+)$")
 _DATED_FOLDER = re.compile(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}-.+$")
 _LINK = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
-MAX_ROUTED_DOCUMENTS = 10_000
 
 
 @dataclass(frozen=True)
@@ -56,38 +64,98 @@ class MarkdownDocument:
         return tuple(values)
 
 
+_TextResult = tuple[str | None, str | None]
+_MarkdownResult = tuple[MarkdownDocument | None, str | None]
+_WarmDocument = tuple[FileStamp, int, _TextResult, _MarkdownResult | None]
+
+
 class DocumentStore:
-    def __init__(self) -> None:
-        self._text: dict[Path, tuple[str | None, str | None]] = {}
-        self._markdown: dict[Path, tuple[MarkdownDocument | None, str | None]] = {}
+    """Read and parse each governed document at most once per run, safely across threads.
+
+    A store built from a previous run's ``warm`` store reuses that run's text and parse for every
+    file whose size and mtime still match and were already settled when it was read. Paths are
+    resolved through ``resolutions``, which a run shares with its inventory, so a lookup that
+    hits the cache makes no syscall.
+    """
+
+    def __init__(self, warm: DocumentStore | None = None, *, resolutions: PathResolutions | None = None) -> None:
+        self._resolutions = resolutions if resolutions is not None else PathResolutions()
+        self._text: SingleFlightCache[Path, _TextResult] = SingleFlightCache("document")
+        self._markdown: SingleFlightCache[Path, _MarkdownResult] = SingleFlightCache("document")
+        self._stamps: dict[Path, FileStamp | None] = {}
+        self._created_ns = time.time_ns()
+        self._warm = warm.reusable() if warm is not None else {}
+
+    def reusable(self) -> dict[Path, _WarmDocument]:
+        """Return this store's successfully read documents plus the warm ones it did not revisit."""
+
+        documents = dict(self._warm)
+        parsed = dict(self._markdown.items())
+        for resolved, text in self._text.items():
+            stamp = self._stamps.get(resolved)
+            if stamp is not None:
+                documents[resolved] = (stamp, self._created_ns, text, parsed.get(resolved))
+        return documents
 
     def read_text(self, path: Path) -> tuple[str | None, str | None]:
-        resolved = path.resolve()
-        if resolved in self._text:
-            return self._text[resolved]
-        try:
-            value = resolved.read_text(encoding="utf-8")
-            result: tuple[str | None, str | None] = (value, None)
-        except FileNotFoundError:
-            result = (None, f"Missing required file: {path}")
-        except UnicodeDecodeError as exc:
-            result = (None, f"Invalid UTF-8 in {path}: byte {exc.start}")
-        except OSError as exc:
-            result = (None, f"Unable to read {path}: {exc}")
-        self._text[resolved] = result
+        resolved = self._resolutions.resolve(path)
+        result = self._text.get(resolved, lambda: self._load_text(resolved, path))
+        _inputs.file_consumed(resolved, self._stamps.get(resolved))
         return result
 
     def markdown(self, path: Path) -> tuple[MarkdownDocument | None, str | None]:
-        resolved = path.resolve()
-        if resolved in self._markdown:
-            return self._markdown[resolved]
-        text, error = self.read_text(path)
-        result = (parse_markdown(text), None) if text is not None else (None, error)
-        self._markdown[resolved] = result
+        def load() -> tuple[MarkdownDocument | None, str | None]:
+            text, error = self.read_text(path)
+            warm = self._warm.get(resolved)
+            if warm is not None and warm[3] is not None and warm[2][0] is text:
+                return warm[3]
+            return (parse_markdown(text), None) if text is not None else (None, error)
+
+        resolved = self._resolutions.resolve(path)
+        result = self._markdown.get(resolved, load)
+        _inputs.file_consumed(resolved, self._stamps.get(resolved))
         return result
 
+    def _load_text(self, resolved: Path, path: Path) -> tuple[str | None, str | None]:
+        self._stamps[resolved] = None
+        warm = self._warm.get(resolved)
+        if warm is not None:
+            stamp, read_ns, text, _parsed = warm
+            try:
+                metadata = os.stat(resolved)
+            except OSError:
+                metadata = None
+            if (
+                metadata is not None
+                and (metadata.st_size, metadata.st_mtime_ns) == stamp[:2]
+                and stamp[1] < read_ns - RACY_NANOSECONDS
+            ):
+                self._stamps[resolved] = stamp
+                return text
+        try:
+            with resolved.open("rb") as handle:
+                metadata = os.fstat(handle.fileno())
+                raw = handle.read()
+        except FileNotFoundError:
+            return None, f"Missing required file: {path}"
+        except OSError as exc:
+            return None, f"Unable to read {path}: {exc}"
+        _metrics.count("files_read")
+        _metrics.count("bytes_read", len(raw))
+        self._stamps[resolved] = file_stamp(metadata, raw)
+        try:
+            return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n"), None
+        except UnicodeDecodeError as exc:
+            return None, f"Invalid UTF-8 in {path}: byte {exc.start}"
+
 
 def parse_markdown(text: str) -> MarkdownDocument:
+    """Parse ``text``, once per batch chunk when runs share one governance tree."""
+
+    return memoized("markdown", text, _parse_markdown)
+
+
+def _parse_markdown(text: str) -> MarkdownDocument:
     operative: list[tuple[int, str]] = []
     headings: list[Heading] = []
     fence_char: str | None = None
@@ -167,140 +235,6 @@ def router_targets(document: MarkdownDocument) -> tuple[list[str], list[str]]:
     return targets, errors
 
 
-def routed_markdown_corpus(
-    governance_root: Path,
-    store: DocumentStore,
-    available_markdown: Iterable[Path],
-    *,
-    reserved_paths: Iterable[Path] = (),
-) -> tuple[tuple[str, ...], list[str]]:
-    """Resolve terminal Markdown leaves from the canonical agents router topology."""
-
-    docs_root = governance_root / "docs/agents"
-    start = docs_root / router_filename(docs_root.name)
-    available_by_key: dict[str, Path] = {}
-    directory_keys: set[str] = set()
-    for path in available_markdown:
-        try:
-            key = path.relative_to(governance_root).as_posix()
-        except ValueError:
-            continue
-        available_by_key[key] = path
-        current = path.parent
-        while current == docs_root or docs_root in current.parents:
-            directory_keys.add(current.relative_to(governance_root).as_posix())
-            if current == docs_root:
-                break
-            current = current.parent
-    folded_directory_keys = {key.casefold() for key in directory_keys}
-    errors: list[str] = []
-    leaves: list[str] = []
-    visited_routers: set[Path] = set()
-    active_routers: set[Path] = set()
-    visited_leaves: set[Path] = set()
-    identities: dict[tuple[int, int], Path] = {}
-
-    def register_identity(path: Path) -> bool:
-        try:
-            metadata = path.stat(follow_symlinks=False)
-        except OSError as exc:
-            errors.append(f"Unable to inspect routed governance document {path}: {exc}")
-            return False
-        identity = (metadata.st_dev, metadata.st_ino)
-        prior = identities.get(identity)
-        if prior is not None and prior != path:
-            errors.append(f"Governance document aliases another routed path: {path} -> {prior}")
-            return False
-        identities[identity] = path
-        return True
-
-    for reserved in reserved_paths:
-        register_identity(reserved)
-
-    def visit(router: Path) -> None:
-        if router in active_routers:
-            errors.append(f"Governance docs router cycle detected at {router}")
-            return
-        if router in visited_routers:
-            errors.append(f"Governance docs router is referenced more than once: {router}")
-            return
-        router_key = router.relative_to(governance_root).as_posix()
-        canonical_router = available_by_key.get(router_key)
-        if canonical_router is None:
-            errors.append(f"Governance docs router is missing or aliased: {router}")
-            return
-        router = canonical_router
-        if not register_identity(router):
-            return
-        if len(visited_routers) + len(visited_leaves) >= MAX_ROUTED_DOCUMENTS:
-            errors.append(f"Governance docs topology exceeded {MAX_ROUTED_DOCUMENTS} Markdown documents")
-            return
-        visited_routers.add(router)
-        active_routers.add(router)
-        document, read_error = store.markdown(router)
-        if read_error:
-            errors.append(read_error)
-            active_routers.remove(router)
-            return
-        assert document is not None
-        targets, route_errors = router_targets(document)
-        errors.extend(f"{router}: {error}" for error in route_errors)
-        seen_targets: set[str] = set()
-        for value in targets:
-            key = value.casefold()
-            if key in seen_targets:
-                errors.append(f"{router}: duplicate route target {value}")
-                continue
-            seen_targets.add(key)
-            relative = PurePosixPath(value)
-            candidate = router.parent.joinpath(*relative.parts)
-            try:
-                candidate.relative_to(docs_root)
-            except ValueError:
-                errors.append(f"{router}: route target escapes governance docs root: {value}")
-                continue
-            candidate_key = candidate.relative_to(governance_root).as_posix()
-            if candidate_key in directory_keys:
-                visit(candidate / router_filename(candidate.name))
-                continue
-            if candidate_key.casefold() in folded_directory_keys:
-                errors.append(f"{router}: route target has noncanonical spelling: {value}")
-                continue
-            if candidate.suffix.lower() != ".md":
-                if candidate.is_dir():
-                    errors.append(
-                        f"{router}: directory route is missing its canonical child router: {value}"
-                    )
-                elif not candidate.exists():
-                    errors.append(f"{router}: route target does not exist: {value}")
-                continue
-            canonical_candidate = available_by_key.get(candidate_key)
-            if canonical_candidate is None:
-                errors.append(
-                    f"{router}: Markdown route target is missing, aliased, unreadable, or noncanonical: {value}"
-                )
-                continue
-            candidate = canonical_candidate
-            if candidate.name == router_filename(candidate.parent.name):
-                visit(candidate)
-                continue
-            if candidate in visited_leaves:
-                errors.append(f"Governance document is routed more than once: {candidate}")
-                continue
-            if not register_identity(candidate):
-                continue
-            _leaf, read_error = store.markdown(candidate)
-            if read_error:
-                errors.append(read_error)
-                continue
-            visited_leaves.add(candidate)
-            leaves.append(candidate.relative_to(governance_root).as_posix())
-        active_routers.remove(router)
-
-    visit(start)
-    return tuple(leaves), errors
-
-
 def frontmatter(text: str) -> dict[str, str]:
     lines = text.splitlines()
     if not lines or lines[0].strip() != "---":
@@ -335,8 +269,16 @@ def code_paths(lines: Iterable[str], *, prefix: str) -> tuple[str, ...]:
     return tuple(values)
 
 
-def resolve_declared_file(root: Path, value: str) -> tuple[Path | None, str | None]:
-    """Resolve an exactly spelled, contained owner-declared relative file path."""
+def resolve_declared_file(
+    root: Path,
+    value: str,
+    inventory: RepositoryInventory,
+) -> tuple[Path | None, str | None]:
+    """Resolve an exactly spelled, contained owner-declared relative file path.
+
+    Spelling and symlink status of each component come from the inventory's per-run directory
+    listings, and realpaths from its shared resolutions.
+    """
 
     declared = PurePosixPath(value)
     if (
@@ -348,20 +290,22 @@ def resolve_declared_file(root: Path, value: str) -> tuple[Path | None, str | No
         or any(part in {"", ".", ".."} or part != part.rstrip(" .") for part in declared.parts)
     ):
         return None, f"invalid non-canonical relative path: {value!r}"
-    current = root.resolve()
+    owner_root = inventory.resolutions.resolve(root)
+    current = owner_root
     for part in declared.parts:
-        try:
-            exact = next((child for child in current.iterdir() if child.name == part), None)
-        except OSError as exc:
-            return None, f"unable to inspect declared path {value!r}: {exc}"
-        if exact is None:
+        _inputs.probe(current)
+        names, listing_error = inventory.listings.listing(current)
+        if listing_error:
+            return None, f"unable to inspect declared path {value!r}: {listing_error}"
+        if part not in names:
             return None, f"declared path is missing or has non-canonical spelling: {value}"
-        if exact.is_symlink():
+        if names[part]:
             return None, f"declared path must not traverse a symlink: {value}"
-        current = exact
-    resolved = current.resolve()
+        current = current / part
+    resolved = inventory.resolutions.resolve(current)
+    _inputs.probe(resolved)
     try:
-        resolved.relative_to(root.resolve())
+        resolved.relative_to(owner_root)
     except ValueError:
         return None, f"declared path escapes its owner root: {value}"
     if not resolved.is_file():
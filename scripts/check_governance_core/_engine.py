@@ -7,17 +7,15 @@ from typing import Callable
 
 from scripts.check_governance_core import _git_capture
 from scripts.check_governance_core._docs_checks import check_docs, check_project_docs
-from scripts.check_governance_core._documents import DocumentStore, routed_markdown_corpus
+from scripts.check_governance_core._documents import DocumentStore
 from scripts.check_governance_core._folder_architecture import check_folder_architecture
-from scripts.check_governance_core._governance_checks import (
-    GovernanceContract,
-    check_governance,
-    resolve_governance_contract,
-)
+from scripts.check_governance_core._governance_checks import GovernanceContract, check_governance
 from scripts.check_governance_core._manifest import validate_manifest
 from scripts.check_governance_core._inventory import RepositoryInventory
+from scripts.check_governance_core._plan import CheckInputs
 from scripts.check_governance_core._python_safety import check_python_safety
 from scripts.check_governance_core._repository_checks import check_repository
+from scripts.check_governance_core._routing import routed_markdown_corpus
 
 
 @dataclass(frozen=True)
@@ -27,18 +25,21 @@ class CheckContext:
     governance_rel: str
     store: DocumentStore
     inventory: RepositoryInventory
-    contract: GovernanceContract
+    contract: GovernanceContract | None
     strict_safety: bool
+    changed: frozenset[Path] | None = None
 
 
 Check = Callable[[CheckContext], tuple[list[str], list[str]]]
 
 
 def _governance(context: CheckContext) -> tuple[list[str], list[str]]:
+    assert context.contract is not None
     return check_governance(context.governance_root, context.store, context.contract), []
 
 
 def _manifest(context: CheckContext) -> tuple[list[str], list[str]]:
+    assert context.contract is not None
     _data, errors = validate_manifest(
         context.governance_root,
         context.store,
@@ -49,7 +50,13 @@ def _manifest(context: CheckContext) -> tuple[list[str], list[str]]:
 
 
 def _docs(context: CheckContext) -> tuple[list[str], list[str]]:
-    return check_docs(context.repo_root, context.governance_root, context.store, context.inventory)
+    return check_docs(
+        context.repo_root,
+        context.governance_root,
+        context.store,
+        context.inventory,
+        changed=context.changed,
+    )
 
 
 def _project_docs(context: CheckContext) -> tuple[list[str], list[str]]:
@@ -68,11 +75,12 @@ def _repository(context: CheckContext) -> tuple[list[str], list[str]]:
         context.store,
         context.inventory,
         enforce_tracked_ignored=context.repo_root == context.governance_root,
+        changed=context.changed,
     ), []
 
 
 def _folder_architecture(context: CheckContext) -> tuple[list[str], list[str]]:
-    return check_folder_architecture(context.governance_root, context.store, context.inventory)
+    return check_folder_architecture(context.governance_root, context.store, context.inventory, context.changed)
 
 
 def _python_safety(context: CheckContext) -> tuple[list[str], list[str]]:
@@ -83,27 +91,75 @@ def _python_safety(context: CheckContext) -> tuple[list[str], list[str]]:
         reviewed_popen_paths=frozenset(
             {Path(inspect.getfile(_git_capture)).resolve()}
         ),
+        changed=context.changed,
+    )
+
+
+def _governance_inputs(repo_root: Path, governance_root: Path) -> CheckInputs:
+    return CheckInputs(documents=(governance_root / "AGENTS.md",), contract=True, watches=(governance_root,))
+
+
+def _manifest_inputs(repo_root: Path, governance_root: Path) -> CheckInputs:
+    return CheckInputs(
+        documents=(governance_root / "agents-manifest.yaml",),
+        contract=True,
+        watches=(governance_root,),
+    )
+
+
+def _docs_inputs(repo_root: Path, governance_root: Path) -> CheckInputs:
+    return CheckInputs(trees=(repo_root / "docs",), families=((repo_root / "docs", ".md"),))
+
+
+def _project_docs_inputs(repo_root: Path, governance_root: Path) -> CheckInputs:
+    return CheckInputs(
+        trees=(repo_root / "docs",),
+        families=((repo_root / "docs", ".md"),),
+        documents=(governance_root / "AGENTS.md", repo_root / "README.md"),
     )
 
 
-CHECK_REGISTRY: tuple[tuple[str, Check], ...] = (
-    ("governance", _governance),
-    ("manifest", _manifest),
-    ("docs", _docs),
-    ("project_docs", _project_docs),
-    ("repository", _repository),
-    ("folder_architecture", _folder_architecture),
-    ("python_safety", _python_safety),
+def _repository_inputs(repo_root: Path, governance_root: Path) -> CheckInputs:
+    return CheckInputs(
+        families=((repo_root / "docs", ".md"),),
+        tracked_ignored=(repo_root,) if repo_root == governance_root else (),
+        watches=(repo_root,),
+    )
+
+
+def _folder_architecture_inputs(repo_root: Path, governance_root: Path) -> CheckInputs:
+    return CheckInputs(trees=(governance_root,), families=((governance_root, ".py"),))
+
+
+def _python_safety_inputs(repo_root: Path, governance_root: Path) -> CheckInputs:
+    return CheckInputs(families=((repo_root, ".py"),))
+
+
+@dataclass(frozen=True)
+class CheckSpec:
+    check_id: str
+    run: Check
+    inputs: Callable[[Path, Path], CheckInputs]
+    modes: tuple[str, ...] = ("full",)
+
+
+CHECK_REGISTRY: tuple[CheckSpec, ...] = (
+    CheckSpec("governance", _governance, _governance_inputs),
+    CheckSpec("manifest", _manifest, _manifest_inputs),
+    CheckSpec("docs", _docs, _docs_inputs, ("full", "docs")),
+    CheckSpec("project_docs", _project_docs, _project_docs_inputs, ("full", "project_docs")),
+    CheckSpec("repository", _repository, _repository_inputs),
+    CheckSpec("folder_architecture", _folder_architecture, _folder_architecture_inputs),
+    CheckSpec("python_safety", _python_safety, _python_safety_inputs),
 )
 
 MODE_CHECKS = {
-    "full": tuple(check_id for check_id, _check in CHECK_REGISTRY),
-    "docs": ("docs",),
-    "project_docs": ("project_docs",),
+    mode: tuple(spec.check_id for spec in CHECK_REGISTRY if mode in spec.modes)
+    for mode in dict.fromkeys(mode for spec in CHECK_REGISTRY for mode in spec.modes)
 }
 
 
-def _resolve_roots(request: dict[str, object]) -> tuple[Path, Path, str, RepositoryInventory]:
+def resolve_roots(request: dict[str, object]) -> tuple[Path, Path, str, RepositoryInventory]:
     script_root = Path(__file__).resolve().parent
     governance_value = request.get("governance_root")
     repo_value = request.get("repo_root")
@@ -111,7 +167,12 @@ def _resolve_roots(request: dict[str, object]) -> tuple[Path, Path, str, Reposit
     repo_request = Path(str(repo_value)).expanduser() if repo_value else governance_request
     if repo_value is None and governance_request.name == ".governance":
         raise ValueError("repo_root is required for a vendored .governance checkout")
-    inventory = RepositoryInventory(repo_request)
+    inventory = RepositoryInventory(
+        repo_request,
+        scan_workers=int(request.get("scan_workers", 1)),
+        source=str(request.get("inventory_source", "walk")),
+        prune_ignored=bool(request.get("prune_ignored", False)),
+    )
     if inventory.root_error:
         raise ValueError(inventory.root_error)
     assert inventory.repository_root is not None
@@ -124,71 +185,11 @@ def _resolve_roots(request: dict[str, object]) -> tuple[Path, Path, str, Reposit
     return repo_root, governance_root, "" if relative in {"", "."} else relative, inventory
 
 
-def execute(request: dict[str, object]) -> dict[str, object]:
-    mode = request.get("mode", "full")
-    if mode not in MODE_CHECKS:
-        raise ValueError(f"mode must be one of {', '.join(MODE_CHECKS)}")
-    if request.get("fail_on_safety_warnings") and mode != "full":
-        raise ValueError("fail_on_safety_warnings is valid only in full mode")
-    repo_root, governance_root, governance_rel, inventory = _resolve_roots(request)
-    store = DocumentStore()
-    inventory.tree_entries(repo_root if mode == "full" else repo_root / "docs")
-    contract = resolve_governance_contract(governance_root, store, inventory)
-    context = CheckContext(
-        repo_root=repo_root,
-        governance_root=governance_root,
-        governance_rel=governance_rel,
-        store=store,
-        inventory=inventory,
-        contract=contract,
-        strict_safety=bool(request.get("fail_on_safety_warnings", False)),
-    )
-    selected = set(MODE_CHECKS[str(mode)])
-    records: list[dict[str, object]] = []
-    all_errors: list[str] = []
-    all_warnings: list[str] = []
-    for check_id, check in CHECK_REGISTRY:
-        if check_id not in selected:
-            continue
-        try:
-            errors, warnings = check(context)
-        except Exception as exc:
-            errors = [f"{check_id} check failed unexpectedly: {type(exc).__name__}: {exc}"]
-            warnings = []
-        records.append(
-            {
-                "id": check_id,
-                "status": "FAILED" if errors else "PASSED",
-                "errors": errors,
-                "warnings": warnings,
-            }
-        )
-        all_errors.extend(errors)
-        all_warnings.extend(warnings)
-    planned = [check_id for check_id, _check in CHECK_REGISTRY if check_id in selected]
-    failed = [str(record["id"]) for record in records if record["status"] == "FAILED"]
-    executed = [str(record["id"]) for record in records if record["status"] == "PASSED"]
-    return {
-        "api_version": 1,
-        "status": "FAILED" if all_errors else "PASSED",
-        "repo_root": str(repo_root),
-        "governance_root": str(governance_root),
-        "checks": records,
-        "planned": planned,
-        "eligible": planned,
-        "executed": executed,
-        "skipped": [],
-        "failed": failed,
-        "errors": all_errors,
-        "warnings": all_warnings,
-    }
-
-
 def resolve_documents_request(request: dict[str, object]) -> dict[str, object]:
     """Resolve the complete canonical governance-document router topology."""
 
-    _repo_root, governance_root, _governance_rel, inventory = _resolve_roots(request)
-    store = DocumentStore()
+    _repo_root, governance_root, _governance_rel, inventory = resolve_roots(request)
+    store = DocumentStore(resolutions=inventory.resolutions)
     agents_path, agents_validation_error = inventory.validate_file(governance_root / "AGENTS.md")
     if agents_validation_error:
         return {"api_version": 1, "status": "FAILED", "documents": [], "errors": [agents_validation_error]}
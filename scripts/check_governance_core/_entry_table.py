@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import overload
+
+
+DIRECTORY = 1
+ALIAS = 2
+
+Row = tuple[str, int, int, int, int]
+"""``(relative, flags, size, mtime_ns, inode)``: a root-relative ``/`` path and its metadata."""
+
+_NAME = "\0"
+_PART = "\1"
+_AFTER_SUBTREE = "\2"
+
+
+@dataclass(frozen=True)
+class InventoryEntry:
+    path: Path
+    is_directory: bool
+    is_symlink: bool
+    size: int
+    mtime_ns: int = 0
+    inode: int = 0
+
+
+def relative_key(relative: str) -> str:
+    """Sort key of a ``/``-separated relative path; keys of one subtree share a prefix.
+
+    Each part sorts by its case-folded name, then its exact name, like a directory listing; the
+    separators sort below every name character, so a parent precedes its subtree and sorting a
+    snapshot by these keys yields a depth-first preorder with every subtree contiguous.
+    """
+
+    return _PART.join(f"{part.casefold()}{_NAME}{part}" for part in relative.split("/"))
+
+
+def suffix_of(relative: str) -> str:
+    """Return the lower-cased ``Path.suffix`` of ``relative``'s last part without building a Path."""
+
+    name = relative[relative.rfind("/") + 1 :]
+    dot = name.rfind(".")
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+
+
+class _Columns:
+    __slots__ = ("relatives", "flags", "sizes", "mtimes", "inodes")
+
+    def __init__(self) -> None:
+        self.relatives: list[str] = []
+        self.flags = bytearray()
+        self.sizes = array("q")
+        self.mtimes = array("q")
+        self.inodes = array("Q")
+
+
+class EntryTable(Sequence[InventoryEntry]):
+    """One tree snapshot stored by column, in ``relative_key`` order.
+
+    Each row keeps its root-relative ``/`` path as one string, its flags as one byte, and its
+    size and directory stamp in ``array`` columns; ``InventoryEntry`` objects and their ``Path``
+    are built only when an item is read. Slices and subtrees are views over the same columns,
+    re-rooted at the subtree, so serving a descendant root copies nothing.
+    """
+
+    __slots__ = ("root", "_columns", "_start", "_stop", "_prefix")
+
+    def __init__(self, root: Path, columns: _Columns, start: int, stop: int, prefix: str) -> None:
+        self.root = root
+        self._columns = columns
+        self._start = start
+        self._stop = stop
+        self._prefix = prefix
+
+    @classmethod
+    def from_rows(cls, root: Path, rows: Iterable[Row]) -> EntryTable:
+        """Build a table from ``(relative, flags, size, mtime_ns, inode)`` rows already in key order."""
+
+        columns = _Columns()
+        for relative, flags, size, mtime_ns, inode in rows:
+            columns.relatives.append(relative)
+            columns.flags.append(flags)
+            columns.sizes.append(size)
+            columns.mtimes.append(mtime_ns)
+            columns.inodes.append(inode)
+        return cls(root, columns, 0, len(columns.relatives), "")
+
+    @classmethod
+    def joined(cls, root: Path, parts: Iterable[tuple[str, EntryTable]]) -> EntryTable:
+        """Concatenate ``(prefix, table)`` parts, already in key order, copying columns slice by slice.
+
+        Each part's rows are re-rooted at ``root`` by putting ``prefix`` before their relative
+        paths, so only those strings are rebuilt row by row.
+        """
+
+        columns = _Columns()
+        for prefix, table in parts:
+            source, start, stop, strip = table._columns, table._start, table._stop, len(table._prefix)
+            if prefix or strip:
+                columns.relatives.extend(prefix + relative[strip:] for relative in source.relatives[start:stop])
+            else:
+                columns.relatives.extend(source.relatives[start:stop])
+            columns.flags += source.flags[start:stop]
+            columns.sizes += source.sizes[start:stop]
+            columns.mtimes += source.mtimes[start:stop]
+            columns.inodes += source.inodes[start:stop]
+        return cls(root, columns, 0, len(columns.relatives), "")
+
+    @classmethod
+    def empty(cls, root: Path) -> EntryTable:
+        return cls(root, _Columns(), 0, 0, "")
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> InventoryEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[InventoryEntry]: ...
+
+    def __getitem__(self, index: int | slice) -> InventoryEntry | Sequence[InventoryEntry]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return tuple(self[position] for position in range(start, stop, step))
+            stop = max(start, stop)
+            return EntryTable(self.root, self._columns, self._start + start, self._start + stop, self._prefix)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("entry table index out of range")
+        return self._entry(self._start + index)
+
+    def __iter__(self) -> Iterator[InventoryEntry]:
+        return map(self._entry, range(self._start, self._stop))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EntryTable):
+            return self.root == other.root and len(self) == len(other) and all(
+                left == right for left, right in zip(self.rows(), other.rows())
+            )
+        if isinstance(other, tuple):
+            return len(self) == len(other) and all(left == right for left, right in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"EntryTable({str(self.root)!r}, {len(self)} entries)"
+
+    def _entry(self, position: int) -> InventoryEntry:
+        columns = self._columns
+        flags = columns.flags[position]
+        return InventoryEntry(
+            self.root / columns.relatives[position][len(self._prefix) :],
+            bool(flags & DIRECTORY),
+            bool(flags & ALIAS),
+            columns.sizes[position],
+            columns.mtimes[position],
+            columns.inodes[position],
+        )
+
+    def rows(self) -> Iterator[Row]:
+        """Yield ``(relative, flags, size, mtime_ns, inode)`` with paths relative to this table's root."""
+
+        columns = self._columns
+        strip = len(self._prefix)
+        for position in range(self._start, self._stop):
+            yield (
+                columns.relatives[position][strip:],
+                columns.flags[position],
+                columns.sizes[position],
+                columns.mtimes[position],
+                columns.inodes[position],
+            )
+
+    def listings(self) -> dict[str, array[int]]:
+        """Map each directory's relative path, ``""`` for the root, to its children's positions."""
+
+        listings: dict[str, array[int]] = {"": array("l")}
+        flags = self._columns.flags
+        strip = len(self._prefix)
+        for offset, relative in enumerate(self._columns.relatives[self._start : self._stop]):
+            relative = relative[strip:]
+            listings[relative[: max(relative.rfind("/"), 0)]].append(offset)
+            if flags[self._start + offset] & DIRECTORY:
+                listings[relative] = array("l")
+        return listings
+
+    def position(self, relative: str) -> int | None:
+        """Return the position of the row at ``relative``, bisecting over the shared columns."""
+
+        full = self._prefix + relative
+        index = bisect_left(
+            self._columns.relatives, relative_key(full), self._start, self._stop, key=relative_key
+        )
+        if index < self._stop and self._columns.relatives[index] == full:
+            return index - self._start
+        return None
+
+    def subtree(self, relative: str) -> EntryTable:
+        """Return every row below ``relative`` as a view re-rooted there; empty when nothing is."""
+
+        full = self._prefix + relative
+        key = relative_key(full)
+        relatives = self._columns.relatives
+        start = bisect_right(relatives, key, self._start, self._stop, key=relative_key)
+        stop = bisect_left(relatives, key + _AFTER_SUBTREE, start, self._stop, key=relative_key)
+        return EntryTable(self.root / relative, self._columns, start, stop, f"{full}/")
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from typing import Iterator
+
+from scripts.check_governance_core._documents import DocumentStore
+from scripts.check_governance_core._engine import (
+    CHECK_REGISTRY,
+    MODE_CHECKS,
+    Check,
+    CheckContext,
+    CheckSpec,
+    resolve_roots,
+)
+from scripts.check_governance_core._governance_checks import GovernanceContract, resolve_governance_contract
+from scripts.check_governance_core._inputs import InputRecorder, recording
+from scripts.check_governance_core._metrics import CheckMetrics, count, measure, run_totals
+from scripts.check_governance_core._plan import load_plan, plan_inputs, resolve_changed_paths, touches
+from scripts.check_governance_core._result_cache import WarmState, open_result_cache, open_tree_snapshots
+
+
+def _run_check(
+    check_id: str,
+    check: Check,
+    context: CheckContext,
+    metrics: CheckMetrics | None,
+    recorder: InputRecorder | None,
+) -> tuple[list[str], list[str]]:
+    """Run one registered check and convert crashes into its own explicit failure."""
+
+    with measure(metrics), recording(recorder):
+        try:
+            return check(context)
+        except Exception as exc:
+            if recorder is not None:
+                recorder.cacheable = False
+            return [f"{check_id} check failed unexpectedly: {type(exc).__name__}: {exc}"], []
+
+
+def _check_record(
+    spec: CheckSpec,
+    status: str,
+    outcome: tuple[list[str], list[str]],
+    metrics: CheckMetrics | None,
+) -> dict[str, object]:
+    errors, warnings = outcome
+    record: dict[str, object] = {
+        "type": "check",
+        "id": spec.check_id,
+        "status": status,
+        "errors": errors,
+        "warnings": warnings,
+    }
+    if metrics is not None:
+        record["metrics"] = metrics.as_record()
+    return record
+
+
+def iter_execute(request: dict[str, object], warm: WarmState | None = None) -> Iterator[dict[str, object]]:
+    """Yield each check record as it completes, then one summary record.
+
+    Records arrive in completion order and are not retained, so the summary carries only the
+    run-level errors and warnings plus totals. ``warm`` carries results and documents across
+    watch-mode runs.
+    """
+
+    mode = request.get("mode", "full")
+    if mode not in MODE_CHECKS:
+        raise ValueError(f"mode must be one of {', '.join(MODE_CHECKS)}")
+    if request.get("fail_on_safety_warnings") and mode != "full":
+        raise ValueError("fail_on_safety_warnings is valid only in full mode")
+    workers = int(request.get("workers", 1))
+    if workers < 1:
+        raise ValueError("workers must be a positive integer")
+    collect_metrics = bool(request.get("metrics", False))
+    run_wall_started = time.perf_counter()
+    run_cpu_started = time.process_time()
+    recorded_ns = time.time_ns()
+    prelude = CheckMetrics() if collect_metrics else None
+    with measure(prelude):
+        repo_root, governance_root, governance_rel, inventory = resolve_roots(request)
+        cache = open_result_cache(request, governance_root, inventory, warm)
+        snapshots = open_tree_snapshots(request, inventory, warm)
+        changed = resolve_changed_paths(request, repo_root, inventory)
+    scheduled = [spec for spec in CHECK_REGISTRY if str(mode) in spec.modes]
+    skipped = {
+        index
+        for index, spec in enumerate(scheduled)
+        if changed is not None and not touches(spec.inputs(repo_root, governance_root), changed)
+    }
+    check_metrics = [CheckMetrics() if collect_metrics else None for _scheduled in scheduled]
+    statuses: dict[int, str] = {}
+    totals = {"errors": 0, "warnings": 0}
+
+    def finish(index: int, status: str, outcome: tuple[list[str], list[str]]) -> dict[str, object]:
+        statuses[index] = status
+        totals["errors"] += len(outcome[0])
+        totals["warnings"] += len(outcome[1])
+        return _check_record(scheduled[index], status, outcome, check_metrics[index])
+
+    for index in sorted(skipped):
+        yield finish(index, "SKIPPED", ([], []))
+    if cache is not None:
+        for index, spec in enumerate(scheduled):
+            if index in skipped:
+                continue
+            with measure(check_metrics[index]):
+                replayed = cache.replay(spec.check_id)
+                count("result_cache_misses" if replayed is None else "result_cache_hits")
+            if replayed is not None:
+                yield finish(index, "FAILED" if replayed[0] else "PASSED", replayed)
+    pending = [index for index in range(len(scheduled)) if index not in statuses]
+    run_warnings: list[str] = []
+    if pending:
+        declared = {index: scheduled[index].inputs(repo_root, governance_root) for index in pending}
+        plan = plan_inputs(list(declared.values()))
+        contract_inputs = InputRecorder() if cache is not None else None
+        contract: GovernanceContract | None = None
+        with measure(prelude):
+            store = DocumentStore(warm.documents if warm is not None else None, resolutions=inventory.resolutions)
+            load_plan(plan, inventory, store)
+            if plan.contract:
+                with recording(contract_inputs):
+                    contract = resolve_governance_contract(governance_root, store, inventory)
+        context = CheckContext(
+            repo_root=repo_root,
+            governance_root=governance_root,
+            governance_rel=governance_rel,
+            store=store,
+            inventory=inventory,
+            contract=contract,
+            strict_safety=bool(request.get("fail_on_safety_warnings", False)),
+            changed=changed,
+        )
+        recorders = {index: InputRecorder() if cache is not None else None for index in pending}
+
+        def completed(index: int, outcome: tuple[list[str], list[str]]) -> dict[str, object]:
+            recorder = recorders[index]
+            if cache is not None and changed is None:
+                assert recorder is not None and contract_inputs is not None
+                if declared[index].contract:
+                    recorder.merge(contract_inputs)
+                cache.store(scheduled[index].check_id, outcome, recorder, recorded_ns)
+            return finish(index, "FAILED" if outcome[0] else "PASSED", outcome)
+
+        calls = {
+            index: (scheduled[index].check_id, scheduled[index].run, context, check_metrics[index], recorders[index])
+            for index in pending
+        }
+        if workers == 1 or len(calls) < 2:
+            for index, call in calls.items():
+                yield completed(index, _run_check(*call))
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(workers, len(calls)),
+                thread_name_prefix="governance-check",
+            ) as pool:
+                futures = {pool.submit(copy_context().run, _run_check, *call): index for index, call in calls.items()}
+                for future in as_completed(futures):
+                    yield completed(futures[future], future.result())
+        if warm is not None:
+            warm.documents = store
+        if cache is not None:
+            save_warning = cache.save()
+            if save_warning:
+                run_warnings.append(save_warning)
+    if snapshots is not None:
+        save_warning = snapshots.save()
+        if save_warning:
+            run_warnings.append(save_warning)
+    pruning = inventory.ignored.report() if inventory.ignored is not None else None
+    if pruning is not None:
+        run_warnings.append(pruning)
+    if warm is not None:
+        warm.executed = tuple(scheduled[index].check_id for index in pending)
+    summary: dict[str, object] = {
+        "type": "summary",
+        "api_version": 1,
+        "status": "FAILED" if totals["errors"] else "PASSED",
+        "repo_root": str(repo_root),
+        "governance_root": str(governance_root),
+        "planned": [spec.check_id for spec in scheduled],
+        "eligible": [spec.check_id for index, spec in enumerate(scheduled) if index not in skipped],
+        "executed": [spec.check_id for index, spec in enumerate(scheduled) if statuses[index] == "PASSED"],
+        "skipped": [scheduled[index].check_id for index in sorted(skipped)],
+        "failed": [spec.check_id for index, spec in enumerate(scheduled) if statuses[index] == "FAILED"],
+        "errors": [],
+        "warnings": run_warnings,
+        "error_count": totals["errors"],
+        "warning_count": totals["warnings"] + len(run_warnings),
+    }
+    if prelude is not None:
+        summary["metrics"] = run_totals(
+            prelude,
+            [metrics for metrics in check_metrics if metrics is not None],
+            wall_seconds=time.perf_counter() - run_wall_started,
+            cpu_seconds=time.process_time() - run_cpu_started,
+        )
+    yield summary
+
+
+def execute(request: dict[str, object], warm: WarmState | None = None) -> dict[str, object]:
+    """Run the selected checks and return every record in registry order with aggregated messages."""
+
+    order = {spec.check_id: index for index, spec in enumerate(CHECK_REGISTRY)}
+    records: list[dict[str, object]] = []
+    summary: dict[str, object] = {}
+    for item in iter_execute(request, warm):
+        kind = item.pop("type")
+        if kind == "check":
+            records.append(item)
+        else:
+            summary = item
+    records.sort(key=lambda record: order[str(record["id"])])
+    result: dict[str, object] = {
+        "api_version": summary["api_version"],
+        "status": summary["status"],
+        "repo_root": summary["repo_root"],
+        "governance_root": summary["governance_root"],
+        "checks": records,
+    }
+    for key in ("planned", "eligible", "executed", "skipped", "failed"):
+        result[key] = summary[key]
+    result["errors"] = [error for record in records for error in record["errors"]]  # type: ignore[attr-defined]
+    result["warnings"] = [
+        *(warning for record in records for warning in record["warnings"]),  # type: ignore[attr-defined]
+        *summary["warnings"],  # type: ignore[misc]
+    ]
+    if "metrics" in summary:
+        result["metrics"] = summary["metrics"]
+    return result
@@ -4,6 +4,8 @@ import re
 from pathlib import Path
 from pathlib import PurePosixPath
 
+from scripts.check_governance_core import _inputs
+from scripts.check_governance_core._directory_listings import DirectoryListings
 from scripts.check_governance_core._documents import DocumentStore
 from scripts.check_governance_core._inventory import RepositoryInventory
 
@@ -12,11 +14,16 @@ MAX_PYTHON_FILE_LINES = 400
 _PYTHON_ROOT_MARKER = re.compile(r"<!--\s*governance-core-python-root:\s*([^>]+?)\s*-->")
 
 
+def _owner_path(governance_root: Path) -> Path:
+    return governance_root / "docs/project/architecture/architecture.md"
+
+
 def _owner_declared_python_roots(
     governance_root: Path,
     store: DocumentStore,
+    listings: DirectoryListings,
 ) -> tuple[tuple[Path, ...], list[str]]:
-    owner = governance_root / "docs/project/architecture/architecture.md"
+    owner = _owner_path(governance_root)
     document, read_error = store.markdown(owner)
     if read_error:
         return (), [read_error]
@@ -53,18 +60,16 @@ def _owner_declared_python_roots(
         seen.add(key)
         candidate = governance_root
         for part in relative.parts:
-            try:
-                exact = next((child for child in candidate.iterdir() if child.name == part), None)
-            except OSError as exc:
-                errors.append(f"Unable to inspect declared governance-core Python root {value}: {exc}")
-                exact = None
+            names, listing_error = listings.listing(candidate)
+            if listing_error:
+                errors.append(f"Unable to inspect declared governance-core Python root {value}: {listing_error}")
                 break
-            if exact is None:
+            if part not in names:
                 errors.append(
                     f"Declared governance-core Python root is missing or noncanonical: {value}"
                 )
                 break
-            candidate = exact
+            candidate = candidate / part
         else:
             if not candidate.is_dir():
                 errors.append(f"Declared governance-core Python root is not a directory: {candidate}")
@@ -80,43 +85,30 @@ def check_folder_architecture(
     governance_root: Path,
     store: DocumentStore,
     inventory: RepositoryInventory,
+    changed: frozenset[Path] | None = None,
 ) -> tuple[list[str], list[str]]:
     """Validate the repository-owned Python structure without a shadow scope registry."""
 
     errors: list[str] = []
     warnings: list[str] = []
     scripts_root = governance_root / "scripts"
-    if not scripts_root.is_dir():
+    if not _inputs.is_dir(scripts_root):
         return [f"Missing scripts root: {scripts_root}"], warnings
 
-    tree, tree_error = inventory.tree_entries(governance_root)
+    _tree, tree_error = inventory.tree_entries(governance_root)
     if tree_error:
         return [tree_error], warnings
-    entries = tuple(
-        entry for entry in tree if entry.path == scripts_root or scripts_root in entry.path.parents
-    )
-    for path in (
-        entry.path
-        for entry in entries
-        if not entry.is_directory
-        and entry.path.parent == scripts_root
-        and entry.path.suffix.lower() == ".py"
-    ):
+    features = inventory.children_of(scripts_root)
+    for path in (entry.path for entry in features if not entry.is_directory and entry.path.suffix.lower() == ".py"):
         errors.append(f"Top-level Python script must move behind scripts/<feature>/<feature>_main.py: {path}")
 
-    for directory in (
-        entry.path
-        for entry in entries
-        if entry.is_directory and entry.path.parent == scripts_root
-    ):
+    for directory in (entry.path for entry in features if entry.is_directory):
         if directory.name.startswith(".") or directory.name == "__pycache__":
             continue
         direct_python = tuple(
             entry.path
-            for entry in entries
-            if not entry.is_directory
-            and entry.path.parent == directory
-            and entry.path.suffix.lower() == ".py"
+            for entry in inventory.children_of(directory)
+            if not entry.is_directory and entry.path.suffix.lower() == ".py"
         )
         if direct_python and not (directory / f"{directory.name}_main.py").is_file():
             errors.append(f"Script feature is missing its public entrypoint: scripts/{directory.name}/{directory.name}_main.py")
@@ -124,8 +116,10 @@ def check_folder_architecture(
     files, inventory_error = inventory.python_files(governance_root)
     if inventory_error:
         return [inventory_error, *errors], warnings
-    allowed_roots, policy_errors = _owner_declared_python_roots(governance_root, store)
+    allowed_roots, policy_errors = _owner_declared_python_roots(governance_root, store, inventory.listings)
     errors.extend(policy_errors)
+    if changed is not None and _owner_path(governance_root) not in changed:
+        files = tuple(path for path in files if path in changed)
     for path in files:
         if allowed_roots and not any(path == root or root in path.parents for root in allowed_roots):
             errors.append(
@@ -1,15 +1,76 @@
 from __future__ import annotations
 
+import mmap
+import os
+import selectors
 import subprocess
+import tempfile
 import threading
 import time
+from contextlib import contextmanager
+from typing import IO, Callable, Iterator
 
+from scripts.check_governance_core import _metrics
 
 MAX_STDOUT_BYTES = 16 * 1024 * 1024
 MAX_STDERR_BYTES = 64 * 1024
+MAX_SPILL_BYTES = 1024 * 1024 * 1024
+MAX_RECORD_BYTES = 64 * 1024
 READ_CHUNK_BYTES = 64 * 1024
 TIMEOUT_SECONDS = 30.0
 CLEANUP_SECONDS = 5.0
+SELECTABLE_PIPES = os.name == "posix"
+
+
+class _RecordBuffer(bytearray):
+    """Stdout buffer that keeps only the record being read and hands complete ones to ``consume``."""
+
+    def __init__(self, consume: Callable[[bytes], None]) -> None:
+        super().__init__()
+        self.consume = consume
+
+    def extend(self, chunk: bytes) -> None:
+        super().extend(chunk)
+        end = self.rfind(b"\0")
+        if end >= 0:
+            for record in self[:end].split(b"\0"):
+                self.consume(bytes(record))
+            del self[: end + 1]
+
+
+class _SpillBuffer(bytearray):
+    """Stdout buffer that moves to an unnamed temporary file once it would pass ``MAX_STDOUT_BYTES``.
+
+    Its length is the total captured, so the pipe readers apply ``MAX_SPILL_BYTES`` to both parts.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.file: IO[bytes] | None = None
+        self.spilled = 0
+
+    def __len__(self) -> int:
+        return self.spilled if self.file is not None else super().__len__()
+
+    def extend(self, chunk: bytes) -> None:
+        if self.file is None and super().__len__() + len(chunk) <= MAX_STDOUT_BYTES:
+            super().extend(chunk)
+            return
+        if self.file is None:
+            self.file = tempfile.TemporaryFile(prefix="governance-git-")
+            self.file.write(self)
+            self.spilled = super().__len__()
+            del self[:]
+        self.file.write(chunk)
+        self.spilled += len(chunk)
+
+
+def _stdout_bound(stdout: bytearray) -> tuple[str, int]:
+    if isinstance(stdout, _RecordBuffer):
+        return "stdout record", MAX_RECORD_BYTES
+    if isinstance(stdout, _SpillBuffer):
+        return "stdout", MAX_SPILL_BYTES
+    return "stdout", MAX_STDOUT_BYTES
 
 
 def _read_bounded_pipe(
@@ -38,22 +99,200 @@ def _read_bounded_pipe(
         failed.set()
 
 
+def _select_pipes(
+    process: subprocess.Popen[bytes],
+    stdout: bytearray,
+    stderr: bytearray,
+    *,
+    label: str,
+    deadline: float,
+) -> str | None:
+    """Read both pipes on this thread until EOF, then reap; return the first capture failure.
+
+    One selector waits on both pipes with the remaining time budget, so the call returns as
+    soon as the child closes them and exits, without reader threads or a polling interval.
+    """
+
+    assert process.stdout is not None
+    assert process.stderr is not None
+    timed_out = f"Unable to enumerate {label} with git ls-files: timed out after {TIMEOUT_SECONDS:g} seconds"
+    with selectors.DefaultSelector() as selector:
+        selector.register(process.stdout, selectors.EVENT_READ, (*_stdout_bound(stdout), stdout))
+        selector.register(process.stderr, selectors.EVENT_READ, ("stderr", MAX_STDERR_BYTES, stderr))
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return timed_out
+            for key, _events in selector.select(remaining):
+                pipe_name, limit, output = key.data
+                try:
+                    chunk = os.read(key.fd, min(READ_CHUNK_BYTES, max(1, limit + 1 - len(output))))
+                except OSError as exc:
+                    return f"Unable to read Git inventory {pipe_name}: {exc}"
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    continue
+                output.extend(chunk)
+                if len(output) > limit:
+                    del output[limit:]
+                    return f"Git inventory {pipe_name} exceeded {limit} bytes"
+    try:
+        process.wait(timeout=max(0.0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        return timed_out
+    return None
+
+
+def _thread_pipes(
+    process: subprocess.Popen[bytes],
+    stdout: bytearray,
+    stderr: bytearray,
+    *,
+    label: str,
+    readers: list[threading.Thread],
+    started: list[threading.Thread],
+    failures: list[str],
+) -> str | None:
+    """Drain both pipes on bounded reader threads and poll for exit; return the first failure.
+
+    This is the fallback where pipes cannot be selected. ``readers`` and ``started`` are filled
+    in place so the caller can join them, and decide which pipes are safe to close, on cleanup.
+    """
+
+    failed = threading.Event()
+    readers.extend(
+        threading.Thread(
+            target=_read_bounded_pipe,
+            kwargs={
+                "pipe": pipe,
+                "limit": limit,
+                "label": pipe_name,
+                "output": output,
+                "failure": failures,
+                "failed": failed,
+            },
+            daemon=True,
+        )
+        for pipe, (pipe_name, limit), output in (
+            (process.stdout, _stdout_bound(stdout), stdout),
+            (process.stderr, ("stderr", MAX_STDERR_BYTES), stderr),
+        )
+    )
+    for reader in readers:
+        reader.start()
+        started.append(reader)
+    deadline = time.monotonic() + TIMEOUT_SECONDS
+    while process.poll() is None and not failed.is_set():
+        if time.monotonic() >= deadline:
+            failed.set()
+            return f"Unable to enumerate {label} with git ls-files: timed out after {TIMEOUT_SECONDS:g} seconds"
+        failed.wait(0.01)
+    return failures[0] if failures else None
+
+
 def bounded_capture(
     command: list[str],
     *,
     label: str,
 ) -> tuple[bytes, bytes, int | None, str | None]:
-    """Capture one Git command within fixed memory, time, and cleanup bounds."""
+    """Capture one Git command within fixed memory, time, and cleanup bounds.
+
+    Returns stdout, stderr, the exit code, and the first capture or cleanup failure.
+    """
+
+    return _capture(command, label=label, stdout=bytearray())
+
+
+@contextmanager
+def spilled_capture(
+    command: list[str],
+    *,
+    label: str,
+) -> Iterator[tuple[bytes | mmap.mmap, bytes, int | None, str | None]]:
+    """Capture like ``bounded_capture``, but spill stdout past ``MAX_STDOUT_BYTES`` to disk.
+
+    Spilled output is capped at ``MAX_SPILL_BYTES`` and yielded as a read-only map of the
+    temporary file, so resident memory stays bounded while a huge listing is still read whole.
+    The map and the file are closed when the block exits; nothing is left on disk.
+    """
+
+    buffer = _SpillBuffer()
+    try:
+        _stdout, stderr, returncode, failure = _capture(command, label=label, stdout=buffer)
+        view: bytes | mmap.mmap = b""
+        if buffer.file is None or failure is not None:
+            view = bytes(buffer)
+        else:
+            try:
+                buffer.file.flush()
+                view = mmap.mmap(buffer.file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as exc:
+                failure = f"Unable to map spilled Git inventory stdout for {label}: {exc}"
+        try:
+            yield view, stderr, returncode, failure
+        finally:
+            if isinstance(view, mmap.mmap):
+                view.close()
+    finally:
+        if buffer.file is not None:
+            buffer.file.close()
+
+
+def iter_records(stdout: bytes | mmap.mmap) -> Iterator[bytes]:
+    """Yield the NUL-separated records of captured or spilled stdout, copying one record at a time."""
+
+    if isinstance(stdout, bytes):
+        yield from stdout.split(b"\0")
+        return
+    start = 0
+    while (end := stdout.find(b"\0", start)) >= 0:
+        yield stdout[start:end]
+        start = end + 1
+    yield stdout[start:]
+
+
+def stream_records(
+    command: list[str],
+    *,
+    label: str,
+    consume: Callable[[bytes], None],
+) -> tuple[bytes, int | None, str | None]:
+    """Run one Git command and hand each NUL-terminated stdout record to ``consume`` as it arrives.
+
+    Only the record being read is held, up to ``MAX_RECORD_BYTES``, so memory stays constant
+    however many records the command writes; the deadline and cleanup bounds match
+    ``bounded_capture``. Records handed over before a failure are not withdrawn, so consumers
+    discard what they built when one is returned. Returns stderr, the exit code, and the failure.
+    """
+
+    records = _RecordBuffer(consume)
+    _stdout, stderr, returncode, failure = _capture(command, label=label, stdout=records)
+    if records and failure is None:
+        consume(bytes(records))
+    return stderr, returncode, failure
+
+
+def _capture(
+    command: list[str],
+    *,
+    label: str,
+    stdout: bytearray,
+) -> tuple[bytes, bytes, int | None, str | None]:
+    """Run ``command`` and capture its output within the module's memory, time, and cleanup bounds.
+
+    With ``SELECTABLE_PIPES`` (POSIX) both pipes are read on the calling thread; elsewhere,
+    where pipes cannot be selected, two bounded reader threads drain them while this thread
+    polls for exit. Either way a capture failure or the deadline kills and reaps the child.
+    """
 
     process: subprocess.Popen[bytes] | None = None
-    stdout = bytearray()
     stderr = bytearray()
     capture_failures: list[str] = []
     cleanup_failures: list[str] = []
-    failed = threading.Event()
     readers: list[threading.Thread] = []
     started_readers: list[threading.Thread] = []
     primary: str | None = None
+    _metrics.count("git_invocations")
     try:
         process = subprocess.Popen(
             command,
@@ -62,47 +301,18 @@ def bounded_capture(
         )
         assert process.stdout is not None
         assert process.stderr is not None
-        readers = [
-            threading.Thread(
-                target=_read_bounded_pipe,
-                kwargs={
-                    "pipe": process.stdout,
-                    "limit": MAX_STDOUT_BYTES,
-                    "label": "stdout",
-                    "output": stdout,
-                    "failure": capture_failures,
-                    "failed": failed,
-                },
-                daemon=True,
-            ),
-            threading.Thread(
-                target=_read_bounded_pipe,
-                kwargs={
-                    "pipe": process.stderr,
-                    "limit": MAX_STDERR_BYTES,
-                    "label": "stderr",
-                    "output": stderr,
-                    "failure": capture_failures,
-                    "failed": failed,
-                },
-                daemon=True,
-            ),
-        ]
-        for reader in readers:
-            reader.start()
-            started_readers.append(reader)
-        deadline = time.monotonic() + TIMEOUT_SECONDS
-        while process.poll() is None and not failed.is_set():
-            if time.monotonic() >= deadline:
-                primary = (
-                    f"Unable to enumerate {label} with git ls-files: "
-                    f"timed out after {TIMEOUT_SECONDS:g} seconds"
-                )
-                failed.set()
-                break
-            failed.wait(0.01)
-        if capture_failures and primary is None:
-            primary = capture_failures[0]
+        if SELECTABLE_PIPES:
+            primary = _select_pipes(process, stdout, stderr, label=label, deadline=time.monotonic() + TIMEOUT_SECONDS)
+        else:
+            primary = _thread_pipes(
+                process,
+                stdout,
+                stderr,
+                label=label,
+                readers=readers,
+                started=started_readers,
+                failures=capture_failures,
+            )
     except (FileNotFoundError, OSError, RuntimeError) as exc:
         primary = f"Unable to enumerate {label} with git ls-files: {exc}"
     finally:
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from scripts.check_governance_core._git_capture import bounded_capture
+from scripts.check_governance_core._single_flight import SingleFlightCache
+
+
+REPORTED_DIRECTORIES = 5
+
+
+class IgnoredDirectories:
+    """Per-run record of the Git-ignored directories that repository walks prune.
+
+    The repository is queried once, single-flight, and every walked root skips the ignored
+    directories inside it; ``report`` then names them, so a pruned tree is never mistaken for
+    a complete one, including when every result was replayed from a cache built with pruning.
+    """
+
+    def __init__(self, repository_root: Path) -> None:
+        self.repository_root = repository_root
+        self._query: SingleFlightCache[Path, tuple[tuple[str, ...], str | None]] = SingleFlightCache("inventory")
+
+    def query(self) -> tuple[tuple[str, ...], str | None]:
+        """Return the repository's ignored directories, or why they could not be listed."""
+
+        return self._query.get(self.repository_root, lambda: ignored_directories(self.repository_root))
+
+    def excluded(self, root: Path) -> frozenset[str]:
+        """Return the ignored directories below ``root``, relative to it; none when Git cannot say."""
+
+        ignored, error = self.query()
+        if error:
+            return frozenset()
+        relative_root = root.relative_to(self.repository_root).as_posix()
+        return excluded_below(ignored, "" if relative_root == "." else relative_root)
+
+    def report(self) -> str | None:
+        """Describe this run's pruning, or None when no walk asked for it."""
+
+        return pruning_report(*self.query()) if self._query.items() else None
+
+
+def ignored_directories(root: Path) -> tuple[tuple[str, ...], str | None]:
+    """List the untracked directories Git ignores below ``root``, ``/``-separated and sorted.
+
+    One bounded ``git ls-files --others --ignored --exclude-standard --directory`` call reports a
+    directory whole only when nothing in it is tracked or unignored, so pruning these directories
+    never hides a tracked or unignored file.
+    """
+
+    if not (root / ".git").exists():
+        return (), f"Git-ignored pruning requires a Git worktree: {root}"
+    stdout, stderr, returncode, failure = bounded_capture(
+        ["git", "-C", str(root), "ls-files", "-z", "--others", "--ignored", "--exclude-standard", "--directory"],
+        label="ignored directories",
+    )
+    if failure is None and returncode:
+        detail = stderr[:1000].decode("utf-8", errors="replace")
+        failure = f"Unable to enumerate ignored directories with git ls-files: {detail}"
+    if failure is not None:
+        return (), failure
+    directories = (
+        raw.decode("utf-8", errors="surrogateescape")[:-1] for raw in stdout.split(b"\0") if raw.endswith(b"/")
+    )
+    return tuple(sorted(directories, key=lambda value: (value.casefold(), value))), None
+
+
+def excluded_below(ignored: tuple[str, ...], relative_root: str) -> frozenset[str]:
+    """Return the ``ignored`` directories inside ``relative_root``, relative to it; ``""`` is the top."""
+
+    if not relative_root:
+        return frozenset(ignored)
+    prefix = f"{relative_root}/"
+    return frozenset(directory[len(prefix) :] for directory in ignored if directory.startswith(prefix))
+
+
+def pruning_report(ignored: tuple[str, ...], error: str | None) -> str:
+    """Describe what pruning did, so a pruned tree is never mistaken for a complete one."""
+
+    if error:
+        return f"Git-ignored directories were not pruned from the repository tree: {error}"
+    shown = ", ".join(f"{directory}/" for directory in ignored[:REPORTED_DIRECTORIES])
+    more = f" and {len(ignored) - REPORTED_DIRECTORIES} more" if len(ignored) > REPORTED_DIRECTORIES else ""
+    return f"Repository tree walks pruned {len(ignored)} Git-ignored directories: {shown or 'none'}{more}"
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import stat
+from pathlib import Path
+
+from scripts.check_governance_core._git_capture import iter_records, spilled_capture
+from scripts.check_governance_core._entry_table import DIRECTORY, Row, relative_key, suffix_of
+from scripts.check_governance_core._metrics import count
+from scripts.check_governance_core._tree_walk import has_reparse_attribute, restat_row
+
+
+_REGULAR_MODES = frozenset({b"100644", b"100755"})
+_ASSUME_UNCHANGED = 0x8000
+_SKIP_WORKTREE = 0x4000_0000
+_INDEX_RECORD = re.compile(
+    rb"(\d{6}) [0-9a-f]+ (\d)\t([^\0]+)\0(?:  (?!size: )[^\n]*\n)*  size: (\d+)\tflags: ([0-9a-f]+)\n"
+)
+
+
+def worktree_is_clean(root: Path) -> bool:
+    """Return True when Git reports no untracked files and no worktree changes against the index.
+
+    ``--no-optional-locks`` keeps ``git status`` from refreshing the index file as a side effect.
+    """
+
+    with spilled_capture(
+        [
+            "git",
+            "-C",
+            str(root),
+            "--no-optional-locks",
+            "status",
+            "--porcelain",
+            "-z",
+            "--untracked-files=all",
+            "--no-renames",
+        ],
+        label="worktree status",
+    ) as (stdout, _stderr, returncode, failure):
+        if failure is not None or returncode:
+            return False
+        return all(record[:2] != b"??" and record[1:2] == b" " for record in iter_records(stdout) if record)
+
+
+def index_entries(
+    root: Path,
+    *,
+    max_entries: int,
+    refreshed_suffixes: frozenset[str],
+) -> list[Row] | None:
+    """Build ``root``'s tree rows from the Git index when the worktree matches it exactly.
+
+    Rows come back in ``relative_key`` order, as a walk returns them. Ignored files are absent,
+    and directories are implied by tracked paths, so empty ones are too. Each directory is
+    stat'ed for the mtime and inode a walk records, so views built from these rows can be
+    revalidated by stat; files in ``refreshed_suffixes`` are stat'ed for size and alias status as
+    a walk would. None means the index cannot stand in for a walk: no worktree, a dirty tree, a
+    symlink, gitlink, conflicted, assume-unchanged, or skip-worktree entry, a directory that is no
+    longer a plain directory, too many entries, or unreadable output.
+    """
+
+    if not (root / ".git").exists() or not worktree_is_clean(root):
+        return None
+    with spilled_capture(
+        ["git", "-C", str(root), "ls-files", "-z", "-s", "--debug"],
+        label="index entries",
+    ) as (stdout, _stderr, returncode, failure):
+        files = None if failure is not None or returncode else _parse_index(stdout, max_entries=max_entries)
+    if files is None:
+        return None
+    directories: set[str] = set()
+    for relative, _size in files:
+        parent, _separator, _name = relative.rpartition("/")
+        while parent and parent not in directories:
+            directories.add(parent)
+            parent, _separator, _name = parent.rpartition("/")
+    if len(files) + len(directories) > max_entries:
+        return None
+    collected: list[Row] = []
+    count("tree_stat_calls", len(directories))
+    for relative in directories:
+        try:
+            metadata = os.stat(os.path.join(root, relative), follow_symlinks=False)
+        except OSError:
+            return None
+        if not stat.S_ISDIR(metadata.st_mode) or has_reparse_attribute(metadata):
+            return None
+        collected.append((relative, DIRECTORY, 0, metadata.st_mtime_ns, metadata.st_ino))
+    for relative, size in files:
+        row: Row | None = (relative, 0, size, 0, 0)
+        if suffix_of(relative) in refreshed_suffixes:
+            row = restat_row(root, row)
+        if row is None:
+            return None
+        collected.append(row)
+    collected.sort(key=lambda row: relative_key(row[0]))
+    return collected
+
+
+def _parse_index(stdout: bytes | mmap.mmap, *, max_entries: int | None = None) -> list[tuple[str, int]] | None:
+    """Parse ``ls-files -z -s --debug`` records; any unexpected byte rejects the whole listing.
+
+    Parsing stops at the first file past ``max_entries``, so an oversized index is rejected
+    without decoding the rest of a spilled listing.
+    """
+
+    files: list[tuple[str, int]] = []
+    expected = 0
+    for record in _INDEX_RECORD.finditer(stdout):
+        if record.start() != expected or (max_entries is not None and len(files) >= max_entries):
+            return None
+        expected = record.end()
+        mode, stage, path, size, flags = record.groups()
+        if mode not in _REGULAR_MODES or stage != b"0" or int(flags, 16) & (_ASSUME_UNCHANGED | _SKIP_WORKTREE):
+            return None
+        files.append((path.decode("utf-8", errors="surrogateescape"), int(size)))
+    return files if expected == len(stdout) else None
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Callable
+
+from scripts.check_governance_core._git_capture import bounded_capture, stream_records
+
+
+def _exit_failure(stderr: bytes, returncode: int | None, label: str, command: str) -> str | None:
+    if not returncode:
+        return None
+    return f"Unable to enumerate {label} with {command}: {stderr[:1000].decode('utf-8', errors='replace')}"
+
+
+def git_paths(
+    root: Path,
+    arguments: list[str],
+    label: str,
+    *,
+    command: str = "git ls-files",
+) -> tuple[tuple[str, ...], str | None]:
+    """Return the NUL-delimited paths one bounded Git command prints, casefold-sorted.
+
+    The whole result stays resident, so the listing is held to ``MAX_STDOUT_BYTES`` and is not
+    spilled; listings that can outgrow it are read with ``stream_paths`` instead.
+    """
+
+    stdout, stderr, returncode, failure = bounded_capture(["git", "-C", str(root), *arguments], label=label)
+    failure = failure or _exit_failure(stderr, returncode, label, command)
+    if failure is not None:
+        return (), failure
+    paths = tuple(
+        sorted(
+            (raw.decode("utf-8", errors="surrogateescape") for raw in stdout.split(b"\0") if raw),
+            key=lambda value: (value.casefold(), value),
+        )
+    )
+    return paths, None
+
+
+def stream_paths(
+    root: Path,
+    arguments: list[str],
+    label: str,
+    consume: Callable[[str], None],
+    *,
+    command: str = "git ls-files",
+) -> tuple[str, str | None]:
+    """Hand each path one Git command prints to ``consume`` in Git's order, holding none of them.
+
+    Returns a digest of the stream and its failure; the digest changes with any path, its
+    order, or the failure, so a recorded run can be validated by streaming the query again.
+    """
+
+    digest = hashlib.sha256()
+
+    def record(raw: bytes) -> None:
+        if raw:
+            digest.update(raw + b"\0")
+            consume(raw.decode("utf-8", errors="surrogateescape"))
+
+    stderr, returncode, failure = stream_records(["git", "-C", str(root), *arguments], label=label, consume=record)
+    failure = failure or _exit_failure(stderr, returncode, label, command)
+    if failure is not None:
+        digest.update(b"\1" + failure.encode("utf-8", errors="surrogateescape"))
+    return digest.hexdigest(), failure
@@ -5,6 +5,7 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from scripts.check_governance_core import _inputs
 from scripts.check_governance_core._documents import DocumentStore, resolve_declared_file
 from scripts.check_governance_core._inventory import RepositoryInventory
 
@@ -91,7 +92,7 @@ def resolve_governance_contract(
         if key in seen:
             errors.append(f"AGENTS.md root-authority block contains duplicate path: {value}")
         seen.add(key)
-        _candidate, path_error = resolve_declared_file(governance_root, value)
+        _candidate, path_error = resolve_declared_file(governance_root, value, inventory)
         if path_error:
             errors.append(f"AGENTS.md root authority {path_error}")
             continue
@@ -105,6 +106,6 @@ def resolve_governance_contract(
 def check_governance(governance_root: Path, store: DocumentStore, contract: GovernanceContract) -> list[str]:
     errors = list(contract.errors)
     for required in ("agents-manifest.yaml", "docs/agents/agents_index.md"):
-        if not (governance_root / required).is_file():
+        if not _inputs.is_file(governance_root / required):
             errors.append(f"Missing governance authority surface: {required}")
     return errors
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+from scripts.check_governance_core._entry_table import ALIAS, DIRECTORY, suffix_of
+
+if TYPE_CHECKING:
+    from scripts.check_governance_core._inventory import RepositoryInventory
+
+
+FileStamp = tuple[int, int, str]
+
+# Size and mtime prove nothing about files modified this close to when they were observed.
+RACY_NANOSECONDS = 2_000_000_000
+
+
+class InputRecorder:
+    """Collect the repository inputs one check consumed so its result can be replayed later."""
+
+    def __init__(self) -> None:
+        self.files: dict[Path, FileStamp] = {}
+        self.probes: dict[tuple[Path, bool], list[object] | None] = {}
+        self.views: dict[tuple[Path, str | None], RepositoryInventory] = {}
+        self.git: dict[tuple[Path, str], str] = {}
+        self.cacheable = True
+
+    def merge(self, other: InputRecorder) -> None:
+        for path, stamp in other.files.items():
+            self.files.setdefault(path, stamp)
+        for key, signature in other.probes.items():
+            self.probes.setdefault(key, signature)
+        for key, inventory in other.views.items():
+            self.views.setdefault(key, inventory)
+        for key, digest in other.git.items():
+            self.git.setdefault(key, digest)
+        self.cacheable = self.cacheable and other.cacheable
+
+
+_ACTIVE: ContextVar[InputRecorder | None] = ContextVar("governance_check_inputs", default=None)
+
+
+@contextmanager
+def recording(recorder: InputRecorder | None) -> Iterator[None]:
+    if recorder is None:
+        yield
+        return
+    token = _ACTIVE.set(recorder)
+    try:
+        yield
+    finally:
+        _ACTIVE.reset(token)
+
+
+def file_stamp(metadata: os.stat_result, raw: bytes) -> FileStamp:
+    """Stamp file bytes with the metadata observed before they were read."""
+
+    return metadata.st_size, metadata.st_mtime_ns, hashlib.sha256(raw).hexdigest()
+
+
+def file_consumed(path: Path, stamp: FileStamp | None) -> None:
+    active = _ACTIVE.get()
+    if active is None:
+        return
+    if stamp is None:
+        probe(path)
+    else:
+        active.files.setdefault(path, stamp)
+
+
+def signature(path: Path, *, follow_symlinks: bool = True) -> list[object] | None:
+    """Describe what existence, type, and identity probes observe, ignoring file content."""
+
+    try:
+        metadata = os.stat(path, follow_symlinks=follow_symlinks)
+    except OSError:
+        return None
+    mode = metadata.st_mode
+    if stat.S_ISDIR(mode):
+        kind = "dir"
+    elif stat.S_ISREG(mode):
+        kind = "file"
+    else:
+        kind = "link" if stat.S_ISLNK(mode) else "other"
+    return [kind, metadata.st_ino, metadata.st_nlink, metadata.st_mtime_ns if kind == "dir" else 0]
+
+
+def probe(path: Path, *, follow_symlinks: bool = True) -> list[object] | None:
+    """Observe ``path`` once and record that observation for the active check."""
+
+    observed = signature(path, follow_symlinks=follow_symlinks)
+    active = _ACTIVE.get()
+    if active is not None:
+        active.probes.setdefault((path, follow_symlinks), observed)
+    return observed
+
+
+def is_file(path: Path) -> bool:
+    if _ACTIVE.get() is None:
+        return path.is_file()
+    observed = probe(path)
+    return observed is not None and observed[0] == "file"
+
+
+def is_dir(path: Path) -> bool:
+    if _ACTIVE.get() is None:
+        return path.is_dir()
+    observed = probe(path)
+    return observed is not None and observed[0] == "dir"
+
+
+def view_consumed(inventory: RepositoryInventory, root: Path, suffix: str | None) -> None:
+    active = _ACTIVE.get()
+    if active is not None:
+        active.views.setdefault((root, suffix), inventory)
+
+
+def git_consumed(root: Path, query: str, result: tuple[tuple[str, ...], str | None]) -> None:
+    active = _ACTIVE.get()
+    if active is not None:
+        active.git.setdefault((root, query), result_digest(result))
+
+
+def git_streamed(root: Path, query: str, digest: str) -> None:
+    active = _ACTIVE.get()
+    if active is not None:
+        active.git.setdefault((root, query), digest)
+
+
+def result_digest(value: object) -> str:
+    return hashlib.sha256(repr(value).encode("utf-8", errors="surrogateescape")).hexdigest()
+
+
+def view_fingerprint(
+    inventory: RepositoryInventory,
+    root: Path,
+    suffix: str | None,
+) -> tuple[str, list[list[object]], list[list[object]]]:
+    """Return a view digest plus the directory stamps and file metadata that guard it."""
+
+    entries, error = inventory.tree_entries(root)
+    rows = list(entries.rows())
+    if suffix is None:
+        visible: object = (tuple((relative, flags, size) for relative, flags, size, _mtime, _inode in rows), error)
+        guarded = [row for row in rows if not row[1] & DIRECTORY]
+    else:
+        visible = inventory.python_files(root) if suffix == ".py" else inventory.markdown_files(root)
+        guarded = [row for row in rows if not row[1] & DIRECTORY and suffix_of(row[0]) == suffix]
+    root_stamp = inventory.tree_stamp(root)
+    stamps: list[list[object]] = []
+    if error is None and root_stamp is not None:
+        stamps.append(["", root_stamp])
+        stamps.extend([relative, mtime_ns] for relative, flags, _size, mtime_ns, _inode in rows if flags & DIRECTORY)
+    files = [[relative, size, bool(flags & ALIAS)] for relative, flags, size, _mtime, _inode in guarded]
+    return result_digest(visible), stamps, files
+
+
+def describe(recorder: InputRecorder) -> list[list[object]]:
+    """Serialize recorded inputs; call outside ``recording`` so describing records nothing."""
+
+    items: list[list[object]] = []
+    for path, (size, mtime_ns, digest) in recorder.files.items():
+        items.append(["file", str(path), size, mtime_ns, digest])
+    for (path, follow_symlinks), observed in recorder.probes.items():
+        items.append(["probe", str(path), follow_symlinks, observed])
+    for (root, suffix), inventory in recorder.views.items():
+        digest, stamps, files = view_fingerprint(inventory, root, suffix)
+        items.append(["view", str(root), suffix, digest, stamps, files])
+    for (root, query), digest in recorder.git.items():
+        items.append(["git", str(root), query, digest])
+    return items
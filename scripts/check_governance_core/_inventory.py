@@ -3,69 +3,134 @@ from __future__ import annotations
 import os
 import stat
 import time
-from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable
 
-from scripts.check_governance_core._git_capture import bounded_capture
+from scripts.check_governance_core import _inputs
+from scripts.check_governance_core._directory_listings import DirectoryListings
+from scripts.check_governance_core._entry_table import ALIAS, DIRECTORY, EntryTable, InventoryEntry, Row, suffix_of
+from scripts.check_governance_core._git_ignored import IgnoredDirectories
+from scripts.check_governance_core._git_index import index_entries
+from scripts.check_governance_core._git_records import git_paths, stream_paths
+from scripts.check_governance_core._metrics import count
+from scripts.check_governance_core._path_resolution import PathResolutions
+from scripts.check_governance_core._single_flight import SingleFlightCache
+from scripts.check_governance_core._tree_index import TreeIndex
+from scripts.check_governance_core._tree_snapshot import TreeSnapshot, TreeSnapshotStore, revalidate_tree
+from scripts.check_governance_core._tree_shards import compose_shards
+from scripts.check_governance_core._tree_walk import SharedBudget, WalkLimits, scan_directory, walk_tree
+from scripts.check_governance_core._tree_walk import has_reparse_attribute as _has_reparse_attribute
+from scripts.check_governance_core._tree_walk import is_directory_alias as _is_directory_alias
 
 
-NON_CONTENT_DIRS = {".git"}
 MAX_PYTHON_FILES = 10_000
 MAX_MARKDOWN_FILES = 10_000
 MAX_VISITED_ENTRIES = 50_000
 MAX_PYTHON_BYTES = 64 * 1024 * 1024
 MAX_MARKDOWN_BYTES = 64 * 1024 * 1024
 MAX_INVENTORY_SECONDS = 5.0
+FAMILY_SUFFIXES = frozenset({".py", ".md"})
+INVENTORY_SOURCES = ("walk", "git_index")
 
-
-@dataclass(frozen=True)
-class InventoryEntry:
-    path: Path
-    is_directory: bool
-    is_symlink: bool
-    size: int
+_Paths = tuple[tuple[str, ...], str | None]
+_Files = tuple[tuple[Path, ...], str | None]
+_Tree = tuple[EntryTable, str | None]
 
 
 class RepositoryInventory:
     """Own deterministic, cached repository file enumeration for one run."""
 
-    def __init__(self, repository_root: Path) -> None:
+    def __init__(
+        self,
+        repository_root: Path,
+        *,
+        scan_workers: int = 1,
+        source: str = "walk",
+        prune_ignored: bool = False,
+    ) -> None:
+        """Validate ``repository_root`` and choose how its trees are loaded.
+
+        ``scan_workers`` above one lists each tree level's directories concurrently. The ``git_index``
+        ``source`` reads a clean worktree's tree from the Git index. With ``prune_ignored``, walks skip
+        the directories Git ignores and ``ignored`` reports what they pruned.
+        """
+
+        self.scan_workers = scan_workers
+        self.source = source
+        self.prune_ignored = prune_ignored
+        self.snapshots: TreeSnapshotStore | None = None
+        self.listings = DirectoryListings()
+        self.resolutions = PathResolutions(_is_directory_alias)
         self._requested_root = _absolute_lexical(repository_root)
         self.repository_root, self.root_error = _validate_original_directory(
             self._requested_root,
             label="repository root",
         )
-        self._tracked: dict[Path, tuple[tuple[str, ...], str | None]] = {}
-        self._tracked_ignored: dict[Path, tuple[tuple[str, ...], str | None]] = {}
-        self._trees: dict[Path, tuple[tuple[InventoryEntry, ...], str | None]] = {}
-        self._families: dict[tuple[Path, str], tuple[tuple[Path, ...], str | None]] = {}
+        self.ignored = IgnoredDirectories(self.repository_root) if prune_ignored and self.repository_root else None
+        self._tracked: SingleFlightCache[Path, _Paths] = SingleFlightCache("inventory")
+        self._tracked_ignored: SingleFlightCache[Path, _Paths] = SingleFlightCache("inventory")
+        self._trees: SingleFlightCache[Path, tuple[EntryTable, str | None]] = SingleFlightCache("inventory")
+        self._families: SingleFlightCache[tuple[Path, str], _Files] = SingleFlightCache("inventory")
+        self._indexes: SingleFlightCache[Path, TreeIndex] = SingleFlightCache()
+        self._git_index_tree: SingleFlightCache[Path, EntryTable | None] = SingleFlightCache()
+        self._stamps: SingleFlightCache[Path, int] = SingleFlightCache()
+        self._shards: SingleFlightCache[Path, EntryTable] = SingleFlightCache()
+        self._scan_roots: SingleFlightCache[Path, tuple[Path | None, str | None]] = SingleFlightCache()
 
     def tracked_paths(self, root: Path) -> tuple[tuple[str, ...], str | None]:
         root, root_error = self.resolve_scan_root(root)
         if root_error:
             return (), root_error
         assert root is not None
-        if root in self._tracked:
-            return self._tracked[root]
-        if not (root / ".git").exists():
-            result = ((), f"Repository checks require a Git worktree: {root}")
-        else:
-            result = self._git_paths(root, ["ls-files", "-z"], "tracked files")
-        self._tracked[root] = result
+
+        def load() -> tuple[tuple[str, ...], str | None]:
+            if not (root / ".git").exists():
+                return (), f"Repository checks require a Git worktree: {root}"
+            return self._git_paths(root, ["ls-files", "-z"], "tracked files")
+
+        result = self._tracked.get(root, load)
+        _inputs.git_consumed(root, "tracked", result)
         return result
 
+    def stream_tracked(self, root: Path, consume: Callable[[str], None]) -> tuple[str, str | None]:
+        """Hand each tracked path to ``consume`` in ``git ls-files`` order; return the stream digest and error.
+
+        Unlike ``tracked_paths`` nothing is buffered or cached, so memory stays constant however many
+        paths are tracked; on error, paths already handed over must be discarded.
+        """
+
+        resolved, error = self.resolve_scan_root(root)
+        if resolved is None:
+            return "", error
+        digest, error = (
+            stream_paths(resolved, ["ls-files", "-z"], "tracked files", consume)
+            if (resolved / ".git").exists()
+            else ("", f"Repository checks require a Git worktree: {resolved}")
+        )
+        _inputs.git_streamed(resolved, "tracked_stream", digest)
+        return digest, error
+
     def tracked_ignored_paths(self, root: Path) -> tuple[tuple[str, ...], str | None]:
         root, root_error = self.resolve_scan_root(root)
         if root_error:
             return (), root_error
         assert root is not None
-        if root not in self._tracked_ignored:
-            self._tracked_ignored[root] = self._git_paths(
-                root,
-                ["ls-files", "-c", "-i", "--exclude-per-directory=.gitignore", "-z"],
-                "tracked ignored files",
-            )
-        return self._tracked_ignored[root]
+        arguments = ["ls-files", "-c", "-i", "--exclude-per-directory=.gitignore", "-z"]
+        result = self._tracked_ignored.get(root, lambda: self._git_paths(root, arguments, "tracked ignored files"))
+        _inputs.git_consumed(root, "tracked_ignored", result)
+        return result
+
+    def changed_paths(self, root: Path, revision_range: str) -> tuple[tuple[str, ...], str | None]:
+        """List repository-relative paths a ``base..head`` diff adds, modifies, deletes, or renames."""
+
+        root, root_error = self.resolve_scan_root(root)
+        if root_error:
+            return (), root_error
+        assert root is not None
+        if not (root / ".git").exists():
+            return (), f"Changed-path checks require a Git worktree: {root}"
+        arguments = ["diff", "--name-only", "--no-renames", "-z", revision_range, "--"]
+        return self._git_paths(root, arguments, f"paths changed in {revision_range}", command="git diff")
 
     def validate_file(self, path: Path) -> tuple[Path | None, str | None]:
         """Validate one exactly spelled, contained, non-aliased repository file."""
@@ -75,88 +140,124 @@ class RepositoryInventory:
         if parent_error:
             return None, parent_error
         assert parent is not None
+        _inputs.probe(parent)
+        _inputs.probe(parent / requested.name, follow_symlinks=False)
+        names, listing_error = self.listings.listing(parent)
+        if listing_error:
+            return None, f"Unable to validate repository file {requested}: {listing_error}"
+        if requested.name not in names:
+            return None, f"Repository file is missing or noncanonical: {requested}"
+        exact = parent / requested.name
         try:
-            exact = next((child for child in parent.iterdir() if child.name == requested.name), None)
-            if exact is None:
-                return None, f"Repository file is missing or noncanonical: {requested}"
             metadata = exact.stat(follow_symlinks=False)
-            if exact.is_symlink() or _has_reparse_attribute(metadata) or metadata.st_nlink > 1:
+            if stat.S_ISLNK(metadata.st_mode) or _has_reparse_attribute(metadata) or metadata.st_nlink > 1:
                 return None, f"Repository file must not be an alias: {requested}"
-            if not exact.is_file():
+            if not stat.S_ISREG(metadata.st_mode):
                 return None, f"Repository path is not a file: {requested}"
-            return exact.resolve(strict=True), None
+            return self.resolutions.resolve(exact), None
         except OSError as exc:
             return None, f"Unable to validate repository file {requested}: {exc}"
 
-    def python_files(self, root: Path) -> tuple[tuple[Path, ...], str | None]:
+    def python_files(self, root: Path) -> _Files:
         return self._file_family(
-            root,
-            suffix=".py",
-            label="Python",
-            max_files=MAX_PYTHON_FILES,
-            max_bytes=MAX_PYTHON_BYTES,
+            root, suffix=".py", label="Python", max_files=MAX_PYTHON_FILES, max_bytes=MAX_PYTHON_BYTES
         )
 
-    def markdown_files(self, root: Path) -> tuple[tuple[Path, ...], str | None]:
+    def markdown_files(self, root: Path) -> _Files:
         return self._file_family(
-            root,
-            suffix=".md",
-            label="Markdown",
-            max_files=MAX_MARKDOWN_FILES,
-            max_bytes=MAX_MARKDOWN_BYTES,
+            root, suffix=".md", label="Markdown", max_files=MAX_MARKDOWN_FILES, max_bytes=MAX_MARKDOWN_BYTES
         )
 
-    def _file_family(
-        self,
-        root: Path,
-        *,
-        suffix: str,
-        label: str,
-        max_files: int,
-        max_bytes: int,
-    ) -> tuple[tuple[Path, ...], str | None]:
+    def _file_family(self, root: Path, *, suffix: str, label: str, max_files: int, max_bytes: int) -> _Files:
         root, root_error = self.resolve_scan_root(root)
         if root_error:
             return (), root_error
         assert root is not None
-        cache_key = (root, suffix)
-        if cache_key in self._families:
-            return self._families[cache_key]
+        _inputs.view_consumed(self, root, suffix)
+        self._ignored_consumed()
+        return self._families.get(
+            (root, suffix),
+            lambda: self._load_family(root, suffix=suffix, label=label, max_files=max_files, max_bytes=max_bytes),
+        )
+
+    def _load_family(self, root: Path, *, suffix: str, label: str, max_files: int, max_bytes: int) -> _Files:
         entries, tree_error = self._tree_entries(root)
         if tree_error:
-            result = ((), tree_error)
-        else:
-            files: list[Path] = []
-            total_bytes = 0
-            for entry in entries:
-                if entry.is_directory or entry.path.suffix.lower() != suffix:
-                    continue
-                if entry.is_symlink:
-                    result = ((), f"{label} inventory does not permit file symlinks or aliases: {entry.path}")
-                    break
-                files.append(entry.path)
-                total_bytes += entry.size
-                if len(files) > max_files or total_bytes > max_bytes:
-                    result = (
-                        (),
-                        f"{label} inventory exceeded its limit ({max_files} files or {max_bytes} bytes)",
-                    )
-                    break
-            else:
-                result = (tuple(files), None)
-        self._families[cache_key] = result
-        return result
+            return (), tree_error
+        files: list[Path] = []
+        total_bytes = 0
+        for relative, flags, size, _mtime_ns, _inode in entries.rows():
+            if flags & DIRECTORY or suffix_of(relative) != suffix:
+                continue
+            if flags & ALIAS:
+                return (), f"{label} inventory does not permit file symlinks or aliases: {root / relative}"
+            files.append(root / relative)
+            total_bytes += size
+            if len(files) > max_files or total_bytes > max_bytes:
+                return (), f"{label} inventory exceeded its limit ({max_files} files or {max_bytes} bytes)"
+        return tuple(files), None
 
-    def tree_entries(self, root: Path) -> tuple[tuple[InventoryEntry, ...], str | None]:
-        """Return one bounded deterministic tree snapshot, or an explicit all-or-nothing error."""
+    def tree_entries(self, root: Path) -> tuple[EntryTable, str | None]:
+        """Return one bounded deterministic tree snapshot, or an explicit all-or-nothing error.
 
+        The snapshot is an ``EntryTable``: a sequence of ``InventoryEntry`` stored by column,
+        which builds each entry only when it is read and is empty alongside an error.
+        """
+
+        requested = root
         root, root_error = self.resolve_scan_root(root)
         if root_error:
-            return (), root_error
+            return EntryTable.empty(_absolute_lexical(requested)), root_error
         assert root is not None
+        _inputs.view_consumed(self, root, None)
+        self._ignored_consumed()
         return self._tree_entries(root)
 
+    def _ignored_consumed(self) -> None:
+        if self.ignored is not None:
+            _inputs.git_consumed(self.ignored.repository_root, "ignored_directories", self.ignored.query())
+
+    def children_of(self, path: Path) -> tuple[InventoryEntry, ...]:
+        """Return ``path``'s direct children from the nearest loaded tree snapshot covering it.
+
+        Callers load that snapshot with ``tree_entries`` first; uncovered paths have no children.
+        """
+
+        index = self._covering_index(path)
+        return index.children_of(path) if index is not None else ()
+
+    def descendants_of(self, path: Path) -> EntryTable | tuple[()]:
+        """Return every entry below ``path`` in snapshot order; see ``children_of``."""
+
+        index = self._covering_index(path)
+        return index.descendants_of(path) if index is not None else ()
+
+    def _covering_index(self, path: Path) -> TreeIndex | None:
+        loaded = self._loaded_trees()
+        root = next((candidate for candidate in (path, *path.parents) if candidate in loaded), None)
+        return None if root is None else self._index(root, loaded[root])
+
+    def _loaded_trees(self) -> dict[Path, EntryTable]:
+        loaded = dict(self._shards.items())
+        loaded.update((root, entries) for root, (entries, error) in self._trees.items() if error is None)
+        return loaded
+
+    def _index(self, root: Path, entries: EntryTable) -> TreeIndex:
+        return self._indexes.get(root, lambda: TreeIndex(root, entries))
+
+    def tree_stamp(self, root: Path) -> int | None:
+        """Return the directory mtime observed before ``root``'s cached listing was taken."""
+
+        return self._stamps.completed(root)
+
     def resolve_scan_root(self, root: Path) -> tuple[Path | None, str | None]:
+        requested = _absolute_lexical(root)
+        resolved, error = self._scan_roots.get(requested, lambda: self._resolve_scan_root(requested))
+        if error:
+            _inputs.probe(requested, follow_symlinks=False)
+        return resolved, error
+
+    def _resolve_scan_root(self, root: Path) -> tuple[Path | None, str | None]:
         if self.root_error:
             return None, self.root_error
         assert self.repository_root is not None
@@ -168,11 +269,11 @@ class RepositoryInventory:
         current = self._requested_root
         for part in relative.parts:
             current /= part
-            try:
-                if _is_directory_alias(current):
-                    return None, f"Repository inventory root must not traverse a directory alias: {current}"
-            except OSError as exc:
-                return None, f"Unable to validate repository inventory root {current}: {exc}"
+            is_alias, alias_error = self.resolutions.is_directory_alias(current)
+            if alias_error:
+                return None, f"Unable to validate repository inventory root {current}: {alias_error}"
+            if is_alias:
+                return None, f"Repository inventory root must not traverse a directory alias: {current}"
         if not requested.is_dir():
             return None, f"Repository inventory root is not a directory: {requested}"
         try:
@@ -182,118 +283,102 @@ class RepositoryInventory:
             return None, f"Repository inventory root escapes the declared repository: {requested} ({exc})"
         return resolved, None
 
-    def _tree_entries(self, root: Path) -> tuple[tuple[InventoryEntry, ...], str | None]:
-        if root in self._trees:
-            return self._trees[root]
-        ancestor = next(
-            (
-                candidate
-                for candidate, (_entries, error) in self._trees.items()
-                if error is None and (candidate == root or candidate in root.parents)
-            ),
-            None,
-        )
+    def _tree_entries(self, root: Path) -> tuple[EntryTable, str | None]:
+        """Load ``root`` once per run; concurrent callers that miss it wait for that one load."""
+
+        return self._trees.get(root, lambda: self._load_tree(root))
+
+    def _load_tree(
+        self, root: Path, workers: int | None = None, started: float | None = None, budget: SharedBudget | None = None
+    ) -> _Tree:
+        """Serve ``root`` as a view over a loaded ancestor's table, from the clean Git index, or by walking it.
+
+        With ``snapshots`` set, a walk lists again only the directories whose stamp changed since the
+        stored snapshot and stores its result back. The repository root is composed from shards, whose
+        loads take the root's ``started`` time and shared entry ``budget``.
+        """
+
+        if (shard := self._shards.completed(root)) is not None:
+            return shard, None
+        indexed = self._indexed_tree() if self.source == "git_index" else None
+        if indexed is not None and root != self.repository_root:
+            self._tree_entries(self.repository_root)
+        loaded = self._loaded_trees()
+        ancestor = next((candidate for candidate in root.parents if candidate in loaded), None)
         if ancestor is not None:
-            ancestor_entries = self._trees[ancestor][0]
-            root_is_represented = ancestor == root or any(
-                entry.path == root and entry.is_directory for entry in ancestor_entries
-            )
-            if root_is_represented:
-                entries = tuple(
-                    entry
-                    for entry in ancestor_entries
-                    if root in entry.path.parents
-                )
-                result = (entries, None)
-                self._trees[root] = result
-                return result
-        started = time.monotonic()
-        visited = 0
-        collected: list[InventoryEntry] = []
-        pending = [root]
+            index = self._index(ancestor, loaded[ancestor])
+            represented = index.entry(root)
+            if represented is not None and represented.is_directory:
+                self._stamps.setdefault(root, represented.mtime_ns)
+                return loaded[ancestor].subtree(root.relative_to(ancestor).as_posix()), None
+        started_ns = time.time_ns()
+        started = time.monotonic() if started is None else started
+        count("tree_stat_calls")
         try:
-            while pending:
-                if time.monotonic() - started > MAX_INVENTORY_SECONDS:
-                    result = ((), f"Repository tree inventory exceeded {MAX_INVENTORY_SECONDS:.1f} seconds")
-                    break
-                current = pending.pop()
-                scanned: list[os.DirEntry[str]] = []
-                with os.scandir(current) as iterator:
-                    for item in iterator:
-                        visited += 1
-                        if visited > MAX_VISITED_ENTRIES:
-                            result = ((), f"Repository tree inventory exceeded {MAX_VISITED_ENTRIES} entries")
-                            break
-                        if time.monotonic() - started > MAX_INVENTORY_SECONDS:
-                            result = ((), f"Repository tree inventory exceeded {MAX_INVENTORY_SECONDS:.1f} seconds")
-                            break
-                        scanned.append(item)
-                    else:
-                        scanned.sort(key=lambda item: (item.name.casefold(), item.name))
-                        child_directories: list[Path] = []
-                        for item in scanned:
-                            candidate = current / item.name
-                            try:
-                                candidate.relative_to(root)
-                            except ValueError:
-                                result = ((), f"Repository tree path escapes root: {candidate}")
-                                break
-                            is_symlink = item.is_symlink()
-                            follows_to_directory = is_symlink and item.is_dir(follow_symlinks=True)
-                            is_directory = item.is_dir(follow_symlinks=False)
-                            if follows_to_directory or (is_directory and _is_directory_alias(candidate)):
-                                result = (
-                                    (),
-                                    f"Repository tree does not permit directory symlinks or aliases: {candidate}",
-                                )
-                                break
-                            if is_directory:
-                                if item.name in NON_CONTENT_DIRS:
-                                    continue
-                                try:
-                                    candidate.resolve().relative_to(root)
-                                except ValueError:
-                                    result = ((), f"Repository tree directory escapes root: {candidate}")
-                                    break
-                                collected.append(InventoryEntry(candidate, True, False, 0))
-                                child_directories.append(candidate)
-                                continue
-                            metadata = item.stat(follow_symlinks=False)
-                            is_alias = is_symlink or _has_reparse_attribute(metadata) or metadata.st_nlink > 1
-                            collected.append(InventoryEntry(candidate, False, is_alias, metadata.st_size))
-                        else:
-                            pending.extend(reversed(child_directories))
-                            continue
-                    break
-            else:
-                result = (tuple(collected), None)
+            metadata = os.stat(root)
         except OSError as exc:
-            result = ((), f"Unable to enumerate repository tree: {exc}")
-        self._trees[root] = result
-        return result
-
-    @staticmethod
-    def _git_paths(
-        root: Path,
-        arguments: list[str],
-        label: str,
-    ) -> tuple[tuple[str, ...], str | None]:
-        stdout, stderr, returncode, failure = bounded_capture(
-            ["git", "-C", str(root), *arguments],
-            label=label,
+            return EntryTable.empty(root), f"Unable to enumerate repository tree: {exc}"
+        self._stamps.setdefault(root, metadata.st_mtime_ns)
+        if indexed is not None and root == self.repository_root:
+            return indexed, None
+        excluded = self.ignored.excluded(root) if self.ignored is not None else frozenset()
+        limits = WalkLimits(MAX_VISITED_ENTRIES, MAX_INVENTORY_SECONDS, _is_directory_alias, excluded)
+        sharded = root == self.repository_root
+        previous = self.snapshots.get(root) if self.snapshots is not None else None
+        revalidated = None if previous is None else revalidate_tree(
+            root, previous, limits, refreshed_suffixes=FAMILY_SUFFIXES, descend=not sharded, started=started,
+            budget=budget,
         )
-        if failure is None and returncode:
-            detail = stderr[:1000].decode("utf-8", errors="replace")
-            failure = f"Unable to enumerate {label} with git ls-files: {detail}"
-        if failure is not None:
-            return (), failure
-        paths = tuple(
-            sorted(
-                (raw.decode("utf-8", errors="surrogateescape") for raw in stdout.split(b"\0") if raw),
-                key=lambda value: (value.casefold(), value),
-            )
+        rescanned = -1
+        error: str | None = None
+        if revalidated is not None:
+            rows, rescanned = revalidated
+        elif sharded:
+            rows, _children, _count, error = scan_directory(root, "", limits, started, MAX_VISITED_ENTRIES)
+        else:
+            rows, error = walk_tree(root, limits, workers=workers or self.scan_workers, started=started, budget=budget)
+        if error:
+            return EntryTable.empty(root), error
+        entries = EntryTable.from_rows(root, rows)
+        root_stamp = (metadata.st_mtime_ns, metadata.st_ino)
+        unchanged = rescanned == 0 and previous is not None and previous.entries == entries
+        if self.snapshots is not None and not unchanged:
+            self.snapshots.put(root, TreeSnapshot(started_ns, root_stamp, entries, excluded))
+        return self._compose(root, rows, limits, started) if sharded else (entries, None)
+
+    def _compose(self, root: Path, top_rows: list[Row], limits: WalkLimits, started: float) -> _Tree:
+        """Build the repository tree from shards sharing its deadline and entry budget; keep verified ones."""
+
+        shard_workers = 1 if sum(1 for row in top_rows if row[1] & DIRECTORY) > 1 else self.scan_workers
+        budget = SharedBudget(limits.max_entries - len(top_rows))
+        shards: dict[Path, tuple[EntryTable, str | None]] = {}
+
+        def load_shard(shard: Path) -> tuple[EntryTable, str | None]:
+            shards[shard] = self._trees.completed(shard) or self._load_tree(shard, shard_workers, started, budget)
+            return shards[shard]
+
+        entries, error = compose_shards(
+            root, top_rows, load_shard, self.tree_stamp, limits, started, workers=self.scan_workers
         )
-        return paths, None
+        if error:
+            for shard, (table, shard_error) in shards.items():
+                if not shard_error:
+                    self._shards.setdefault(shard, table)
+        return entries, error
+
+    def _indexed_tree(self) -> EntryTable | None:
+        """Return the repository tree as the clean Git index describes it, or None to walk instead."""
+
+        root = self.repository_root
+        assert root is not None
+
+        def load() -> EntryTable | None:
+            rows = index_entries(root, max_entries=MAX_VISITED_ENTRIES, refreshed_suffixes=FAMILY_SUFFIXES)
+            return None if rows is None else EntryTable.from_rows(root, rows)
+
+        return self._git_index_tree.get(root, load)
+
+    _git_paths = staticmethod(git_paths)
 
 
 def _absolute_lexical(path: Path) -> Path:
@@ -313,15 +398,3 @@ def _validate_original_directory(path: Path, *, label: str) -> tuple[Path | None
         return path.resolve(strict=True), None
     except OSError as exc:
         return None, f"Unable to validate {label} {path}: {exc}"
-
-
-def _is_directory_alias(path: Path) -> bool:
-    """Reject symlinks and Windows reparse-point directory aliases on Python 3.11+."""
-
-    return path.is_symlink() or _has_reparse_attribute(path.stat(follow_symlinks=False))
-
-
-def _has_reparse_attribute(metadata: os.stat_result) -> bool:
-    attributes = getattr(metadata, "st_file_attributes", 0)
-    reparse_flag = getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0x400)
-    return bool(attributes & reparse_flag)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import json
 import re
 from pathlib import Path, PurePosixPath
@@ -7,6 +8,7 @@ from typing import Any, Mapping
 
 from scripts.check_governance_core._documents import DocumentStore, resolve_declared_file
 from scripts.check_governance_core._inventory import RepositoryInventory
+from scripts.check_governance_core._parse_memo import memoized
 
 
 class ManifestSyntaxError(ValueError):
@@ -81,6 +83,12 @@ def _scalar(raw: str, line_no: int) -> Any:
 
 
 def parse_manifest(text: str) -> dict[str, Any]:
+    """Parse ``text`` into a mapping the caller owns; a batch chunk parses each distinct text once."""
+
+    return copy.deepcopy(memoized("manifest", text, _parse_manifest))
+
+
+def _parse_manifest(text: str) -> dict[str, Any]:
     raw_lines = text.splitlines()
     tokens: list[tuple[int, int, str]] = []
     index = 0
@@ -264,7 +272,7 @@ def validate_manifest(
             errors.append(f"agents-manifest.yaml: semantic_queries.{name} must be a non-empty string list")
 
     root_keys = {_canonical_path(value) for value in root_authorities}
-    root_targets = [resolve_declared_file(governance_root, value)[0] for value in root_authorities]
+    root_targets = [resolve_declared_file(governance_root, value, inventory)[0] for value in root_authorities]
     for label, values in authority_lists:
         if not isinstance(values, list) or not values:
             errors.append(f"agents-manifest.yaml: {label} must be a non-empty list")
@@ -284,7 +292,7 @@ def validate_manifest(
             seen.add(key)
             if key in root_keys:
                 errors.append(f"agents-manifest.yaml: {label} contains root-owned authority: {value}")
-            _candidate, path_error = resolve_declared_file(governance_root, value)
+            _candidate, path_error = resolve_declared_file(governance_root, value, inventory)
             if path_error:
                 errors.append(f"agents-manifest.yaml: {label} authority {path_error}")
                 continue
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Iterator, TypeVar
+
+
+COUNTERS = (
+    "files_read",
+    "bytes_read",
+    "git_invocations",
+    "document_cache_hits",
+    "document_cache_misses",
+    "inventory_cache_hits",
+    "inventory_cache_misses",
+    "tree_directories_reused",
+    "tree_directories_rescanned",
+    "tree_scandir_calls",
+    "tree_stat_calls",
+    "result_cache_hits",
+    "result_cache_misses",
+)
+
+
+class CheckMetrics:
+    """Accumulate one check's I/O counters from its thread and the pool threads it fans out to."""
+
+    def __init__(self) -> None:
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.lock = threading.Lock()
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+
+    def as_record(self) -> dict[str, object]:
+        return {
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            **self.counters,
+        }
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_ACTIVE: ContextVar[CheckMetrics | None] = ContextVar("governance_check_metrics", default=None)
+
+
+def count(counter: str, amount: int = 1) -> None:
+    """Add to the active check's counter; a no-op unless metrics were requested."""
+
+    active = _ACTIVE.get()
+    if active is not None:
+        with active.lock:
+            active.counters[counter] += amount
+
+
+def map_in_context(pool: Executor, function: Callable[[T], R], items: Iterable[T]) -> list[R]:
+    """``pool.map`` whose calls each run in a copy of the caller's context, so they count toward it."""
+
+    futures = [pool.submit(copy_context().run, function, item) for item in items]
+    return [future.result() for future in futures]
+
+
+@contextmanager
+def measure(metrics: CheckMetrics | None) -> Iterator[None]:
+    """Attribute counters, wall time, and this thread's CPU time to ``metrics``."""
+
+    if metrics is None:
+        yield
+        return
+    token = _ACTIVE.set(metrics)
+    wall_started = time.perf_counter()
+    cpu_started = time.thread_time()
+    try:
+        yield
+    finally:
+        metrics.wall_seconds += time.perf_counter() - wall_started
+        metrics.cpu_seconds += time.thread_time() - cpu_started
+        _ACTIVE.reset(token)
+
+
+def run_totals(
+    prelude: CheckMetrics,
+    checks: list[CheckMetrics],
+    *,
+    wall_seconds: float,
+    cpu_seconds: float,
+) -> dict[str, object]:
+    """Summarize one run: its own wall/process CPU time plus counters from every phase."""
+
+    counters = dict(prelude.counters)
+    for metrics in checks:
+        for counter, value in metrics.counters.items():
+            counters[counter] += value
+    return {
+        "wall_seconds": round(wall_seconds, 6),
+        "cpu_seconds": round(cpu_seconds, 6),
+        **counters,
+    }
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections.abc import Callable, Hashable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, TypeVar
+
+
+MAX_PARSE_MEMO_BYTES = 32 * 1024 * 1024
+
+T = TypeVar("T")
+
+
+class ParseMemo:
+    """Parsed values keyed by their source text, evicting the least recently used past a byte budget."""
+
+    def __init__(self, max_bytes: int = MAX_PARSE_MEMO_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.held_bytes = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._values: dict[tuple[Hashable, str], object] = {}
+
+    def get(self, kind: Hashable, text: str, parse: Callable[[str], T]) -> T:
+        key = (kind, text)
+        with self._lock:
+            if key in self._values:
+                value = self._values.pop(key)
+                self._values[key] = value
+                return value  # type: ignore[return-value]
+            self.misses += 1
+        value = parse(text)
+        size = sys.getsizeof(text)
+        if size > self.max_bytes:
+            return value
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = value
+                self.held_bytes += size
+            while self.held_bytes > self.max_bytes:
+                evicted = next(iter(self._values))
+                del self._values[evicted]
+                self.held_bytes -= sys.getsizeof(evicted[1])
+        return value
+
+
+_ACTIVE: ContextVar[ParseMemo | None] = ContextVar("governance_parse_memo", default=None)
+
+
+@contextmanager
+def parse_memo(memo: ParseMemo | None = None) -> Iterator[ParseMemo]:
+    """Share parsed documents between the runs inside this block, and drop them when it ends."""
+
+    active = memo if memo is not None else ParseMemo()
+    token = _ACTIVE.set(active)
+    try:
+        yield active
+    finally:
+        _ACTIVE.reset(token)
+
+
+def memoized(kind: Hashable, text: str, parse: Callable[[str], T]) -> T:
+    """Return ``parse(text)``, reusing an earlier result when a ``parse_memo`` block is active."""
+
+    active = _ACTIVE.get()
+    return parse(text) if active is None else active.get(kind, text, parse)
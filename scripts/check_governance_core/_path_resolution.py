@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+from typing import Callable
+
+from scripts.check_governance_core._single_flight import SingleFlightCache
+from scripts.check_governance_core._tree_walk import has_reparse_attribute, is_directory_alias
+
+
+class PathResolutions:
+    """Per-run memo of the alias probes and realpath lookups that path validation repeats.
+
+    The inventory probes every component of every scan root for aliases and the document store
+    resolves every path it is handed; sharing one instance, each distinct component is probed
+    and resolved once per run, and a path whose parent is already resolved costs one ``lstat``.
+    Nothing is revalidated, so one instance serves one run only.
+    """
+
+    def __init__(self, alias_probe: Callable[[Path], bool] = is_directory_alias) -> None:
+        self._alias_probe = alias_probe
+        self._aliases: SingleFlightCache[Path, tuple[bool, str | None]] = SingleFlightCache()
+        self._resolved: SingleFlightCache[Path, Path] = SingleFlightCache()
+
+    def is_directory_alias(self, path: Path) -> tuple[bool, str | None]:
+        """Return whether ``path`` is a directory symlink or alias, or the OS error probing it raised."""
+
+        def load() -> tuple[bool, str | None]:
+            try:
+                return self._alias_probe(path), None
+            except OSError as exc:
+                return False, str(exc)
+
+        return self._aliases.get(path, load)
+
+    def resolve(self, path: Path) -> Path:
+        """Return ``path.resolve()``, reusing the resolved parent so each component is read once."""
+
+        return self._resolved.get(path, lambda: self._resolve(path))
+
+    def _resolve(self, path: Path) -> Path:
+        if not path.is_absolute() or path.parent == path or path.name in {"", ".", ".."}:
+            return path.resolve()
+        candidate = self.resolve(path.parent) / path.name
+        try:
+            metadata = os.lstat(candidate)
+        except OSError:
+            return candidate.resolve()
+        if stat.S_ISLNK(metadata.st_mode) or has_reparse_attribute(metadata):
+            return candidate.resolve()
+        return candidate
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from scripts.check_governance_core._documents import DocumentStore
+from scripts.check_governance_core._inventory import RepositoryInventory
+
+
+@dataclass(frozen=True)
+class CheckInputs:
+    """Repository inputs one check reads, declared so the engine can load each once up front."""
+
+    trees: tuple[Path, ...] = ()
+    families: tuple[tuple[Path, str], ...] = ()
+    tracked: tuple[Path, ...] = ()
+    tracked_ignored: tuple[Path, ...] = ()
+    documents: tuple[Path, ...] = ()
+    contract: bool = False
+    watches: tuple[Path, ...] = ()
+
+
+@dataclass(frozen=True)
+class InputPlan:
+    """The deduplicated union of declared inputs, ordered so ancestors load before descendants."""
+
+    trees: tuple[Path, ...]
+    families: tuple[tuple[Path, str], ...]
+    tracked: tuple[Path, ...]
+    tracked_ignored: tuple[Path, ...]
+    documents: tuple[Path, ...]
+    contract: bool
+
+
+def _depth_first(paths: list[Path]) -> tuple[Path, ...]:
+    return tuple(sorted(dict.fromkeys(paths), key=lambda path: (len(path.parts), path.as_posix())))
+
+
+def plan_inputs(declared: list[CheckInputs]) -> InputPlan:
+    """Merge the selected checks' inputs; a tree root's family or subtree then filters its cached walk."""
+
+    return InputPlan(
+        trees=_depth_first([*(root for inputs in declared for root in inputs.trees)]),
+        families=tuple(
+            sorted(
+                dict.fromkeys(family for inputs in declared for family in inputs.families),
+                key=lambda family: (len(family[0].parts), family[0].as_posix(), family[1]),
+            )
+        ),
+        tracked=_depth_first([root for inputs in declared for root in inputs.tracked]),
+        tracked_ignored=_depth_first([root for inputs in declared for root in inputs.tracked_ignored]),
+        documents=tuple(dict.fromkeys(path for inputs in declared for path in inputs.documents)),
+        contract=any(inputs.contract for inputs in declared),
+    )
+
+
+def load_plan(plan: InputPlan, inventory: RepositoryInventory, store: DocumentStore) -> None:
+    """Warm the shared caches; errors stay cached for the checks that report them.
+
+    Tree and family roots load in one ancestor-first sequence, so a common ancestor such as
+    the repository root is walked before the subtrees that can then be served from it.
+    """
+
+    loads: list[tuple[Path, str | None]] = [*((root, None) for root in plan.trees), *plan.families]
+    for root, suffix in sorted(loads, key=lambda load: (len(load[0].parts), load[0].as_posix(), load[1] or "")):
+        if suffix is None:
+            inventory.tree_entries(root)
+        elif suffix == ".py":
+            inventory.python_files(root)
+        else:
+            inventory.markdown_files(root)
+    for root in plan.tracked:
+        inventory.tracked_paths(root)
+    for root in plan.tracked_ignored:
+        inventory.tracked_ignored_paths(root)
+    for path in plan.documents:
+        validated, error = inventory.validate_file(path)
+        if error is None and validated is not None:
+            if validated.suffix.lower() == ".md":
+                store.markdown(validated)
+            else:
+                store.read_text(validated)
+
+
+def _overlaps(path: Path, root: Path) -> bool:
+    return path == root or root in path.parents or path in root.parents
+
+
+def touches(inputs: CheckInputs, changed: frozenset[Path]) -> bool:
+    """Return whether any changed path can alter the outcome of a check with these inputs.
+
+    ``watches`` names paths a check consults without loading them up front, such as the
+    authorities its owner documents reference.
+    """
+
+    for path in changed:
+        if path in inputs.documents:
+            return True
+        if any(_overlaps(path, root) for root in (*inputs.trees, *inputs.tracked, *inputs.watches)):
+            return True
+        for root, suffix in inputs.families:
+            if _overlaps(path, root) and (path.suffix.lower() == suffix or not path.suffix):
+                return True
+    return False
+
+
+def resolve_changed_paths(
+    request: dict[str, object],
+    repo_root: Path,
+    inventory: RepositoryInventory,
+) -> frozenset[Path] | None:
+    """Return the absolute paths named by ``changed_paths`` and ``revision_range``, or None for a full run."""
+
+    values = request.get("changed_paths")
+    revision_range = request.get("revision_range")
+    if values is None and revision_range is None:
+        return None
+    relative = [str(value) for value in values or ()]  # type: ignore[union-attr]
+    if revision_range is not None:
+        diffed, diff_error = inventory.changed_paths(repo_root, str(revision_range))
+        if diff_error:
+            raise ValueError(f"revision_range could not be resolved: {diff_error}")
+        relative.extend(diffed)
+    changed: set[Path] = set()
+    for value in relative:
+        path = Path(value).expanduser()
+        absolute = Path(os.path.abspath(path if path.is_absolute() else repo_root / path))
+        if absolute != repo_root and repo_root not in absolute.parents:
+            raise ValueError(f"changed path is outside repo_root: {value}")
+        changed.add(absolute)
+    return frozenset(changed)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import ast
+import io
+import os
 import tokenize
 from dataclasses import dataclass
 from pathlib import Path
 
+from scripts.check_governance_core import _inputs, _metrics
+from scripts.check_governance_core._inputs import file_stamp
 from scripts.check_governance_core._inventory import RepositoryInventory
 
 
@@ -170,8 +174,15 @@ def _file_open(node: ast.Call) -> bool:
 
 def _scan(path: Path, reviewed_popen_paths: frozenset[Path]) -> list[SafetyIssue]:
     try:
-        with tokenize.open(path) as handle:
-            tree = ast.parse(handle.read(), filename=str(path))
+        with path.open("rb") as handle:
+            metadata = os.fstat(handle.fileno())
+            raw = handle.read()
+        _metrics.count("files_read")
+        _metrics.count("bytes_read", len(raw))
+        _inputs.file_consumed(path, file_stamp(metadata, raw))
+        encoding, _lines = tokenize.detect_encoding(io.BytesIO(raw).readline)
+        source = raw.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+        tree = ast.parse(source, filename=str(path))
     except (OSError, UnicodeDecodeError) as exc:
         return [SafetyIssue(path, 1, 1, "ERROR", "READ_FAILED", str(exc))]
     except SyntaxError as exc:
@@ -188,10 +199,13 @@ def check_python_safety(
     *,
     fail_on_warnings: bool,
     reviewed_popen_paths: frozenset[Path] = frozenset(),
+    changed: frozenset[Path] | None = None,
 ) -> tuple[list[str], list[str]]:
     files, inventory_error = inventory.python_files(root)
     if inventory_error:
         return [inventory_error], []
+    if changed is not None:
+        files = tuple(path for path in files if path in changed)
     issues = [issue for path in files for issue in _scan(path, reviewed_popen_paths)]
     issues.sort(key=lambda issue: (issue.path.as_posix().casefold(), issue.line, issue.column, issue.rule))
     errors = [issue.format(root) for issue in issues if issue.severity == "ERROR"]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from scripts.check_governance_core import _inputs
 from scripts.check_governance_core._documents import DocumentStore
 from scripts.check_governance_core._inventory import RepositoryInventory
 
@@ -19,33 +20,41 @@ def check_repository(
     inventory: RepositoryInventory,
     *,
     enforce_tracked_ignored: bool = False,
+    changed: frozenset[Path] | None = None,
 ) -> list[str]:
-    tracked, inventory_error = inventory.tracked_paths(repo_root)
-    if inventory_error:
-        return [inventory_error]
-    errors: list[str] = []
-    tracked_ignored: set[str] = set()
-    if enforce_tracked_ignored:
-        ignored, ignored_error = inventory.tracked_ignored_paths(repo_root)
-        if ignored_error:
-            return [ignored_error]
-        tracked_ignored = {value.replace("\\", "/").casefold() for value in ignored}
-    for value in tracked:
+    ignored, ignored_error = inventory.tracked_ignored_paths(repo_root) if enforce_tracked_ignored else ((), None)
+    tracked_ignored = {value.replace("\\", "/").casefold() for value in ignored}
+    selected: set[str] | None = None
+    if changed is not None and not any(path.name == ".gitignore" for path in changed):
+        selected = {path.relative_to(repo_root).as_posix().casefold() for path in changed}
+    offenders: list[tuple[str, str]] = []
+
+    def classify(value: str) -> None:
         normalized = value.replace("\\", "/")
+        if selected is not None and normalized.casefold() not in selected:
+            return
         if normalized.casefold() in tracked_ignored:
-            errors.append(f"Tracked local-only/ignored file: {value}")
+            offenders.append((value, f"Tracked local-only/ignored file: {value}"))
         elif _NOISE.search(normalized) or _BYTECODE.search(normalized):
-            errors.append(f"Tracked generated/noise file: {value}")
+            offenders.append((value, f"Tracked generated/noise file: {value}"))
         elif _SECRET.search(normalized):
-            errors.append(f"Tracked secret-like file: {value}")
+            offenders.append((value, f"Tracked secret-like file: {value}"))
+
+    _digest, inventory_error = inventory.stream_tracked(repo_root, classify)
+    if inventory_error or ignored_error:
+        return [inventory_error or ignored_error or ""]
+    offenders.sort(key=lambda offender: (offender[0].casefold(), offender[0]))
+    errors = [message for _value, message in offenders]
 
     docs_root = repo_root / "docs"
-    if docs_root.is_dir():
+    if _inputs.is_dir(docs_root):
         markdown_files, markdown_error = inventory.markdown_files(docs_root)
         if markdown_error:
             errors.append(markdown_error)
             return errors
         for path in markdown_files:
+            if changed is not None and path not in changed:
+                continue
             text, read_error = store.read_text(path)
             if read_error:
                 errors.append(read_error)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from pathlib import Path
+
+from scripts.check_governance_core._inventory import INVENTORY_SOURCES
+
+
+CHECK_REQUEST_KEYS = frozenset(
+    {
+        "repo_root",
+        "governance_root",
+        "mode",
+        "fail_on_safety_warnings",
+        "workers",
+        "scan_workers",
+        "inventory_source",
+        "prune_ignored",
+        "metrics",
+        "cache_dir",
+        "changed_paths",
+        "revision_range",
+    }
+)
+_REVISION_RANGE = re.compile(r"[^\s.-]\S*?\.\.[^\s.-]\S*")
+
+
+def validate_root_fields(request: Mapping[str, object]) -> str | None:
+    for field in ("repo_root", "governance_root"):
+        value = request.get(field)
+        if value is not None and not isinstance(value, (str, Path)):
+            return f"{field} must be a path string, Path, or null"
+        if field in request and isinstance(value, (str, Path)) and not str(value).strip():
+            return f"{field} must not be empty when provided"
+    return None
+
+
+def _validate_check_fields(request: Mapping[str, object]) -> str | None:
+    root_error = validate_root_fields(request)
+    if root_error:
+        return root_error
+    cache_dir = request.get("cache_dir")
+    if cache_dir is not None and (not isinstance(cache_dir, (str, Path)) or not str(cache_dir).strip()):
+        return "cache_dir must be a non-empty path string, Path, or null"
+    mode = request.get("mode", "full")
+    if not isinstance(mode, str):
+        return "mode must be a string"
+    strict = request.get("fail_on_safety_warnings", False)
+    if not isinstance(strict, bool):
+        return "fail_on_safety_warnings must be a boolean"
+    if not isinstance(request.get("metrics", False), bool):
+        return "metrics must be a boolean"
+    if not isinstance(request.get("prune_ignored", False), bool):
+        return "prune_ignored must be a boolean"
+    workers = request.get("workers", 1)
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        return "workers must be a positive integer"
+    scan_workers = request.get("scan_workers", 1)
+    if isinstance(scan_workers, bool) or not isinstance(scan_workers, int) or scan_workers < 1:
+        return "scan_workers must be a positive integer"
+    if request.get("inventory_source", "walk") not in INVENTORY_SOURCES:
+        return f"inventory_source must be one of {', '.join(INVENTORY_SOURCES)}"
+    changed = request.get("changed_paths")
+    if changed is not None and (
+        not isinstance(changed, (list, tuple))
+        or any(not isinstance(value, (str, Path)) or not str(value).strip() for value in changed)
+    ):
+        return "changed_paths must be a list of non-empty path strings or Paths"
+    revision_range = request.get("revision_range")
+    if revision_range is not None and (
+        not isinstance(revision_range, str) or not _REVISION_RANGE.fullmatch(revision_range)
+    ):
+        return "revision_range must be a base..head string"
+    return None
+
+
+def check_request_error(request: object) -> str | None:
+    """Return the first explicit validation error for a ``run_checks`` request, or None."""
+
+    if not isinstance(request, Mapping):
+        return "request must be a mapping"
+    unknown = sorted(str(key) for key in request if key not in CHECK_REQUEST_KEYS)
+    if unknown:
+        return f"unsupported request key(s): {', '.join(unknown)}"
+    return _validate_check_fields(request)
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import stat
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from scripts.check_governance_core import _inputs
+from scripts.check_governance_core._documents import DocumentStore
+from scripts.check_governance_core._inputs import RACY_NANOSECONDS, InputRecorder
+from scripts.check_governance_core._inventory import RepositoryInventory, _has_reparse_attribute
+from scripts.check_governance_core._tree_snapshot import TreeSnapshotStore
+
+
+CACHE_VERSION = 1
+
+
+@functools.cache
+def checker_fingerprint() -> str:
+    """Digest the checker's sources once per process so any code change invalidates every record."""
+
+    digest = hashlib.sha256(repr(sys.version_info[:2]).encode("ascii"))
+    for path in sorted(Path(__file__).resolve().parent.glob("*.py")):
+        with path.open("rb") as handle:
+            digest.update(path.name.encode("utf-8") + b"\0" + handle.read() + b"\0")
+    return digest.hexdigest()
+
+
+def validate_cache_dir(cache_dir: Path, repo_root: Path) -> Path:
+    """Keep cache files outside tracked content: outside the repository or inside its ``.git``."""
+
+    resolved = Path(os.path.abspath(os.fspath(cache_dir.expanduser())))
+    try:
+        relative = resolved.relative_to(repo_root)
+    except ValueError:
+        relative = None
+    inside_git_directory = bool(relative and relative.parts[0] == ".git" and (repo_root / ".git").is_dir())
+    if relative is not None and not inside_git_directory:
+        raise ValueError("cache_dir must be outside the repository content or inside its .git directory")
+    try:
+        resolved.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        raise ValueError(f"cache_dir is not usable: {exc}") from exc
+    return resolved
+
+
+class InputValidator:
+    """Decide whether recorded inputs still hold, trusting stat data only outside the racy window."""
+
+    def __init__(self, inventory: RepositoryInventory) -> None:
+        self._inventory = inventory
+        self._verdicts: dict[str, bool] = {}
+
+    def unchanged(self, items: list[list[object]], recorded_ns: int) -> bool:
+        racy_before = recorded_ns - RACY_NANOSECONDS
+        for item in items:
+            key = json.dumps([item, racy_before])
+            if key not in self._verdicts:
+                self._verdicts[key] = self._unchanged(item, racy_before)
+            if not self._verdicts[key]:
+                return False
+        return True
+
+    def _unchanged(self, item: list[object], racy_before: int) -> bool:
+        kind = item[0]
+        if kind == "file":
+            _kind, path, size, mtime_ns, digest = item
+            return _file_unchanged(Path(str(path)), int(size), int(mtime_ns), str(digest), racy_before)
+        if kind == "probe":
+            _kind, path, follow_symlinks, observed = item
+            if observed is not None and observed[0] == "dir" and int(observed[3]) >= racy_before:
+                return False
+            return _inputs.signature(Path(str(path)), follow_symlinks=bool(follow_symlinks)) == observed
+        if kind == "view":
+            _kind, root, suffix, digest, stamps, files = item
+            root_path = Path(str(root))
+            if _view_stat_unchanged(root_path, stamps, files, racy_before):
+                return True
+            fresh_digest, _stamps, _files = _inputs.view_fingerprint(
+                self._inventory, root_path, None if suffix is None else str(suffix)
+            )
+            return fresh_digest == digest
+        if kind == "git":
+            _kind, root, query, digest = item
+            inventory = self._inventory
+            root_path = Path(str(root))
+            if query == "tracked_stream":
+                return inventory.stream_tracked(root_path, lambda _path: None)[0] == digest
+            if query == "tracked":
+                result = inventory.tracked_paths(root_path)
+            elif query == "ignored_directories":
+                if inventory.ignored is None:
+                    return False
+                result = inventory.ignored.query()
+            else:
+                result = inventory.tracked_ignored_paths(root_path)
+            return _inputs.result_digest(result) == digest
+        return False
+
+
+def _file_unchanged(path: Path, size: int, mtime_ns: int, digest: str, racy_before: int) -> bool:
+    try:
+        metadata = os.stat(path)
+    except OSError:
+        return False
+    if metadata.st_size == size and metadata.st_mtime_ns == mtime_ns and mtime_ns < racy_before:
+        return True
+    try:
+        with path.open("rb") as handle:
+            return hashlib.sha256(handle.read()).hexdigest() == digest
+    except OSError:
+        return False
+
+
+def _view_stat_unchanged(
+    root: Path,
+    stamps: list[list[object]],
+    files: list[list[object]],
+    racy_before: int,
+) -> bool:
+    if not stamps:
+        return False
+    try:
+        for relative, mtime_ns in stamps:
+            if int(mtime_ns) >= racy_before or os.stat(root / str(relative)).st_mtime_ns != mtime_ns:
+                return False
+        for relative, size, is_alias in files:
+            path = root / str(relative)
+            metadata = os.stat(path, follow_symlinks=False)
+            alias = stat.S_ISLNK(metadata.st_mode) or _has_reparse_attribute(metadata) or metadata.st_nlink > 1
+            if metadata.st_size != size or alias != is_alias:
+                return False
+    except OSError:
+        return False
+    return True
+
+
+class ResultCache:
+    """Keep per-check outcomes with their inputs and replay those whose inputs are unchanged.
+
+    Without a directory the cache lives only in memory, which is how watch mode keeps it warm.
+    """
+
+    def __init__(self, directory: Path | None, identity: dict[str, object], inventory: RepositoryInventory) -> None:
+        key = hashlib.sha256(json.dumps(identity, sort_keys=True).encode("utf-8")).hexdigest()
+        self.path = None if directory is None else directory / f"{key[:32]}.json"
+        self.identity = identity
+        self._entries: dict[str, dict[str, object]] = {}
+        self._dirty = False
+        self._validator = InputValidator(inventory)
+        if self.path is None:
+            return
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                stored = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if not isinstance(stored, dict):
+            return
+        if stored.get("version") == CACHE_VERSION and stored.get("identity") == identity:
+            entries = stored.get("entries")
+            self._entries = entries if isinstance(entries, dict) else {}
+
+    def rebind(self, inventory: RepositoryInventory) -> None:
+        """Validate the next run's inputs against that run's fresh inventory."""
+
+        self._validator = InputValidator(inventory)
+
+    def replay(self, check_id: str) -> tuple[list[str], list[str]] | None:
+        entry = self._entries.get(check_id)
+        if not isinstance(entry, dict):
+            return None
+        try:
+            if not self._validator.unchanged(entry["inputs"], int(entry["recorded_ns"])):
+                return None
+            return list(entry["errors"]), list(entry["warnings"])
+        except (KeyError, TypeError, ValueError, IndexError):
+            return None
+
+    def store(
+        self,
+        check_id: str,
+        outcome: tuple[list[str], list[str]],
+        recorder: InputRecorder,
+        recorded_ns: int,
+    ) -> None:
+        if not recorder.cacheable:
+            self._entries.pop(check_id, None)
+            self._dirty = True
+            return
+        errors, warnings = outcome
+        self._entries[check_id] = {
+            "recorded_ns": recorded_ns,
+            "errors": errors,
+            "warnings": warnings,
+            "inputs": _inputs.describe(recorder),
+        }
+        self._dirty = True
+
+    def save(self) -> str | None:
+        """Atomically replace the cache file; return an explicit warning when that fails."""
+
+        if not self._dirty or self.path is None:
+            return None
+        payload = {"version": CACHE_VERSION, "identity": self.identity, "entries": self._entries}
+        temporary: str | None = None
+        failure: str | None = None
+        try:
+            descriptor, temporary = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=self.path.parent)
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(temporary, self.path)
+            temporary = None
+            self._dirty = False
+        except (OSError, TypeError, ValueError) as exc:
+            failure = f"Result cache was not saved to {self.path}: {exc}"
+        if temporary is not None:
+            try:
+                os.unlink(temporary)
+            except OSError as exc:
+                failure = f"{failure}; its temporary file was not removed: {exc}"
+        return failure
+
+
+@dataclass
+class WarmState:
+    """What a watch loop keeps between runs: replayable results, parsed documents, tree snapshots."""
+
+    results: ResultCache | None = None
+    documents: DocumentStore | None = None
+    snapshots: TreeSnapshotStore | None = None
+    executed: tuple[str, ...] = ()
+
+
+def open_result_cache(
+    request: dict[str, object],
+    governance_root: Path,
+    inventory: RepositoryInventory,
+    warm: WarmState | None,
+) -> ResultCache | None:
+    cache_value = request.get("cache_dir")
+    if not cache_value and warm is None:
+        return None
+    assert inventory.repository_root is not None
+    directory = validate_cache_dir(Path(str(cache_value)), inventory.repository_root) if cache_value else None
+    identity: dict[str, object] = {
+        "repo_root": str(inventory.repository_root),
+        "governance_root": str(governance_root),
+        "strict_safety": bool(request.get("fail_on_safety_warnings", False)),
+        "prune_ignored": inventory.prune_ignored,
+        "inventory_source": inventory.source,
+        "checker": checker_fingerprint(),
+    }
+    if warm is not None and warm.results is not None and warm.results.identity == identity:
+        warm.results.rebind(inventory)
+        return warm.results
+    cache = ResultCache(directory, identity, inventory)
+    if warm is not None:
+        warm.results = cache
+    return cache
+
+
+def open_tree_snapshots(
+    request: dict[str, object],
+    inventory: RepositoryInventory,
+    warm: WarmState | None,
+) -> TreeSnapshotStore | None:
+    """Attach the repository's tree snapshot store to ``inventory``, keyed like the result cache."""
+
+    cache_value = request.get("cache_dir")
+    if not cache_value and warm is None:
+        return None
+    assert inventory.repository_root is not None
+    identity: dict[str, object] = {
+        "repo_root": str(inventory.repository_root),
+        "prune_ignored": inventory.prune_ignored,
+        "inventory_source": inventory.source,
+        "checker": checker_fingerprint(),
+    }
+    if warm is not None and warm.snapshots is not None and warm.snapshots.identity == identity:
+        store = warm.snapshots
+    else:
+        directory = validate_cache_dir(Path(str(cache_value)), inventory.repository_root) if cache_value else None
+        key = hashlib.sha256(json.dumps(identity, sort_keys=True).encode("utf-8")).hexdigest()
+        store = TreeSnapshotStore(None if directory is None else directory / f"tree-{key[:32]}.json", identity)
+        if warm is not None:
+            warm.snapshots = store
+    inventory.snapshots = store
+    return store
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, Generic, Hashable, TypeVar
+
+from scripts.check_governance_core import _metrics
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlightCache(Generic[K, V]):
+    """Memoize one loaded value per key; concurrent misses wait for the first loader."""
+
+    def __init__(self, metric: str | None = None) -> None:
+        self._hit_counter = f"{metric}_cache_hits" if metric else None
+        self._miss_counter = f"{metric}_cache_misses" if metric else None
+        self._lock = threading.Lock()
+        self._values: dict[K, V] = {}
+        self._loading: dict[K, threading.Event] = {}
+
+    def get(self, key: K, loader: Callable[[], V]) -> V:
+        while True:
+            with self._lock:
+                if key in self._values:
+                    self._count(self._hit_counter)
+                    return self._values[key]
+                pending = self._loading.get(key)
+                owner = pending is None
+                if pending is None:
+                    pending = threading.Event()
+                    self._loading[key] = pending
+            if not owner:
+                pending.wait()
+                with self._lock:
+                    if key in self._values:
+                        self._count(self._hit_counter)
+                        return self._values[key]
+                continue
+            self._count(self._miss_counter)
+            try:
+                value = loader()
+            except BaseException:
+                with self._lock:
+                    del self._loading[key]
+                pending.set()
+                raise
+            with self._lock:
+                self._values[key] = value
+                del self._loading[key]
+            pending.set()
+            return value
+
+    @staticmethod
+    def _count(counter: str | None) -> None:
+        if counter is not None:
+            _metrics.count(counter)
+
+    def setdefault(self, key: K, value: V) -> V:
+        """Store ``value`` unless ``key`` already has one, like ``dict.setdefault``, and return the kept value."""
+
+        with self._lock:
+            return self._values.setdefault(key, value)
+
+    def completed(self, key: K) -> V | None:
+        """Return ``key``'s value if it has finished loading, without waiting for or starting a load."""
+
+        with self._lock:
+            return self._values.get(key)
+
+    def items(self) -> tuple[tuple[K, V], ...]:
+        """Return a consistent snapshot of completed entries in insertion order."""
+
+        with self._lock:
+            return tuple(self._values.items())
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+from scripts.check_governance_core._governance_checks import governance_contract_digest
+
+
+ROOT_AUTHORITIES = (
+    "docs/agents/authority/authority.md",
+    "docs/agents/authority/context.md",
+    "docs/agents/authority/map.md",
+)
+CANONICAL_DELEGATION = "Delegate through the owning contract."
+DOC_TYPES = "policy|reference|runbook|playbook|decision|generated"
+_GIT_TIMEOUT_SECONDS = 120
+
+
+@dataclass(frozen=True)
+class SyntheticProfile:
+    """Shape of one generated governance repository."""
+
+    routed_docs: int = 200
+    router_depth: int = 3
+    router_fanout: int = 4
+    python_files: int = 100
+    python_files_per_feature: int = 10
+    tracked_paths: int = 0
+    manifest_profiles: int = 10
+
+    def validation_error(self) -> str | None:
+        for field in ("routed_docs", "python_files", "tracked_paths"):
+            if getattr(self, field) < 0:
+                return f"{field} must not be negative"
+        for field in ("router_depth", "router_fanout", "python_files_per_feature", "manifest_profiles"):
+            if getattr(self, field) < 1:
+                return f"{field} must be a positive integer"
+        return None
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="\n") as handle:
+        handle.write(text)
+
+
+def _leaf(title: str) -> str:
+    return (
+        "---\ndoc_type: reference\nssot_owner: AGENTS.md\nupdate_trigger: synthetic profile changes\n---\n"
+        f"# {title}\n\nSynthetic benchmark content for {title}.\n"
+    )
+
+
+def _router(title: str, targets: list[str]) -> str:
+    routes = "".join(f"- [{target}]({target}) - {target}. Required when: reading {target}.\n" for target in targets)
+    return f"# {title}\n\n{routes}"
+
+
+def _write_topic(directory: Path, depth: int, profile: SyntheticProfile, budget: list[int]) -> None:
+    """Write one router and its children; ``budget`` counts routed leaves still to place."""
+
+    name = directory.name
+    targets: list[str] = []
+    if depth == profile.router_depth:
+        leaves = min(budget[0], -(-profile.routed_docs // profile.router_fanout ** (profile.router_depth - 1)))
+        budget[0] -= leaves
+        for index in range(leaves):
+            leaf = f"{name}.md" if index == 0 else f"{name}-{index}.md"
+            _write(directory / leaf, _leaf(f"{name} {index}"))
+            targets.append(leaf)
+    else:
+        for index in range(profile.router_fanout):
+            if budget[0] <= 0:
+                break
+            child = directory / f"{name}-{index}"
+            _write_topic(child, depth + 1, profile, budget)
+            targets.append(f"{child.name}/{child.name}_index.md")
+    _write(directory / f"{name}_index.md", _router(f"{name} Index", targets))
+
+
+def _python_source(feature: str, index: int) -> str:
+    return (
+        "from __future__ import annotations\n\n"
+        "import logging\n\n"
+        f"logger = logging.getLogger({feature!r})\n\n\n"
+        f"def compute_{index}(values: list[int]) -> int:\n"
+        '    """Sum the positive values."""\n\n'
+        "    total = 0\n"
+        "    for value in values:\n"
+        "        if value > 0:\n"
+        "            total += value\n"
+        f'    logger.debug("compute_{index} total %s", total)\n'
+        "    return total\n"
+    )
+
+
+def _manifest(profile_count: int) -> str:
+    profiles = "".join(
+        f"  profile_{index}:\n"
+        "    detect:\n"
+        "      keywords:\n"
+        f"        - 'topic {index}'\n"
+        "      code_patterns: []\n"
+        "      file_globs:\n"
+        f"        - 'scripts/feature_{index}/*.py'\n"
+        "    authorities:\n"
+        "      - 'docs/agents/25-docs-ssot-policy/docs-ssot-policy.md'\n"
+        for index in range(profile_count)
+    )
+    return (
+        "version: 2\n"
+        "ssot_owner: agents-manifest.yaml\n"
+        "update_trigger: routes change\n"
+        "description: >-\n  synthetic benchmark manifest\n"
+        "routing_mode: union\n"
+        "fallback_authorities:\n  - 'docs/agents/25-docs-ssot-policy/docs-ssot-policy.md'\n"
+        "semantic_queries:\n  profile_0:\n    - 'find the owner'\n"
+        f"profiles:\n{profiles}"
+    )
+
+
+def _governance(root: Path, profile: SyntheticProfile) -> None:
+    witness = governance_contract_digest(ROOT_AUTHORITIES, CANONICAL_DELEGATION)
+    authorities = "".join(f"- `{authority}`\n" for authority in ROOT_AUTHORITIES)
+    _write(
+        root / "AGENTS.md",
+        "# Agent\n\n## Assigned-Lead Authority Routing Procedure (Hard Gate)\n\n"
+        f"Read and follow these authorities:\n{authorities}\n> {CANONICAL_DELEGATION}\n\n"
+        f"<!-- governance-root-contract: authorities={len(ROOT_AUTHORITIES)} sha256={witness} -->\n\n"
+        "## Documentation SSOT Policy (Hard Gate)\n\n"
+        "Baseline required project docs include:\n- `docs/project/project_index.md`\n",
+    )
+    _write(root / "agents-manifest.yaml", _manifest(profile.manifest_profiles))
+    _write(
+        root / "README.md",
+        "# Synthetic\n\nStart at AGENTS.md and docs/project/project_index.md.\n\n## Checks\n\n"
+        "- `python3 scripts/check_governance_core/check_governance_core_main.py`\n",
+    )
+    agents = root / "docs/agents"
+    for authority in ROOT_AUTHORITIES:
+        _write(root / authority, _leaf(Path(authority).stem))
+    _write(
+        agents / "authority/authority_index.md",
+        _router("Authority Index", [Path(authority).name for authority in ROOT_AUTHORITIES]),
+    )
+    policy = agents / "25-docs-ssot-policy"
+    _write(policy / "docs-ssot-policy.md", _leaf("Docs SSOT Policy") + f"\n```yaml\ndoc_type: {DOC_TYPES}\n```\n")
+    _write(policy / "docs-ssot-policy_index.md", _router("Docs SSOT Policy Index", ["docs-ssot-policy.md"]))
+    agent_routes = ["25-docs-ssot-policy/docs-ssot-policy_index.md", "authority/authority_index.md"]
+    if profile.routed_docs:
+        _write_topic(agents / "topic", 1, profile, [profile.routed_docs])
+        agent_routes.append("topic/topic_index.md")
+    _write(agents / "agents_index.md", _router("Agents Index", agent_routes))
+    project = root / "docs/project"
+    _write(
+        project / "architecture/architecture.md",
+        _leaf("Architecture") + "\n<!-- governance-core-python-root: scripts -->\n",
+    )
+    _write(project / "architecture/architecture_index.md", _router("Architecture Index", ["architecture.md"]))
+    _write(project / "project_index.md", _router("Project Branch Index", ["architecture/architecture_index.md"]))
+    _write(root / "docs/docs_index.md", _router("Docs", ["agents/agents_index.md", "project/project_index.md"]))
+
+
+def generate_repository(root: Path, profile: SyntheticProfile) -> tuple[int, str | None]:
+    """Write a synthetic governance repository under an empty ``root``; return its file count.
+
+    Every generated file is staged in a fresh Git index, because full mode validates a Git
+    worktree; ``tracked_paths`` adds that many data files for ``git ls-files`` to return.
+    """
+
+    profile_error = profile.validation_error()
+    if profile_error:
+        return 0, profile_error
+    if root.exists() and any(root.iterdir()):
+        return 0, f"synthetic repository root must be empty: {root}"
+    git = shutil.which("git")
+    if git is None:
+        return 0, "synthetic repositories require git on PATH"
+    _governance(root, profile)
+    for index in range(profile.python_files):
+        feature = f"feature_{index // profile.python_files_per_feature}"
+        module = f"{feature}_main" if index % profile.python_files_per_feature == 0 else f"_module_{index}"
+        _write(root / "scripts" / feature / f"{module}.py", _python_source(feature, index))
+    for index in range(profile.tracked_paths):
+        _write(root / "data" / f"shard-{index % 64:02d}" / f"record-{index}.txt", f"record {index}\n")
+    for arguments in (("init", "-q"), ("add", "-A")):
+        completed = subprocess.run(
+            [git, *arguments],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            timeout=_GIT_TIMEOUT_SECONDS,
+            check=False,
+        )
+        if completed.returncode != 0:
+            return 0, f"git {arguments[0]} failed for synthetic repository: {completed.stderr.strip()}"
+    return sum(1 for path in root.rglob("*") if path.is_file() and ".git" not in path.parts), None
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from scripts.check_governance_core._entry_table import EntryTable, InventoryEntry
+
+
+class TreeIndex:
+    """Lookup structure over one snapshot table already ordered by ``relative_key``.
+
+    ``entry`` and ``descendants_of`` bisect the table's shared path column, computing keys only
+    for the O(log n) probed rows, so a subtree costs O(log n) and is returned as one view;
+    ``children_of`` reads a parent-to-positions map built in a single pass.
+    """
+
+    def __init__(self, root: Path, entries: EntryTable) -> None:
+        self._root_parts = root.parts
+        self._entries = entries
+        self._children = entries.listings()
+
+    def _relative(self, path: Path) -> str | None:
+        if path.parts[: len(self._root_parts)] != self._root_parts:
+            return None
+        return "/".join(path.parts[len(self._root_parts) :])
+
+    def entry(self, path: Path) -> InventoryEntry | None:
+        relative = self._relative(path)
+        if not relative:
+            return None
+        position = self._entries.position(relative)
+        return None if position is None else self._entries[position]
+
+    def children_of(self, path: Path) -> tuple[InventoryEntry, ...]:
+        relative = self._relative(path)
+        positions = self._children.get(relative) if relative is not None else None
+        return () if positions is None else tuple(self._entries[position] for position in positions)
+
+    def descendants_of(self, path: Path) -> EntryTable | tuple[()]:
+        relative = self._relative(path)
+        if relative is None:
+            return ()
+        return self._entries.subtree(relative) if relative else self._entries
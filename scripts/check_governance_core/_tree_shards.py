@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from scripts.check_governance_core._entry_table import DIRECTORY, EntryTable, Row
+from scripts.check_governance_core._metrics import map_in_context
+from scripts.check_governance_core._tree_walk import WalkLimits
+
+
+ShardLoader = Callable[[Path], tuple[EntryTable, str | None]]
+
+
+def compose_shards(
+    root: Path,
+    top_rows: list[Row],
+    load_shard: ShardLoader,
+    stamp_of: Callable[[Path], int | None],
+    limits: WalkLimits,
+    started: float,
+    *,
+    workers: int = 1,
+) -> tuple[EntryTable, str | None]:
+    """Compose ``root``'s table from its own listing and one independently loaded table per directory.
+
+    ``load_shard`` walks each top-level directory against the budget and deadline the caller shares
+    between shards and keeps its table or error for callers that need only that subtree. The composed tree is still all-or-nothing:
+    the first shard error in listing order, or more than ``limits`` in total, fails it. One
+    worker loads shards lazily and stops at that first failure; more load them concurrently.
+    Directory rows take their shard's fresh stamp, since ``top_rows`` may be reused, and the
+    shard tables are joined by column rather than row by row.
+    """
+
+    shards = [root / row[0] for row in top_rows if row[1] & DIRECTORY]
+    loaded: dict[Path, tuple[EntryTable, str | None]] = {}
+    if workers > 1 and len(shards) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(shards)), thread_name_prefix="governance-shard") as pool:
+            loaded = dict(zip(shards, map_in_context(pool, load_shard, shards)))
+    parts: list[tuple[str, EntryTable]] = []
+    run: list[Row] = []
+    total = len(top_rows)
+    for row in top_rows:
+        if not row[1] & DIRECTORY:
+            run.append(row)
+            continue
+        shard = root / row[0]
+        table, error = loaded[shard] if shard in loaded else load_shard(shard)
+        if error:
+            return EntryTable.empty(root), error
+        total += len(table)
+        if total > limits.max_entries:
+            return EntryTable.empty(root), f"Repository tree inventory exceeded {limits.max_entries} entries"
+        if time.monotonic() - started > limits.max_seconds:
+            return EntryTable.empty(root), f"Repository tree inventory exceeded {limits.max_seconds:.1f} seconds"
+        stamp = stamp_of(shard)
+        run.append((row[0], DIRECTORY, 0, row[3] if stamp is None else stamp, row[4]))
+        parts.extend((("", EntryTable.from_rows(root, run)), (f"{row[0]}/", table)))
+        run = []
+    parts.append(("", EntryTable.from_rows(root, run)))
+    return EntryTable.joined(root, parts), None
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import json
+import os
+import stat
+import tempfile
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from scripts.check_governance_core._entry_table import ALIAS, DIRECTORY, EntryTable, Row, suffix_of
+from scripts.check_governance_core._inputs import RACY_NANOSECONDS
+from scripts.check_governance_core._metrics import count
+from scripts.check_governance_core._tree_walk import (
+    SharedBudget,
+    WalkLimits,
+    has_reparse_attribute,
+    restat_row,
+    scan_directory,
+)
+
+
+SNAPSHOT_VERSION = 1
+
+DirectoryStamp = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class TreeSnapshot:
+    """One tree's entries with the ``(mtime_ns, inode)`` stamp of its root and the pruned paths.
+
+    Every other directory's stamp is carried by its own row, and its listing is the rows whose
+    parent it is. ``excluded`` is the walk's ``WalkLimits.excluded``.
+    """
+
+    started_ns: int
+    root_stamp: DirectoryStamp
+    entries: EntryTable
+    excluded: frozenset[str] = frozenset()
+
+
+def revalidate_tree(
+    root: Path,
+    snapshot: TreeSnapshot,
+    limits: WalkLimits,
+    *,
+    refreshed_suffixes: frozenset[str],
+    descend: bool = True,
+    started: float | None = None,
+    budget: SharedBudget | None = None,
+) -> tuple[list[Row], int] | None:
+    """Rebuild ``root``'s rows from ``snapshot``, listing again only directories whose stamp moved.
+
+    A listing is reused while its directory's mtime and inode match and that mtime predates the
+    snapshot by more than the racy window; adding, removing, or renaming a child always moves it.
+    Reused files keep their recorded metadata except ``refreshed_suffixes``, whose size and alias
+    status gate file families and are read again. Returns the rows, already in ``relative_key``
+    order, and how many directories were listed again; a different set of pruned paths or
+    anything unexpected returns None so the caller walks afresh and reports that walk's result.
+    Without ``descend`` only ``root``'s own listing is rebuilt, for a snapshot that holds only it.
+    ``started`` and ``budget`` hold the rebuild to a caller's deadline and shared entry budget, which
+    is charged only for a tree it returns, so a caller that walks afresh is not charged twice.
+    """
+
+    if snapshot.excluded != limits.excluded:
+        return None
+    if budget is not None:
+        limits = replace(limits, max_entries=max(budget.remaining, 0))
+    trusted_before = snapshot.started_ns - RACY_NANOSECONDS
+    started = time.monotonic() if started is None else started
+    previous_rows = list(snapshot.entries.rows())
+    previous_listings = snapshot.entries.listings()
+    visited = 0
+    rescanned = 0
+
+    def listing(relative: str, recorded: DirectoryStamp) -> tuple[DirectoryStamp, list[Row]] | None:
+        """Stamp directory ``relative`` and return its rows, reused or listed again; None on anything odd."""
+
+        nonlocal visited, rescanned
+        if time.monotonic() - started > limits.max_seconds:
+            return None
+        count("tree_stat_calls")
+        try:
+            metadata = os.stat(os.path.join(root, relative), follow_symlinks=False)
+        except OSError:
+            return None
+        if not stat.S_ISDIR(metadata.st_mode) or has_reparse_attribute(metadata):
+            return None
+        stamp = (metadata.st_mtime_ns, metadata.st_ino)
+        previous = previous_listings.get(relative)
+        if previous is not None and stamp == recorded and stamp[0] < trusted_before:
+            count("tree_directories_reused")
+            children: list[Row] = []
+            for position in previous:
+                child = previous_rows[position]
+                if not child[1] & DIRECTORY and suffix_of(child[0]) in refreshed_suffixes:
+                    refreshed = restat_row(root, child)
+                    if refreshed is None:
+                        return None
+                    child = refreshed
+                children.append(child)
+            visited += len(children)
+        else:
+            count("tree_directories_rescanned")
+            rescanned += 1
+            scanned, _child_directories, scanned_count, error = scan_directory(
+                root / relative, relative, limits, started, limits.max_entries - visited
+            )
+            if error:
+                return None
+            visited += scanned_count
+            children = scanned
+        if visited > limits.max_entries:
+            return None
+        return stamp, children
+
+    root_listing = listing("", snapshot.root_stamp)
+    if root_listing is None:
+        return None
+    if not descend:
+        return _charged(root_listing[1], rescanned, budget)
+    collected: list[Row] = []
+    pending = [iter(root_listing[1])]
+    while pending:
+        child = next(pending[-1], None)
+        if child is None:
+            pending.pop()
+            continue
+        if child[1] & DIRECTORY:
+            child_listing = listing(child[0], (child[3], child[4]))
+            if child_listing is None:
+                return None
+            child = (child[0], DIRECTORY, 0, *child_listing[0])
+            pending.append(iter(child_listing[1]))
+        collected.append(child)
+    return _charged(collected, rescanned, budget)
+
+
+def _charged(rows: list[Row], rescanned: int, budget: SharedBudget | None) -> tuple[list[Row], int] | None:
+    return (rows, rescanned) if budget is None or budget.take(len(rows)) else None
+
+
+class TreeSnapshotStore:
+    """Keep tree snapshots between runs, like Git's untracked cache.
+
+    Without a path the store lives only in memory, which is how watch mode keeps it warm; with
+    one, ``save`` atomically replaces a single JSON file.
+    """
+
+    def __init__(self, path: Path | None, identity: dict[str, object]) -> None:
+        self.path = path
+        self.identity = identity
+        self._stored: dict[str, object] = {}
+        self._snapshots: dict[Path, TreeSnapshot] = {}
+        self._dirty = False
+        if path is None:
+            return
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                stored = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if not isinstance(stored, dict):
+            return
+        if stored.get("version") == SNAPSHOT_VERSION and stored.get("identity") == identity:
+            trees = stored.get("trees")
+            self._stored = trees if isinstance(trees, dict) else {}
+
+    def get(self, root: Path) -> TreeSnapshot | None:
+        if root in self._snapshots:
+            return self._snapshots[root]
+        stored = self._stored.get(str(root))
+        if not isinstance(stored, dict):
+            return None
+        try:
+            listings = {
+                str(relative): [_decoded(*child) for child in children] for relative, children in stored["listings"]
+            }
+            mtime, inode = stored["root_stamp"]
+            return TreeSnapshot(
+                int(stored["started_ns"]),
+                (int(mtime), int(inode)),
+                EntryTable.from_rows(root, _preorder(listings)),
+                frozenset(str(relative) for relative in stored.get("excluded", ())),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, root: Path, snapshot: TreeSnapshot) -> None:
+        self._snapshots[root] = snapshot
+        self._dirty = True
+
+    def save(self) -> str | None:
+        """Atomically replace the snapshot file; return an explicit warning when that fails."""
+
+        if not self._dirty or self.path is None:
+            return None
+        trees = dict(self._stored)
+        trees.update((str(root), _encoded(snapshot)) for root, snapshot in self._snapshots.items())
+        payload = {"version": SNAPSHOT_VERSION, "identity": self.identity, "trees": trees}
+        temporary: str | None = None
+        failure: str | None = None
+        try:
+            descriptor, temporary = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=self.path.parent)
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                handle.write(json.dumps(payload, separators=(",", ":")))
+            os.replace(temporary, self.path)
+            temporary = None
+            self._dirty = False
+        except (OSError, TypeError, ValueError) as exc:
+            failure = f"Tree snapshot was not saved to {self.path}: {exc}"
+        if temporary is not None:
+            try:
+                os.unlink(temporary)
+            except OSError as exc:
+                failure = f"{failure}; its temporary file was not removed: {exc}"
+        return failure
+
+
+def _encoded(snapshot: TreeSnapshot) -> dict[str, object]:
+    rows = list(snapshot.entries.rows())
+    return {
+        "started_ns": snapshot.started_ns,
+        "root_stamp": list(snapshot.root_stamp),
+        "excluded": sorted(snapshot.excluded),
+        "listings": [
+            [directory, [_encoded_row(*rows[position]) for position in positions]]
+            for directory, positions in snapshot.entries.listings().items()
+        ],
+    }
+
+
+def _encoded_row(relative: str, flags: int, size: int, mtime: int, inode: int) -> list[object]:
+    return [relative[relative.rfind("/") + 1 :], bool(flags & DIRECTORY), bool(flags & ALIAS), size, mtime, inode]
+
+
+def _decoded(name: object, is_directory: object, alias: object, size: object, mtime: object, inode: object) -> Row:
+    if not isinstance(name, str):
+        raise TypeError("tree snapshot names are strings")
+    flags = (DIRECTORY if is_directory else 0) | (ALIAS if alias else 0)
+    return name, flags, int(size), int(mtime), int(inode)  # type: ignore[call-overload]
+
+
+def _preorder(listings: dict[str, list[Row]]) -> Iterator[Row]:
+    """Yield stored listings, each holding ``(name, ...)`` rows, as full rows in ``relative_key`` order.
+
+    Listings were stored in that order, so a depth-first walk over them needs no sort; a directory
+    whose listing is missing makes the caller reject the snapshot.
+    """
+
+    pending = [("", iter(listings[""]))]
+    while pending:
+        directory, children = pending[-1]
+        child = next(children, None)
+        if child is None:
+            pending.pop()
+            continue
+        relative = f"{directory}/{child[0]}" if directory else child[0]
+        yield (relative, *child[1:])
+        if child[1] & DIRECTORY:
+            pending.append((relative, iter(listings[relative])))
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import os
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from scripts.check_governance_core._entry_table import ALIAS, DIRECTORY, Row, relative_key
+from scripts.check_governance_core._metrics import count, map_in_context
+
+
+NON_CONTENT_DIRS = {".git"}
+
+
+@dataclass(frozen=True)
+class WalkLimits:
+    """Budgets one walk enforces, the alias probe the inventory owns, and directories to prune.
+
+    The walk hands ``is_directory_alias`` each directory's ``lstat`` result, so the probe needs
+    no syscall of its own. ``excluded`` holds ``/``-separated paths relative to the walk root; a
+    directory, or a symlink to one, at such a path is skipped with its whole subtree before any
+    alias check.
+    """
+
+    max_entries: int
+    max_seconds: float
+    is_directory_alias: Callable[[Path, os.stat_result], bool]
+    excluded: frozenset[str] = frozenset()
+
+
+class SharedBudget:
+    """Entries that concurrent scans may still visit between them, taken one at a time under a lock."""
+
+    def __init__(self, remaining: int) -> None:
+        self.remaining = remaining
+        self._lock = threading.Lock()
+
+    def take(self, amount: int = 1) -> bool:
+        with self._lock:
+            self.remaining -= amount
+            return self.remaining >= 0
+
+
+_Scan = tuple[list[Row], list[tuple[Path, str]], int, str | None]
+
+
+def scan_directory(
+    current: Path,
+    relative: str,
+    limits: WalkLimits,
+    started: float,
+    budget: int | SharedBudget,
+) -> _Scan:
+    """List one directory in case-folded name order; return rows, child directories, visits, error.
+
+    ``relative`` is ``current`` below the walk root, ``""`` for the root itself; child directories come
+    back as ``(path, relative)`` pairs and only they get a ``Path``. ``budget`` is how many more
+    entries the walk may visit, or a ``SharedBudget`` that directories scanned at once draw from;
+    exceeding it, the deadline, or any alias or OS failure ends the scan with an explicit error and
+    no partial result.
+
+    Each file or directory costs one ``lstat``, through ``DirEntry.stat``, which Windows serves
+    from the listing itself; its type and inode come from the listing. Only a symlink costs a
+    second stat, to learn whether it points at a directory. No directory is resolved: the root
+    is validated and every directory below it was just shown not to be an alias, so none can
+    lead outside it. The listing and stat calls are counted as ``tree_scandir_calls`` and
+    ``tree_stat_calls``.
+    """
+
+    shared = budget if isinstance(budget, SharedBudget) else None
+    visited = 0
+    stats = 0
+    scanned: list[os.DirEntry[str]] = []
+    prefix = f"{relative}/" if relative else ""
+    count("tree_scandir_calls")
+    try:
+        with os.scandir(current) as iterator:
+            for item in iterator:
+                visited += 1
+                if not shared.take() if shared is not None else visited > budget:
+                    return [], [], visited, f"Repository tree inventory exceeded {limits.max_entries} entries"
+                if time.monotonic() - started > limits.max_seconds:
+                    return [], [], visited, _timeout(limits)
+                scanned.append(item)
+        scanned.sort(key=lambda item: (item.name.casefold(), item.name))
+        collected: list[Row] = []
+        child_directories: list[tuple[Path, str]] = []
+        for item in scanned:
+            is_symlink = item.is_symlink()
+            stats += is_symlink
+            follows_to_directory = is_symlink and item.is_dir(follow_symlinks=True)
+            if follows_to_directory or item.is_dir(follow_symlinks=False):
+                if prefix + item.name in limits.excluded:
+                    continue
+                candidate = current / item.name
+                alias_error = f"Repository tree does not permit directory symlinks or aliases: {candidate}"
+                if follows_to_directory:
+                    return [], [], visited, alias_error
+                stats += 1
+                metadata = item.stat(follow_symlinks=False)
+                if limits.is_directory_alias(candidate, metadata):
+                    return [], [], visited, alias_error
+                if item.name in NON_CONTENT_DIRS:
+                    continue
+                collected.append((prefix + item.name, DIRECTORY, 0, metadata.st_mtime_ns, metadata.st_ino))
+                child_directories.append((candidate, prefix + item.name))
+                continue
+            stats += 1
+            metadata = item.stat(follow_symlinks=False)
+            is_alias = is_symlink or has_reparse_attribute(metadata) or metadata.st_nlink > 1
+            collected.append((prefix + item.name, ALIAS if is_alias else 0, metadata.st_size, 0, 0))
+    except OSError as exc:
+        return [], [], visited, f"Unable to enumerate repository tree: {exc}"
+    finally:
+        count("tree_stat_calls", stats)
+    return collected, child_directories, visited, None
+
+
+def _timeout(limits: WalkLimits) -> str:
+    return f"Repository tree inventory exceeded {limits.max_seconds:.1f} seconds"
+
+
+def walk_tree(
+    root: Path,
+    limits: WalkLimits,
+    *,
+    workers: int = 1,
+    started: float | None = None,
+    budget: SharedBudget | None = None,
+) -> tuple[list[Row], str | None]:
+    """Enumerate ``root`` within ``limits``; return every row in ``relative_key`` order or one error.
+
+    One worker walks depth-first, emitting each directory's rows right after the directory itself
+    so the result needs no sort, and reports the first failure in that order. More workers scan
+    each depth level concurrently against one shared entry budget and sort once at the end. A
+    failed directory stops only the directories after it in that order; those before it are still
+    walked, so an alias or OS failure is the one the sequential walk would report. A caller walking
+    several roots as one tree passes its ``started`` time and ``budget`` so they share one deadline
+    and one entry budget.
+    """
+
+    started = time.monotonic() if started is None else started
+    if workers > 1:
+        return _walk_levels(root, limits, workers, started, budget or SharedBudget(limits.max_entries))
+    visited = 0
+    collected: list[Row] = []
+    pending: list[Iterator[Row]] = []
+    current: tuple[Path, str] | None = (root, "")
+    while current is not None or pending:
+        if current is not None:
+            if time.monotonic() - started > limits.max_seconds:
+                return [], _timeout(limits)
+            remaining = budget if budget is not None else limits.max_entries - visited
+            rows, _children, visits, error = scan_directory(*current, limits, started, remaining)
+            visited += visits
+            if error:
+                return [], error
+            pending.append(iter(rows))
+            current = None
+        row = next(pending[-1], None)
+        if row is None:
+            pending.pop()
+            continue
+        collected.append(row)
+        if row[1] & DIRECTORY:
+            current = (root / row[0], row[0])
+    return collected, None
+
+
+def _walk_levels(
+    root: Path,
+    limits: WalkLimits,
+    workers: int,
+    started: float,
+    budget: SharedBudget,
+) -> tuple[list[Row], str | None]:
+    collected: list[Row] = []
+    failure: tuple[str, str] | None = None
+    level = [(root, "")]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="governance-walk") as pool:
+        while level:
+            if time.monotonic() - started > limits.max_seconds:
+                return [], _timeout(limits)
+            scans = map_in_context(pool, lambda directory: scan_directory(*directory, limits, started, budget), level)
+            next_level: list[tuple[Path, str]] = []
+            for (_path, relative), (rows, children, _visits, error) in zip(level, scans):
+                if error:
+                    if failure is None or relative_key(relative) < failure[0]:
+                        failure = (relative_key(relative), error)
+                    continue
+                collected.extend(rows)
+                next_level.extend(children)
+            if failure is not None:
+                if budget.remaining < 0:
+                    break
+                next_level = [child for child in next_level if relative_key(child[1]) < failure[0]]
+            level = next_level
+    if failure is not None:
+        return [], failure[1]
+    collected.sort(key=lambda row: relative_key(row[0]))
+    return collected, None
+
+
+def restat_row(root: Path, row: Row) -> Row | None:
+    """Return file ``row`` with current size and alias status, or None once it is no longer that file."""
+
+    count("tree_stat_calls")
+    try:
+        metadata = os.stat(os.path.join(root, row[0]), follow_symlinks=False)
+    except OSError:
+        return None
+    if stat.S_ISDIR(metadata.st_mode) or (stat.S_ISLNK(metadata.st_mode) and not row[1] & ALIAS):
+        return None
+    is_alias = stat.S_ISLNK(metadata.st_mode) or has_reparse_attribute(metadata) or metadata.st_nlink > 1
+    return row[0], ALIAS if is_alias else 0, metadata.st_size, 0, 0
+
+
+def is_directory_alias(path: Path, metadata: os.stat_result | None = None) -> bool:
+    """Reject symlinks and Windows reparse-point directory aliases on Python 3.11+.
+
+    Given ``metadata`` from an ``lstat`` of ``path``, decide from it without another syscall.
+    """
+
+    if metadata is not None:
+        return stat.S_ISLNK(metadata.st_mode) or has_reparse_attribute(metadata)
+    return path.is_symlink() or has_reparse_attribute(path.stat(follow_symlinks=False))
+
+
+def has_reparse_attribute(metadata: os.stat_result) -> bool:
+    attributes = getattr(metadata, "st_file_attributes", 0)
+    reparse_flag = getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0x400)
+    return bool(attributes & reparse_flag)
@@ -3,20 +3,43 @@
 
 Programmatic contract:
     run_checks(request) -> plain dictionary
+    run_checks_many(requests, workers=N) -> list of those dictionaries, in order
+    iter_checks(request) -> check records as they complete, then one summary
 
 The request accepts ``repo_root``, ``governance_root``, ``mode`` (``full``,
-``docs``, or ``project_docs``), and ``fail_on_safety_warnings``. Validation is
-read-only; strict mode promotes Python-safety warnings to failures. Invalid
-requests and unexpected failures are returned as
-explicit FAILED_VALIDATION/FAILED results; callers do not import private files.
+``docs``, or ``project_docs``), ``fail_on_safety_warnings``, ``workers``,
+``scan_workers``, ``inventory_source``, ``prune_ignored``, ``metrics``, ``cache_dir``,
+``changed_paths``, and ``revision_range``. Validation is read-only; strict mode
+promotes Python-safety warnings to failures. ``workers`` bounds the thread pool
+that runs independent checks concurrently without changing record order or
+error text; ``scan_workers`` does the same for the repository tree walk, one
+depth level at a time. ``inventory_source="git_index"`` builds the repository
+tree from the Git index when the worktree is clean and walks it otherwise.
+``prune_ignored`` skips the directories Git ignores and says so in a warning.
+``metrics`` adds a timing and I/O ``metrics`` block to every check record and
+the result.
+``cache_dir`` (outside the repository or inside its ``.git`` directory) enables
+the only write side effect: a persistent result cache that replays a check's
+record while every file, probe, tree view, and Git query it consumed is
+unchanged, plus a tree snapshot that lets the next walk skip unchanged
+directories. ``changed_paths`` (repository-relative or contained absolute paths)
+and ``revision_range`` (``base..head``, diffed with Git) limit a run to the
+checks whose declared inputs those paths touch, and narrow file-level checks to
+the changed files and the docs routers above them; untouched checks are
+reported as ``SKIPPED``. Invalid requests and unexpected failures are returned
+as explicit FAILED_VALIDATION/FAILED results; callers do not import private
+files.
 """
 
 from __future__ import annotations
 
-import argparse
+import hashlib
+import json
 import logging
 import sys
-from collections.abc import Mapping, Sequence
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
@@ -24,33 +47,18 @@ REPO_IMPORT_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_IMPORT_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_IMPORT_ROOT))
 
-from scripts.check_governance_core._engine import execute, resolve_documents_request  # noqa: E402
+from scripts.check_governance_core._cli import parse_command_line  # noqa: E402
+from scripts.check_governance_core._engine import resolve_documents_request  # noqa: E402
+from scripts.check_governance_core._execution import execute, iter_execute  # noqa: E402
+from scripts.check_governance_core._inventory import RepositoryInventory  # noqa: E402
+from scripts.check_governance_core._parse_memo import parse_memo  # noqa: E402
+from scripts.check_governance_core._request import check_request_error, validate_root_fields  # noqa: E402
+from scripts.check_governance_core._result_cache import WarmState  # noqa: E402
 
 
 logger = logging.getLogger("check_governance_core")
-
-
-def _validate_root_fields(request: Mapping[str, object]) -> str | None:
-    for field in ("repo_root", "governance_root"):
-        value = request.get(field)
-        if value is not None and not isinstance(value, (str, Path)):
-            return f"{field} must be a path string, Path, or null"
-        if field in request and isinstance(value, (str, Path)) and not str(value).strip():
-            return f"{field} must not be empty when provided"
-    return None
-
-
-def _validate_check_request(request: Mapping[str, object]) -> str | None:
-    root_error = _validate_root_fields(request)
-    if root_error:
-        return root_error
-    mode = request.get("mode", "full")
-    if not isinstance(mode, str):
-        return "mode must be a string"
-    strict = request.get("fail_on_safety_warnings", False)
-    if not isinstance(strict, bool):
-        return "fail_on_safety_warnings must be a boolean"
-    return None
+WATCH_INTERVAL_SECONDS = 0.25
+MAX_GOVERNANCE_KEY_BYTES = 1024 * 1024
 
 
 def run_checks(request: Mapping[str, object]) -> dict[str, object]:
@@ -61,76 +69,147 @@ def run_checks(request: Mapping[str, object]) -> dict[str, object]:
     explicit public-contract change.
     """
 
-    if not isinstance(request, Mapping):
-        return {
-            "api_version": 1,
-            "status": "FAILED_VALIDATION",
-            "checks": [],
-            "planned": [],
-            "eligible": [],
-            "executed": [],
-            "skipped": [],
-            "failed": [],
-            "errors": ["request must be a mapping"],
-            "warnings": [],
-        }
-    allowed = {"repo_root", "governance_root", "mode", "fail_on_safety_warnings"}
-    unknown = sorted(str(key) for key in request if key not in allowed)
-    if unknown:
-        return {
-            "api_version": 1,
-            "status": "FAILED_VALIDATION",
-            "checks": [],
-            "planned": [],
-            "eligible": [],
-            "executed": [],
-            "skipped": [],
-            "failed": [],
-            "errors": [f"unsupported request key(s): {', '.join(unknown)}"],
-            "warnings": [],
-        }
-    validation_error = _validate_check_request(request)
-    if validation_error:
-        return {
-            "api_version": 1,
-            "status": "FAILED_VALIDATION",
-            "checks": [],
-            "planned": [],
-            "eligible": [],
-            "executed": [],
-            "skipped": [],
-            "failed": [],
-            "errors": [validation_error],
-            "warnings": [],
-        }
+    return _run_checks(request, None)
+
+
+def _run_checks(request: Mapping[str, object], warm: WarmState | None) -> dict[str, object]:
+    request_error = check_request_error(request)
+    if request_error:
+        return _failed_result("FAILED_VALIDATION", request_error)
     try:
-        return execute(dict(request))
+        return execute(dict(request), warm)
     except ValueError as exc:
-        return {
-            "api_version": 1,
-            "status": "FAILED_VALIDATION",
-            "checks": [],
-            "planned": [],
-            "eligible": [],
-            "executed": [],
-            "skipped": [],
-            "failed": [],
-            "errors": [str(exc)],
-            "warnings": [],
-        }
+        return _failed_result("FAILED_VALIDATION", str(exc))
     except Exception as exc:  # public boundary converts crashes into explicit failure
-        return {
-            "api_version": 1,
-            "status": "FAILED",
-            "checks": [],
-            "planned": [],
-            "eligible": [],
-            "executed": [],
-            "skipped": [],
-            "failed": [],
-            "errors": [f"internal governance-check failure: {type(exc).__name__}: {exc}"],
-            "warnings": [],
-        }
+        return _failed_result("FAILED", f"internal governance-check failure: {type(exc).__name__}: {exc}")
+
+
+def iter_checks(request: Mapping[str, object]) -> Iterator[dict[str, object]]:
+    """Yield each check record as soon as it completes, then a final summary record.
+
+    Check records carry ``"type": "check"`` and arrive in completion order; the
+    summary carries ``"type": "summary"``, the ``run_checks`` status and check-id
+    lists, run-level ``errors`` and ``warnings``, and ``error_count`` and
+    ``warning_count`` over the whole run. Records are not retained, so memory stays
+    flat however many checks run. Invalid requests and failures before the first
+    record yield a single failed summary.
+    """
+
+    request_error = check_request_error(request)
+    if request_error:
+        yield _failed_summary("FAILED_VALIDATION", request_error)
+        return
+    records = iter_execute(dict(request))
+    try:
+        first = next(records)
+    except ValueError as exc:
+        yield _failed_summary("FAILED_VALIDATION", str(exc))
+        return
+    except Exception as exc:  # public boundary converts crashes into explicit failure
+        yield _failed_summary("FAILED", f"internal governance-check failure: {type(exc).__name__}: {exc}")
+        return
+    yield first
+    try:
+        yield from records
+    except Exception as exc:  # records already emitted stay valid; the run still ends in a summary
+        yield _failed_summary("FAILED", f"internal governance-check failure: {type(exc).__name__}: {exc}")
+
+
+def run_checks_many(requests: Sequence[Mapping[str, object]], *, workers: int = 1) -> list[dict[str, object]]:
+    """Run ``run_checks`` for many repositories and return one result per request, in order.
+
+    ``workers`` bounds a process pool. Requests sharing governance content run
+    next to each other, so each worker parses a shared ``AGENTS.md`` contract,
+    manifest, and router topology once per chunk and reuses it for the following
+    repositories. Each result is exactly what ``run_checks`` returns for its
+    request.
+    """
+
+    if isinstance(requests, (str, bytes, Mapping)) or not isinstance(requests, Sequence):
+        return [_failed_result("FAILED_VALIDATION", "requests must be a sequence of request mappings")]
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        return [_failed_result("FAILED_VALIDATION", "workers must be a positive integer") for _request in requests]
+    ordered = sorted(range(len(requests)), key=lambda index: _governance_key(requests[index]))
+    if workers == 1 or len(ordered) < 2:
+        chunks = [ordered]
+    else:
+        size = -(-len(ordered) // min(workers, len(ordered)))
+        chunks = [ordered[start : start + size] for start in range(0, len(ordered), size)]
+    results: list[dict[str, object] | None] = [None] * len(requests)
+    if len(chunks) == 1:
+        for index, result in zip(chunks[0], _run_chunk([requests[index] for index in chunks[0]])):
+            results[index] = result
+        return [result for result in results if result is not None]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        futures = [pool.submit(_run_chunk, [_plain(requests[index]) for index in chunk]) for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            try:
+                chunk_results = future.result()
+            except Exception as exc:  # a lost worker process fails only its own requests
+                error = f"internal governance-check failure: {type(exc).__name__}: {exc}"
+                chunk_results = [_failed_result("FAILED", error) for _index in chunk]
+            for index, result in zip(chunk, chunk_results):
+                results[index] = result
+    return [result for result in results if result is not None]
+
+
+def _run_chunk(requests: Sequence[object]) -> list[dict[str, object]]:
+    with parse_memo():
+        return [run_checks(request) for request in requests]  # type: ignore[arg-type]
+
+
+def _plain(request: object) -> object:
+    return dict(request) if isinstance(request, Mapping) else request
+
+
+def _governance_key(request: object) -> str:
+    """Order requests so that identical governance content is checked consecutively.
+
+    Only a valid request's contract files are hashed, each after ``validate_file`` accepts it and
+    through a read bounded by ``MAX_GOVERNANCE_KEY_BYTES``; anything else keeps its path key, so
+    ordering never reads more than a run would.
+    """
+
+    if check_request_error(request):
+        return ""
+    assert isinstance(request, Mapping)
+    value = request.get("governance_root")
+    root = Path(str(value)).expanduser() if value else REPO_IMPORT_ROOT
+    inventory = RepositoryInventory(root)
+    digest = hashlib.sha256()
+    for name in ("AGENTS.md", "agents-manifest.yaml"):
+        path, error = inventory.validate_file(root / name)
+        if error or path is None:
+            return f"path:{root}"
+        try:
+            with path.open("rb") as handle:
+                raw = handle.read(MAX_GOVERNANCE_KEY_BYTES + 1)
+        except OSError:
+            return f"path:{root}"
+        if len(raw) > MAX_GOVERNANCE_KEY_BYTES:
+            return f"path:{root}"
+        digest.update(len(raw).to_bytes(8, "big") + raw)
+    return f"content:{digest.hexdigest()}"
+
+
+def _failed_result(status: str, error: str) -> dict[str, object]:
+    return {
+        "api_version": 1,
+        "status": status,
+        "checks": [],
+        "planned": [],
+        "eligible": [],
+        "executed": [],
+        "skipped": [],
+        "failed": [],
+        "errors": [error],
+        "warnings": [],
+    }
+
+
+def _failed_summary(status: str, error: str) -> dict[str, object]:
+    summary = {key: value for key, value in _failed_result(status, error).items() if key != "checks"}
+    return {"type": "summary", **summary, "error_count": 1, "warning_count": 0}
 
 
 def resolve_documents(request: Mapping[str, object]) -> dict[str, object]:
@@ -159,7 +238,7 @@ def resolve_documents(request: Mapping[str, object]) -> dict[str, object]:
             "documents": [],
             "errors": [f"unsupported request key(s): {', '.join(unknown)}"],
         }
-    root_error = _validate_root_fields(request)
+    root_error = validate_root_fields(request)
     if root_error:
         return {
             "api_version": 1,
@@ -193,25 +272,55 @@ def _configure_logging() -> None:
     logger.setLevel(logging.INFO)
 
 
+_PROFILE_COLUMNS = (
+    ("wall_ms", "wall_seconds", 1000),
+    ("cpu_ms", "cpu_seconds", 1000),
+    ("files", "files_read", 1),
+    ("bytes", "bytes_read", 1),
+    ("git", "git_invocations", 1),
+    ("doc_hit", "document_cache_hits", 1),
+    ("doc_miss", "document_cache_misses", 1),
+    ("inv_hit", "inventory_cache_hits", 1),
+    ("inv_miss", "inventory_cache_misses", 1),
+    ("replayed", "result_cache_hits", 1),
+)
+
+
+def _log_profile(result: Mapping[str, object]) -> None:
+    rows = [(str(record["id"]), record["metrics"]) for record in result["checks"]]
+    rows.append(("total", result["metrics"]))
+    width = max(len(name) for name, _metrics in rows)
+    titles = (f"{title:>10}" for title, _key, _scale in _PROFILE_COLUMNS)
+    logger.info("%s", "  ".join([f"{'check':<{width}}", *titles]))
+    for name, metrics in rows:
+        cells = []
+        for _title, key, scale in _PROFILE_COLUMNS:
+            value = metrics[key] * scale
+            cells.append(f"{value:>10.1f}" if isinstance(value, float) else f"{value:>10}")
+        logger.info("%s", "  ".join([f"{name:<{width}}", *cells]))
+
+
 def main(argv: Sequence[str]) -> int:
     _configure_logging()
-    parser = argparse.ArgumentParser(description="Run the governance-core public validation contract.")
-    parser.add_argument("--repo-root")
-    parser.add_argument("--governance-root")
-    modes = parser.add_mutually_exclusive_group()
-    modes.add_argument("--only-docs-ssot", action="store_true")
-    modes.add_argument("--only-project-docs", action="store_true")
-    parser.add_argument("--fail-on-safety-warnings", action="store_true")
-    args = parser.parse_args(argv)
-    mode = "docs" if args.only_docs_ssot else "project_docs" if args.only_project_docs else "full"
-    result = run_checks(
-        {
-            "repo_root": args.repo_root,
-            "governance_root": args.governance_root,
-            "mode": mode,
-            "fail_on_safety_warnings": args.fail_on_safety_warnings,
-        }
-    )
+    if list(argv[:1]) == ["benchmark"]:
+        from scripts.check_governance_core._benchmark import benchmark_main
+
+        return benchmark_main(argv[1:])
+    request, args = parse_command_line(argv)
+    if args.watch:
+        return _watch(request, profile=args.profile)
+    if args.format == "ndjson":
+        status = "FAILED"
+        for record in iter_checks(request):
+            logger.info("%s", json.dumps(record, sort_keys=True))
+            status = str(record["status"]) if record["type"] == "summary" else status
+        return 0 if status == "PASSED" else 1
+    result = run_checks(request)
+    _log_result(result, profile=args.profile)
+    return 0 if result["status"] == "PASSED" else 1
+
+
+def _log_result(result: Mapping[str, object], *, profile: bool) -> None:
     for record in result.get("checks", []):
         logger.info("%s: %s", record["id"], record["status"])
         for warning in record["warnings"]:
@@ -220,8 +329,42 @@ def main(argv: Sequence[str]) -> int:
             logger.error("ERROR: %s", error)
     for error in result.get("errors", []) if not result.get("checks") else []:
         logger.error("ERROR: %s", error)
+    if profile and "metrics" in result:
+        _log_profile(result)
     logger.info("Governance core: %s", result["status"])
-    return 0 if result["status"] == "PASSED" else 1
+
+
+def _watch(
+    request: Mapping[str, object],
+    *,
+    profile: bool,
+    cycles: int | None = None,
+    interval: float = WATCH_INTERVAL_SECONDS,
+) -> int:
+    """Re-run after every change until interrupted, keeping results and parsed documents warm.
+
+    Each poll revalidates the recorded inputs of every check by stat (directory mtimes for tree
+    views, size and mtime for files) and re-runs only the checks whose inputs changed; nothing is
+    logged while nothing changed.
+    """
+
+    warm = WarmState()
+    status = "FAILED"
+    poll = 0
+    try:
+        while cycles is None or poll < cycles:
+            if poll:
+                time.sleep(interval)
+            result = _run_checks(request, warm)
+            if poll == 0 or warm.executed or result["status"] != status:
+                if poll:
+                    logger.info("Changed: %s", ", ".join(warm.executed) or "request")
+                _log_result(result, profile=profile)
+            status = str(result["status"])
+            poll += 1
+    except KeyboardInterrupt:
+        pass
+    return 0 if status == "PASSED" else 1
 
 
 if __name__ == "__main__":
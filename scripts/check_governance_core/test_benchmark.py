@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import copy
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import check_governance_core_main
+from scripts.check_governance_core._benchmark import compare_benchmarks, run_benchmarks
+from scripts.check_governance_core._synthetic_repo import SyntheticProfile, generate_repository
+from scripts.check_governance_core.check_governance_core_main import resolve_documents, run_checks
+
+
+TINY = SyntheticProfile(routed_docs=9, router_depth=2, router_fanout=2, python_files=4, tracked_paths=3)
+
+
+@unittest.skipIf(shutil.which("git") is None, "git is not installed")
+class SyntheticRepositoryTests(unittest.TestCase):
+    def test_generated_repository_passes_every_mode_and_routes_every_doc(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            file_count, error = generate_repository(root, TINY)
+            request = {"repo_root": temp, "governance_root": temp}
+            results = {mode: run_checks({**request, "mode": mode}) for mode in ("full", "docs", "project_docs")}
+            documents = resolve_documents(request)
+            python_files = len(list((root / "scripts").rglob("*.py")))
+
+        self.assertIsNone(error)
+        self.assertGreater(file_count, TINY.routed_docs + TINY.python_files + TINY.tracked_paths)
+        for mode, result in results.items():
+            self.assertEqual("PASSED", result["status"], (mode, result["errors"]))
+        self.assertEqual("PASSED", documents["status"], documents)
+        topic_docs = [path for path in documents["documents"] if path.startswith("docs/agents/topic/")]
+        self.assertEqual(TINY.routed_docs, len(topic_docs))
+        self.assertEqual(TINY.python_files, python_files)
+
+    def test_rejects_invalid_shapes_and_non_empty_roots(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            (root / "existing.txt").touch()
+            self.assertEqual(
+                (0, "router_depth must be a positive integer"),
+                generate_repository(root, SyntheticProfile(router_depth=0)),
+            )
+            self.assertEqual((0, f"synthetic repository root must be empty: {root}"), generate_repository(root, TINY))
+
+    def test_run_records_every_case_with_timings_and_peak_memory(self) -> None:
+        payload, error = run_benchmarks({"tiny": TINY}, repeats=1)
+
+        self.assertIsNone(error)
+        assert payload is not None
+        cases = [item["case"] for item in payload["results"]]
+        self.assertEqual(["run_checks:full", "run_checks:docs", "run_checks:project_docs", "resolve_documents"], cases)
+        for item in payload["results"]:
+            self.assertEqual("PASSED", item["status"])
+            self.assertGreater(item["wall_seconds"]["median"], 0)
+            self.assertGreater(item["peak_bytes"], 0)
+        json.dumps(payload)
+
+
+def _result(case: str, seconds: float, peak: int, status: str = "PASSED") -> dict[str, object]:
+    return {
+        "profile": "small",
+        "case": case,
+        "shape": {"routed_docs": 1},
+        "status": status,
+        "wall_seconds": {"min": seconds, "median": seconds, "max": seconds},
+        "peak_bytes": peak,
+    }
+
+
+class CompareTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.baseline = {
+            "version": 1,
+            "python": "3.11",
+            "machine": "x86_64",
+            "cpus": 4,
+            "results": [_result("run_checks:full", 0.100, 4_000_000), _result("resolve_documents", 0.001, 10_000)],
+        }
+
+    def test_flags_slowdowns_memory_growth_status_changes_and_missing_cases(self) -> None:
+        current = copy.deepcopy(self.baseline)
+        current["results"] = [_result("run_checks:full", 0.200, 9_000_000, status="FAILED")]
+
+        regressions, notes = compare_benchmarks(self.baseline, current)
+
+        self.assertEqual(
+            [
+                "small/run_checks:full: status PASSED -> FAILED",
+                "small/run_checks:full: median wall 100.0ms -> 200.0ms (+100%)",
+                "small/run_checks:full: peak memory 4,000,000 -> 9,000,000 bytes",
+                "small/resolve_documents: missing from current results",
+            ],
+            regressions,
+        )
+        self.assertEqual([], notes)
+
+    def test_ignores_noise_below_tolerance_and_absolute_floors(self) -> None:
+        current = copy.deepcopy(self.baseline)
+        current["cpus"] = 8
+        current["results"] = [_result("run_checks:full", 0.120, 4_100_000), _result("resolve_documents", 0.003, 60_000)]
+
+        regressions, notes = compare_benchmarks(self.baseline, current)
+
+        self.assertEqual([], regressions)
+        self.assertEqual(["cpus differs: 4 -> 8"], notes)
+
+    def test_cli_compare_exits_nonzero_on_regression(self) -> None:
+        current = copy.deepcopy(self.baseline)
+        current["results"][0]["wall_seconds"]["median"] = 1.0
+        with tempfile.TemporaryDirectory() as temp:
+            baseline_path = Path(temp) / "baseline.json"
+            current_path = Path(temp) / "current.json"
+            for path, payload in ((baseline_path, self.baseline), (current_path, current)):
+                with path.open("w", encoding="utf-8") as handle:
+                    json.dump(payload, handle)
+            stdout = io.StringIO()
+            check_governance_core_main._configure_logging()
+            with patch.object(check_governance_core_main, "_configure_logging"), patch.object(
+                check_governance_core_main.logger.handlers[0], "stream", stdout
+            ):
+                status = check_governance_core_main.main(
+                    ["benchmark", "compare", str(baseline_path), str(current_path)]
+                )
+
+        self.assertEqual(1, status)
+        self.assertIn("REGRESSION: small/run_checks:full: median wall 100.0ms -> 1000.0ms", stdout.getvalue())
+        self.assertIn("Benchmark comparison: FAILED", stdout.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
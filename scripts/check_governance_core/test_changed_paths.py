@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.check_governance_core.check_governance_core_main import run_checks
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+def _fixture(root: Path) -> None:
+    _write(root / "AGENTS.md", "# Agent\n")
+    _write(root / "agents-manifest.yaml", "version: 2\n")
+    _write(root / "docs/docs_index.md", "# Docs\n\n- [Alpha](alpha/alpha_index.md)\n- [Beta](beta/beta_index.md)\n")
+    _write(root / "docs/alpha/alpha_index.md", "# Alpha\n\n- [Alpha](alpha.md)\n")
+    _write(root / "docs/alpha/alpha.md", "---\ndoc_type: guide\nssot_owner: AGENTS.md\nupdate_trigger: x\n---\n")
+    _write(root / "docs/beta/beta_index.md", "# Beta\n")
+    _write(root / "docs/beta/beta.md", "---\ndoc_type: guide\nssot_owner: AGENTS.md\nupdate_trigger: x\n---\n")
+    _write(root / "scripts/tool/tool_main.py", "VALUE = 1\n")
+    _write(root / "scripts/tool/noisy.py", "print('x')\n")
+
+
+class ChangedPathTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp.cleanup)
+        self.root = Path(self._temp.name)
+        _fixture(self.root)
+        self.request = {"repo_root": str(self.root), "governance_root": str(self.root)}
+
+    def test_python_change_skips_docs_checks_and_scans_only_changed_files(self) -> None:
+        full = run_checks(self.request)
+        changed = run_checks({**self.request, "changed_paths": ["scripts/tool/tool_main.py"]})
+
+        self.assertTrue(any("noisy.py" in error for error in full["errors"]), full)
+        self.assertFalse(any("noisy.py" in error for error in changed["errors"]), changed)
+        self.assertEqual(["docs", "project_docs"], changed["skipped"])
+        self.assertNotIn("docs", changed["eligible"])
+        self.assertEqual(
+            sorted(changed["planned"]),
+            sorted([*changed["executed"], *changed["skipped"], *changed["failed"]]),
+        )
+        records = {record["id"]: record for record in changed["checks"]}
+        self.assertEqual("SKIPPED", records["docs"]["status"])
+
+    def test_docs_change_checks_only_routers_above_the_edited_document(self) -> None:
+        full = run_checks({**self.request, "mode": "docs"})
+        changed = run_checks({**self.request, "mode": "docs", "changed_paths": ["docs/alpha/alpha.md"]})
+
+        self.assertTrue(any("beta_index.md" in error for error in full["errors"]), full)
+        self.assertFalse(any("beta" in error for error in changed["errors"]), changed)
+        self.assertEqual(["docs"], changed["eligible"])
+
+    def test_unrelated_change_skips_everything_in_narrow_mode(self) -> None:
+        result = run_checks({**self.request, "mode": "docs", "changed_paths": ["scripts/tool/noisy.py"]})
+
+        self.assertEqual("PASSED", result["status"], result)
+        self.assertEqual(["docs"], result["skipped"])
+        self.assertEqual([], result["eligible"])
+
+    def test_rejects_paths_outside_the_repository_and_malformed_ranges(self) -> None:
+        outside = run_checks({**self.request, "changed_paths": ["../elsewhere.md"]})
+        self.assertEqual("FAILED_VALIDATION", outside["status"], outside)
+        self.assertEqual(["changed path is outside repo_root: ../elsewhere.md"], outside["errors"])
+        for revision_range in ("main", "--output=x..HEAD", "a.. b", ""):
+            with self.subTest(revision_range=revision_range):
+                result = run_checks({**self.request, "revision_range": revision_range})
+                self.assertEqual(["revision_range must be a base..head string"], result["errors"])
+
+    @unittest.skipIf(shutil.which("git") is None, "git is not installed")
+    def test_revision_range_selects_paths_from_git_diff(self) -> None:
+        def git(*arguments: str) -> None:
+            subprocess.run(
+                ["git", "-c", "user.name=test", "-c", "user.email=test@example.invalid", *arguments],
+                cwd=self.root,
+                check=True,
+                capture_output=True,
+                timeout=30,
+            )
+
+        git("init", "-q")
+        git("add", "-A")
+        git("commit", "-q", "-m", "base")
+        _write(self.root / "scripts/tool/tool_main.py", "VALUE = 2\n")
+        git("commit", "-q", "-am", "edit")
+
+        result = run_checks({**self.request, "revision_range": "HEAD~1..HEAD"})
+
+        self.assertEqual(["docs", "project_docs"], result["skipped"], result)
+        self.assertFalse(any("noisy.py" in error for error in result["errors"]), result)
+        self.assertTrue(any("noisy.py" in error for error in run_checks(self.request)["errors"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
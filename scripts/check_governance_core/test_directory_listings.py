@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import _directory_listings
+from scripts.check_governance_core._documents import resolve_declared_file
+from scripts.check_governance_core._inventory import RepositoryInventory
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+class DirectoryListingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = Path(temp.name).resolve()
+        for relative in ("AGENTS.md", "README.md", "docs/a.md", "docs/b.md", "real/c.md"):
+            _write(self.root / relative, "# x\n")
+        (self.root / "linked").symlink_to(self.root / "real", target_is_directory=True)
+        (self.root / "alias.md").symlink_to(self.root / "README.md")
+
+    def test_each_directory_is_listed_once_per_run_across_lookups(self) -> None:
+        inventory = RepositoryInventory(self.root)
+        with patch.object(_directory_listings, "_list", wraps=_directory_listings._list) as listed:
+            validated = [inventory.validate_file(self.root / name) for name in ("AGENTS.md", "README.md")]
+            resolved = [
+                resolve_declared_file(self.root, value, inventory)
+                for value in ("docs/a.md", "docs/b.md", "docs/a.md")
+            ]
+
+        self.assertEqual([(self.root / "AGENTS.md", None), (self.root / "README.md", None)], validated)
+        self.assertEqual([self.root / "docs/a.md", self.root / "docs/b.md", self.root / "docs/a.md"],
+                         [path for path, _error in resolved])
+        self.assertEqual([self.root, self.root / "docs"], [call.args[0] for call in listed.call_args_list])
+
+    def test_spelling_and_alias_errors_are_unchanged(self) -> None:
+        inventory = RepositoryInventory(self.root)
+
+        self.assertEqual(
+            (None, "declared path is missing or has non-canonical spelling: Docs/a.md"),
+            resolve_declared_file(self.root, "Docs/a.md", inventory),
+        )
+        self.assertEqual(
+            (None, "declared path must not traverse a symlink: linked/c.md"),
+            resolve_declared_file(self.root, "linked/c.md", inventory),
+        )
+        self.assertEqual(
+            (None, f"Repository file is missing or noncanonical: {self.root / 'readme.md'}"),
+            inventory.validate_file(self.root / "readme.md"),
+        )
+        self.assertEqual(
+            (None, f"Repository file must not be an alias: {self.root / 'alias.md'}"),
+            inventory.validate_file(self.root / "alias.md"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
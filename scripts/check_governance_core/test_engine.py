@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import _documents, _engine, _execution, check_governance_core_main
+from scripts.check_governance_core._manifest import parse_manifest
+from scripts.check_governance_core._parse_memo import ParseMemo, parse_memo
+from scripts.check_governance_core._plan import CheckInputs, plan_inputs
+from scripts.check_governance_core._synthetic_repo import SyntheticProfile, generate_repository
+from scripts.check_governance_core.check_governance_core_main import run_checks, run_checks_many
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class ConcurrentExecutionTests(unittest.TestCase):
+    def test_concurrent_run_matches_sequential_run(self) -> None:
+        request = {"repo_root": str(REPO_ROOT), "governance_root": str(REPO_ROOT)}
+        sequential = run_checks(request)
+        concurrent = run_checks({**request, "workers": 4})
+
+        self.assertEqual(sequential, concurrent)
+        self.assertEqual(
+            ["governance", "manifest", "docs", "project_docs", "repository", "folder_architecture", "python_safety"],
+            [record["id"] for record in concurrent["checks"]],
+        )
+
+    def test_concurrent_handler_exception_keeps_registry_order(self) -> None:
+        with patch("scripts.check_governance_core._engine.validate_manifest", side_effect=RuntimeError("boom")):
+            result = run_checks({"repo_root": str(REPO_ROOT), "governance_root": str(REPO_ROOT), "workers": 3})
+
+        manifest = result["checks"][1]
+        self.assertEqual("manifest", manifest["id"])
+        self.assertEqual(["manifest check failed unexpectedly: RuntimeError: boom"], manifest["errors"])
+        self.assertEqual(result["planned"], [record["id"] for record in result["checks"]])
+        self.assertIn("manifest", result["failed"])
+
+    def test_rejects_invalid_worker_counts(self) -> None:
+        for workers in (0, -1, True, 1.5, "2"):
+            with self.subTest(workers=workers):
+                result = run_checks({"workers": workers})
+                self.assertEqual("FAILED_VALIDATION", result["status"], result)
+                self.assertEqual(["workers must be a positive integer"], result["errors"])
+
+
+class MetricsTests(unittest.TestCase):
+    def test_metrics_are_opt_in(self) -> None:
+        result = run_checks({"repo_root": str(REPO_ROOT), "governance_root": str(REPO_ROOT), "mode": "docs"})
+
+        self.assertNotIn("metrics", result)
+        self.assertNotIn("metrics", result["checks"][0])
+
+    def test_metrics_attribute_io_and_cache_use_to_each_check(self) -> None:
+        result = run_checks(
+            {"repo_root": str(REPO_ROOT), "governance_root": str(REPO_ROOT), "metrics": True, "workers": 2}
+        )
+        records = {record["id"]: record["metrics"] for record in result["checks"]}
+        totals = result["metrics"]
+
+        self.assertEqual(2, totals["git_invocations"])
+        git_calls = {key: metrics["git_invocations"] for key, metrics in records.items() if metrics["git_invocations"]}
+        self.assertEqual({"repository": 1}, git_calls)
+        self.assertGreater(records["repository"]["inventory_cache_hits"], 0)
+        self.assertGreater(records["python_safety"]["files_read"], 0)
+        self.assertGreater(records["python_safety"]["bytes_read"], 0)
+        self.assertGreater(records["docs"]["document_cache_misses"], 0)
+        self.assertGreater(records["project_docs"]["inventory_cache_hits"], 0)
+        for counter in ("files_read", "bytes_read", "git_invocations", "document_cache_misses"):
+            self.assertGreaterEqual(totals[counter], sum(metrics[counter] for metrics in records.values()))
+        self.assertGreaterEqual(totals["wall_seconds"], max(metrics["wall_seconds"] for metrics in records.values()))
+
+    def test_cli_profile_prints_one_row_per_check_and_a_total(self) -> None:
+        stdout = io.StringIO()
+        with patch.object(check_governance_core_main.sys, "stdout", stdout):
+            check_governance_core_main.main(
+                ["--repo-root", str(REPO_ROOT), "--governance-root", str(REPO_ROOT), "--only-docs-ssot", "--profile"]
+            )
+
+        lines = stdout.getvalue().splitlines()
+        header = next(index for index, line in enumerate(lines) if line.startswith("check "))
+        self.assertIn("wall_ms", lines[header])
+        self.assertTrue(lines[header + 1].startswith("docs "))
+        self.assertTrue(lines[header + 2].startswith("total "))
+
+
+class InputPlanTests(unittest.TestCase):
+    def test_modes_are_derived_from_registry_declarations(self) -> None:
+        self.assertEqual(
+            {
+                "full": tuple(spec.check_id for spec in _engine.CHECK_REGISTRY),
+                "docs": ("docs",),
+                "project_docs": ("project_docs",),
+            },
+            _engine.MODE_CHECKS,
+        )
+
+    def test_plan_deduplicates_inputs_and_orders_ancestors_first(self) -> None:
+        root = Path("/repo")
+        plan = plan_inputs(
+            [
+                CheckInputs(trees=(root / "docs",), families=((root / "docs", ".md"),), contract=False),
+                CheckInputs(trees=(root, root / "docs"), families=((root, ".py"),), contract=True),
+            ]
+        )
+
+        self.assertEqual((root, root / "docs"), plan.trees)
+        self.assertEqual(((root, ".py"), (root / "docs", ".md")), plan.families)
+        self.assertTrue(plan.contract)
+
+    def test_vendored_governance_layout_lists_each_directory_once(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            profile = SyntheticProfile(routed_docs=4, router_depth=1, router_fanout=2, python_files=2)
+            generate_repository(root, profile)
+            generate_repository(root / ".governance", profile)
+            directories = sum(1 for current, _dirs, _files in os.walk(root) if ".git" not in Path(current).parts)
+            result = run_checks({"repo_root": temp, "governance_root": str(root / ".governance"), "metrics": True})
+
+        self.assertEqual(directories, result["metrics"]["tree_scandir_calls"])
+
+    def test_narrow_mode_loads_only_what_its_check_declares(self) -> None:
+        with patch.object(_execution, "resolve_governance_contract") as contract, patch.object(
+            _engine.RepositoryInventory, "tracked_paths"
+        ) as tracked:
+            result = run_checks({"repo_root": str(REPO_ROOT), "governance_root": str(REPO_ROOT), "mode": "docs"})
+
+        self.assertEqual(["docs"], result["planned"])
+        contract.assert_not_called()
+        tracked.assert_not_called()
+
+
+def _small_repository(root: Path) -> None:
+    for relative, text in (
+        ("AGENTS.md", "# Agent\n\n## Assigned-Lead Authority Routing Procedure (Hard Gate)\n\n> Delegate.\n"),
+        ("agents-manifest.yaml", "version: 2\n"),
+        ("docs/docs_index.md", "# Docs\n"),
+    ):
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8", newline="") as handle:
+            handle.write(text)
+
+
+class BatchTests(unittest.TestCase):
+    def test_results_follow_input_order_and_match_single_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            requests: list[object] = []
+            for name in ("first", "second", "third"):
+                root = Path(temp) / name
+                _small_repository(root)
+                requests.append({"repo_root": str(root), "governance_root": str(root)})
+            requests.insert(1, "not a mapping")
+            requests.append({"mode": "unknown"})
+
+            batch = run_checks_many(requests, workers=2)  # type: ignore[arg-type]
+            single = [run_checks(request) for request in requests]  # type: ignore[arg-type]
+
+        self.assertEqual(single, batch)
+        self.assertEqual(["request must be a mapping"], batch[1]["errors"])
+
+    def test_shared_governance_content_is_parsed_once(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            requests = []
+            for name in ("first", "second", "third"):
+                root = Path(temp) / name
+                _small_repository(root)
+                requests.append({"repo_root": str(root), "governance_root": str(root)})
+            with patch.object(_documents, "_parse_markdown", wraps=_documents._parse_markdown) as parse:
+                run_checks_many(requests[:1])
+                one_repository = parse.call_count
+                parse.reset_mock()
+                run_checks_many(requests)
+                batch = parse.call_count
+                parse.reset_mock()
+                run_checks(requests[0])
+
+        self.assertEqual(one_repository, batch)
+        self.assertEqual(one_repository, parse.call_count)
+
+    def test_memoized_manifest_is_owned_by_each_caller(self) -> None:
+        text = "version: 2\nfallback_authorities:\n  - docs\n"
+        with parse_memo() as memo:
+            first = parse_manifest(text)
+            first["fallback_authorities"].append("mutated")
+            second = parse_manifest(text)
+
+        self.assertEqual(["docs"], second["fallback_authorities"])
+        self.assertEqual(1, memo.misses)
+
+    def test_parse_memo_evicts_least_recent_texts_past_its_byte_budget(self) -> None:
+        texts = ["a" * 1000, "b" * 1000, "c" * 1000]
+        memo = ParseMemo(max_bytes=2 * sys.getsizeof(texts[0]))
+        for text in (*texts[:2], texts[0], texts[2], texts[0], texts[1]):
+            memo.get("markdown", text, len)
+
+        self.assertEqual(4, memo.misses)
+        self.assertLessEqual(memo.held_bytes, memo.max_bytes)
+
+    def test_batch_order_reads_only_valid_bounded_governance_files(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            _small_repository(root / "small")
+            _small_repository(root / "device")
+            (root / "device/AGENTS.md").unlink()
+            (root / "device/AGENTS.md").symlink_to(os.devnull)
+            _small_repository(root / "large")
+            with (root / "large/AGENTS.md").open("ab") as handle:
+                handle.write(b"x" * (check_governance_core_main.MAX_GOVERNANCE_KEY_BYTES + 1))
+            key = check_governance_core_main._governance_key
+            keys = {name: key({"governance_root": str(root / name)}) for name in ("small", "device", "large")}
+            invalid = key({"governance_root": str(root / "small"), "workers": 0})
+
+        self.assertTrue(keys["small"].startswith("content:"))
+        self.assertEqual(f"path:{root / 'device'}", keys["device"])
+        self.assertEqual(f"path:{root / 'large'}", keys["large"])
+        self.assertEqual("", invalid)
+
+    def test_rejects_invalid_batch_arguments(self) -> None:
+        self.assertEqual(
+            ["requests must be a sequence of request mappings"],
+            run_checks_many({"repo_root": "."})[0]["errors"],  # type: ignore[arg-type]
+        )
+        for result in run_checks_many([{}, {}], workers=0):
+            self.assertEqual("FAILED_VALIDATION", result["status"])
+            self.assertEqual(["workers must be a positive integer"], result["errors"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path, PurePosixPath
+
+from scripts.check_governance_core._entry_table import (
+    ALIAS,
+    DIRECTORY,
+    EntryTable,
+    InventoryEntry,
+    relative_key,
+    suffix_of,
+)
+from scripts.check_governance_core._inventory import RepositoryInventory
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+class EntryTableTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = Path("/repo")
+        rows = [
+            ("docs", DIRECTORY, 0, 11, 12),
+            ("docs/a", DIRECTORY, 0, 21, 22),
+            ("docs/a/x.md", 0, 5, 0, 0),
+            ("docs/b.md", ALIAS, 7, 0, 0),
+            ("top.py", 0, 9, 0, 0),
+        ]
+        self.assertEqual(rows, sorted(rows, key=lambda row: relative_key(row[0])))
+        self.table = EntryTable.from_rows(self.root, rows)
+
+    def test_items_are_built_on_demand_as_inventory_entries(self) -> None:
+        self.assertEqual(5, len(self.table))
+        self.assertEqual(InventoryEntry(self.root / "docs", True, False, 0, 11, 12), self.table[0])
+        self.assertEqual(InventoryEntry(self.root / "docs/b.md", False, True, 7), self.table[-2])
+        self.assertEqual(tuple(self.table), tuple(self.table[position] for position in range(5)))
+        self.assertEqual(tuple(self.table)[1:3], self.table[1:3])
+        self.assertEqual(tuple(self.table)[::2], self.table[::2])
+        with self.assertRaises(IndexError):
+            self.table[5]
+
+    def test_subtrees_are_rerooted_views_over_the_same_columns(self) -> None:
+        docs = self.table.subtree("docs")
+        nested = docs.subtree("a")
+
+        self.assertEqual(tuple(self.table)[1:4], docs)
+        self.assertEqual(["a", "a/x.md", "b.md"], [row[0] for row in docs.rows()])
+        self.assertEqual((self.table[2],), nested)
+        self.assertEqual(EntryTable.from_rows(self.root / "docs/a", [("x.md", 0, 5, 0, 0)]), nested)
+        self.assertEqual(2, docs.position("b.md"))
+        self.assertIsNone(docs.position("missing.md"))
+        self.assertEqual((), self.table.subtree("top.py"))
+        self.assertEqual({"": [0, 2], "a": [1]}, {key: list(value) for key, value in docs.listings().items()})
+
+    def test_joined_parts_are_rerooted_and_copied_by_column(self) -> None:
+        head = EntryTable.from_rows(self.root, list(self.table.rows())[:1])
+        tail = EntryTable.from_rows(self.root, list(self.table.rows())[4:])
+
+        joined = EntryTable.joined(self.root, [("", head), ("docs/", self.table.subtree("docs")), ("", tail)])
+
+        self.assertEqual(self.table, joined)
+        self.assertIsNot(self.table._columns, joined._columns)
+
+    def test_suffix_matches_path_suffix(self) -> None:
+        for relative in ("a/b.MD", "a.tar.gz", ".md", "a.", "dir.d/name", "a/.hidden.py"):
+            with self.subTest(relative=relative):
+                self.assertEqual(PurePosixPath(relative).suffix.lower(), suffix_of(relative))
+
+    def test_inventory_serves_descendants_as_views_of_one_table(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp).resolve()
+            for relative in ("docs/a/x.md", "docs/b.md", "other.md"):
+                _write(root / relative, "# x\n")
+            inventory = RepositoryInventory(root)
+            tree, _error = inventory.tree_entries(root)
+            docs, docs_error = inventory.tree_entries(root / "docs")
+
+        self.assertIsNone(docs_error)
+        self.assertIs(tree._columns, docs._columns)
+        self.assertEqual([entry for entry in tree if root / "docs" in entry.path.parents], list(docs))
+
+
+if __name__ == "__main__":
+    unittest.main()
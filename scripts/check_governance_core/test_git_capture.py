@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import mmap
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import _git_capture
+from scripts.check_governance_core._inventory import RepositoryInventory
+
+
+def _child(source: str) -> list[str]:
+    return [sys.executable, "-c", source]
+
+
+@unittest.skipUnless(_git_capture.SELECTABLE_PIPES, "pipes are not selectable on this platform")
+class SelectedCaptureTests(unittest.TestCase):
+    def test_capture_reads_both_pipes_on_the_calling_thread(self) -> None:
+        source = "import sys; sys.stdout.write('out' * 50000); sys.stderr.write('err'); sys.exit(3)"
+        with patch.object(_git_capture.threading, "Thread", side_effect=AssertionError("reader thread started")):
+            stdout, stderr, returncode, error = _git_capture.bounded_capture(_child(source), label="tracked files")
+
+        self.assertIsNone(error)
+        self.assertEqual(b"out" * 50000, stdout)
+        self.assertEqual(b"err", stderr)
+        self.assertEqual(3, returncode)
+
+    def test_capture_never_reads_beyond_its_cap_and_reaps_the_child(self) -> None:
+        real_read = os.read
+        consumed: list[int] = []
+
+        def read(fd: int, size: int) -> bytes:
+            chunk = real_read(fd, size)
+            consumed.append(len(chunk))
+            return chunk
+
+        source = "import sys, time; sys.stdout.write('x' * 100); sys.stdout.flush(); time.sleep(30)"
+        with patch.object(_git_capture, "MAX_STDOUT_BYTES", 10), patch.object(_git_capture.os, "read", read):
+            stdout, _stderr, returncode, error = _git_capture.bounded_capture(_child(source), label="tracked files")
+
+        self.assertEqual("Git inventory stdout exceeded 10 bytes", error)
+        self.assertEqual(b"x" * 10, stdout)
+        self.assertIsNotNone(returncode)
+        self.assertEqual(11, sum(consumed))
+
+    def test_deadline_kills_a_silent_child_without_waiting_for_it(self) -> None:
+        started = time.monotonic()
+        with patch.object(_git_capture, "TIMEOUT_SECONDS", 0.2):
+            _stdout, _stderr, returncode, error = _git_capture.bounded_capture(
+                _child("import time; time.sleep(30)"), label="tracked files"
+            )
+
+        self.assertLess(time.monotonic() - started, 10.0)
+        self.assertEqual("Unable to enumerate tracked files with git ls-files: timed out after 0.2 seconds", error)
+        self.assertIsNotNone(returncode)
+
+    def test_cleanup_failures_are_appended_and_pipes_are_still_closed(self) -> None:
+        pipes = [os.pipe(), os.pipe()]
+        self.addCleanup(lambda: [os.close(write) for _read, write in pipes])
+        os.write(pipes[0][1], b"overflow")
+
+        class Process:
+            def __init__(self) -> None:
+                self.stdout = os.fdopen(pipes[0][0], "rb", buffering=0)
+                self.stderr = os.fdopen(pipes[1][0], "rb", buffering=0)
+                self.returncode = None
+
+            def poll(self) -> None:
+                return None
+
+            def kill(self) -> None:
+                raise OSError("kill denied")
+
+            def wait(self, *, timeout: float) -> None:
+                raise subprocess.TimeoutExpired("git", timeout)
+
+        process = Process()
+        with patch.object(_git_capture, "MAX_STDOUT_BYTES", 1), patch.object(
+            _git_capture, "CLEANUP_SECONDS", 0.01
+        ), patch.object(_git_capture.subprocess, "Popen", return_value=process):
+            _stdout, _stderr, _returncode, error = _git_capture.bounded_capture(["git"], label="tracked files")
+
+        self.assertEqual(
+            "Git inventory stdout exceeded 1 bytes; cleanup also failed: kill failed: kill denied; "
+            "reap failed: Command 'git' timed out after 0.01 seconds",
+            error,
+        )
+        self.assertTrue(process.stdout.closed)
+        self.assertTrue(process.stderr.closed)
+
+
+class StreamedRecordTests(unittest.TestCase):
+    SOURCE = "import sys; [sys.stdout.write(f'path{index:05d}\\0') for index in range(2000)]; sys.stdout.write('tail')"
+
+    def test_records_reach_the_consumer_without_a_total_output_cap(self) -> None:
+        for selectable in (True, False) if _git_capture.SELECTABLE_PIPES else (False,):
+            records: list[bytes] = []
+            with self.subTest(selectable=selectable), patch.object(
+                _git_capture, "SELECTABLE_PIPES", selectable
+            ), patch.object(_git_capture, "MAX_STDOUT_BYTES", 4):
+                _stderr, returncode, error = _git_capture.stream_records(
+                    _child(self.SOURCE), label="tracked files", consume=records.append
+                )
+
+                self.assertIsNone(error)
+                self.assertEqual(0, returncode)
+                self.assertEqual([f"path{index:05d}".encode() for index in range(2000)] + [b"tail"], records)
+
+    def test_one_oversized_record_fails_the_stream(self) -> None:
+        records: list[bytes] = []
+        with patch.object(_git_capture, "MAX_RECORD_BYTES", 8):
+            _stderr, _returncode, error = _git_capture.stream_records(
+                _child("import sys; sys.stdout.write('short\\0' + 'x' * 100)"),
+                label="tracked files",
+                consume=records.append,
+            )
+
+        self.assertEqual("Git inventory stdout record exceeded 8 bytes", error)
+        self.assertEqual([b"short"], records)
+
+
+class SpilledCaptureTests(unittest.TestCase):
+    SOURCE = "import sys; sys.stdout.write('0123456789' * 10000)"
+
+    def test_output_past_the_memory_limit_is_mapped_back_from_an_unnamed_file(self) -> None:
+        for selectable in (True, False) if _git_capture.SELECTABLE_PIPES else (False,):
+            with self.subTest(selectable=selectable), patch.object(
+                _git_capture, "SELECTABLE_PIPES", selectable
+            ), patch.object(_git_capture, "MAX_STDOUT_BYTES", 10):
+                with _git_capture.spilled_capture(_child(self.SOURCE), label="index entries") as captured:
+                    stdout, _stderr, returncode, error = captured
+                    self.assertIsInstance(stdout, mmap.mmap)
+                    self.assertEqual(b"0123456789" * 10000, stdout[:])
+                self.assertIsNone(error)
+                self.assertEqual(0, returncode)
+                self.assertTrue(stdout.closed)
+
+    def test_output_within_the_memory_limit_is_not_spilled(self) -> None:
+        with patch.object(_git_capture.tempfile, "TemporaryFile", side_effect=AssertionError("spilled")):
+            with _git_capture.spilled_capture(_child(self.SOURCE), label="index entries") as captured:
+                self.assertEqual((b"0123456789" * 10000, b"", 0, None), captured)
+
+    def test_spilled_output_stops_at_the_disk_limit(self) -> None:
+        with patch.object(_git_capture, "MAX_STDOUT_BYTES", 10), patch.object(_git_capture, "MAX_SPILL_BYTES", 50):
+            with _git_capture.spilled_capture(_child(self.SOURCE), label="index entries") as captured:
+                stdout, _stderr, returncode, error = captured
+
+        self.assertEqual(b"", stdout)
+        self.assertIsNotNone(returncode)
+        self.assertEqual("Git inventory stdout exceeded 50 bytes", error)
+
+
+def _git(root: Path, *arguments: str) -> None:
+    subprocess.run(["git", "-C", str(root), *arguments], check=True, capture_output=True, timeout=60)
+
+
+@unittest.skipIf(shutil.which("git") is None, "git is unavailable")
+class StreamedTrackedPathTests(unittest.TestCase):
+    def test_tracked_paths_stream_in_git_order_with_a_digest_of_the_stream(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp).resolve()
+            _git(root, "init", "-q")
+            for relative in ("b.txt", "A.txt", "dir/c.txt"):
+                (root / relative).parent.mkdir(parents=True, exist_ok=True)
+                with (root / relative).open("w", encoding="utf-8") as handle:
+                    handle.write("x\n")
+            _git(root, "add", "-A")
+            inventory = RepositoryInventory(root)
+            streamed: list[str] = []
+            with patch.object(_git_capture, "MAX_STDOUT_BYTES", 1):
+                digest, error = inventory.stream_tracked(root, streamed.append)
+                again, _again_error = inventory.stream_tracked(root, lambda _path: None)
+                _git(root, "rm", "-q", "--cached", "b.txt")
+                changed, _changed_error = inventory.stream_tracked(root, lambda _path: None)
+
+        self.assertIsNone(error)
+        self.assertEqual(["A.txt", "b.txt", "dir/c.txt"], streamed)
+        self.assertEqual(digest, again)
+        self.assertNotEqual(digest, changed)
+
+
+if __name__ == "__main__":
+    unittest.main()
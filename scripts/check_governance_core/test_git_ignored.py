@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import _inventory
+from scripts.check_governance_core._git_ignored import ignored_directories, pruning_report
+from scripts.check_governance_core._inventory import RepositoryInventory
+from scripts.check_governance_core._synthetic_repo import SyntheticProfile, generate_repository
+from scripts.check_governance_core.check_governance_core_main import run_checks
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+def _git(root: Path, *arguments: str) -> None:
+    subprocess.run(["git", "-C", str(root), *arguments], check=True, capture_output=True, timeout=60)
+
+
+def _relatives(inventory: RepositoryInventory, root: Path) -> list[str]:
+    entries, error = inventory.tree_entries(root)
+    if error:
+        raise AssertionError(error)
+    return [entry.path.relative_to(root).as_posix() for entry in entries]
+
+
+@unittest.skipIf(shutil.which("git") is None, "git is not installed")
+class GitIgnoredPruningTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = Path(temp.name).resolve()
+        _write(self.root / ".gitignore", "node_modules/\nbuild/\n*.log\n")
+        for relative in ("docs/a.md", "web/build/keep.md", "web/src/app.py"):
+            _write(self.root / relative, f"{relative}\n")
+        _git(self.root, "init", "-q")
+        _git(self.root, "add", "-A")
+        _git(self.root, "add", "-f", "web/build/keep.md")
+        for index in range(40):
+            _write(self.root / f"node_modules/pkg{index}/index.js", "x\n")
+        for relative in ("build/out.md", "web/build/generated.md", "web/src/debug.log", "scratch/new.md"):
+            _write(self.root / relative, f"{relative}\n")
+
+    def test_walk_skips_ignored_directories_but_keeps_tracked_and_unignored_content(self) -> None:
+        full = _relatives(RepositoryInventory(self.root), self.root)
+        inventory = RepositoryInventory(self.root, prune_ignored=True)
+        pruned = _relatives(inventory, self.root)
+        web = _relatives(RepositoryInventory(self.root, prune_ignored=True), self.root / "web")
+
+        self.assertEqual((("build", "node_modules"), None), ignored_directories(self.root))
+        self.assertIn("node_modules/pkg0/index.js", full)
+        self.assertEqual([path for path in full if not path.startswith(("build", "node_modules"))], pruned)
+        self.assertIn("web/build/keep.md", pruned)
+        self.assertIn("web/build/generated.md", pruned)
+        self.assertIn("scratch/new.md", pruned)
+        self.assertIn("src/app.py", web)
+        self.assertEqual(
+            "Repository tree walks pruned 2 Git-ignored directories: build/, node_modules/",
+            inventory.ignored.report() if inventory.ignored is not None else None,
+        )
+
+    def test_pruning_keeps_a_large_ignored_directory_inside_the_entry_budget(self) -> None:
+        with patch.object(_inventory, "MAX_VISITED_ENTRIES", 40):
+            _entries, unpruned_error = RepositoryInventory(self.root).tree_entries(self.root)
+            _entries, pruned_error = RepositoryInventory(self.root, prune_ignored=True).tree_entries(self.root)
+
+        self.assertIn("exceeded", unpruned_error or "")
+        self.assertIsNone(pruned_error)
+
+    def test_run_reports_pruning_and_rejects_non_boolean_requests(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            generate_repository(root, SyntheticProfile(routed_docs=4, router_depth=1, router_fanout=2, python_files=2))
+            _write(root / ".gitignore", "vendor/\n")
+            _write(root / "vendor/lib/module.py", "def broken(:\n")
+            result = run_checks({"repo_root": temp, "governance_root": temp, "prune_ignored": True})
+            invalid = run_checks({"repo_root": temp, "governance_root": temp, "prune_ignored": "yes"})
+
+        self.assertEqual("PASSED", result["status"], result["errors"])
+        self.assertIn("Repository tree walks pruned 1 Git-ignored directories: vendor/", result["warnings"])
+        self.assertEqual("FAILED_VALIDATION", invalid["status"])
+        self.assertEqual(["prune_ignored must be a boolean"], invalid["errors"])
+
+    def test_roots_outside_a_worktree_are_walked_whole_and_say_so(self) -> None:
+        shutil.rmtree(self.root / ".git")
+        inventory = RepositoryInventory(self.root, prune_ignored=True)
+
+        self.assertIn("node_modules/pkg0/index.js", _relatives(inventory, self.root))
+        self.assertEqual(
+            pruning_report((), f"Git-ignored pruning requires a Git worktree: {self.root}"),
+            inventory.ignored.report() if inventory.ignored is not None else None,
+        )
+
+
+class PruningReportTests(unittest.TestCase):
+    def test_report_names_a_bounded_number_of_directories(self) -> None:
+        report = pruning_report(tuple(f"d{index}" for index in range(7)), None)
+
+        self.assertEqual(
+            "Repository tree walks pruned 7 Git-ignored directories: d0/, d1/, d2/, d3/, d4/ and 2 more", report
+        )
+        self.assertEqual("Repository tree walks pruned 0 Git-ignored directories: none", pruning_report((), None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import _git_capture, _inputs, _result_cache
+from scripts.check_governance_core._git_index import _parse_index, index_entries
+from scripts.check_governance_core._inventory import InventoryEntry, RepositoryInventory
+from scripts.check_governance_core._synthetic_repo import SyntheticProfile, generate_repository
+from scripts.check_governance_core.check_governance_core_main import run_checks
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+def _git(root: Path, *arguments: str) -> None:
+    subprocess.run(["git", "-C", str(root), *arguments], check=True, capture_output=True, timeout=60)
+
+
+def _shape(entries: tuple[InventoryEntry, ...]) -> list[tuple[Path, bool, bool, int]]:
+    return [(entry.path, entry.is_directory, entry.is_symlink, entry.size) for entry in entries]
+
+
+@unittest.skipIf(shutil.which("git") is None, "git is not installed")
+class GitIndexInventoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = Path(temp.name).resolve()
+        for relative in ("docs/A/one.md", "docs/a-b/two.md", "docs/b.md", "src/pkg/mod.py", "data/blob.txt"):
+            _write(self.root / relative, f"{relative}\n")
+        _git(self.root, "init", "-q")
+        _git(self.root, "add", "-A")
+
+    def _entries(self, source: str) -> tuple[tuple[InventoryEntry, ...], str | None]:
+        return RepositoryInventory(self.root, source=source).tree_entries(self.root)
+
+    def test_clean_worktree_index_matches_the_walk_in_order_and_subtrees(self) -> None:
+        walked, walk_error = self._entries("walk")
+        indexed, index_error = self._entries("git_index")
+        inventory = RepositoryInventory(self.root, source="git_index")
+        docs, docs_error = inventory.tree_entries(self.root / "docs")
+
+        self.assertIsNone(walk_error)
+        self.assertIsNone(index_error)
+        self.assertEqual(_shape(walked), _shape(indexed))
+        self.assertEqual(walked, indexed)
+        self.assertIsNotNone(inventory._indexed_tree())
+        self.assertIsNone(docs_error)
+        self.assertEqual([entry for entry in _shape(walked) if self.root / "docs" in entry[0].parents], _shape(docs))
+
+    def test_index_views_are_revalidated_by_directory_stamps(self) -> None:
+        inventory = RepositoryInventory(self.root, source="git_index")
+        for root in (self.root, self.root / "docs"):
+            with self.subTest(root=root):
+                _digest, stamps, files = _inputs.view_fingerprint(inventory, root, None)
+
+                self.assertIsNotNone(inventory._indexed_tree())
+                self.assertTrue(stamps and all(mtime_ns for _relative, mtime_ns in stamps), stamps)
+                self.assertTrue(_result_cache._view_stat_unchanged(root, stamps, files, time.time_ns() + 1))
+
+    def test_index_listing_past_the_memory_limit_is_read_back_from_disk(self) -> None:
+        in_memory = index_entries(self.root, max_entries=100, refreshed_suffixes=frozenset({".md"}))
+        with patch.object(_git_capture, "MAX_STDOUT_BYTES", 300), patch.object(
+            _git_capture.tempfile, "TemporaryFile", wraps=_git_capture.tempfile.TemporaryFile
+        ) as spill:
+            spilled = index_entries(self.root, max_entries=100, refreshed_suffixes=frozenset({".md"}))
+
+        spill.assert_called_once()
+        self.assertIsNotNone(in_memory)
+        self.assertEqual(in_memory, spilled)
+
+    def test_untracked_or_modified_files_fall_back_to_the_walk(self) -> None:
+        _write(self.root / "docs/untracked.md", "new\n")
+        untracked, _error = self._entries("git_index")
+        dirty = RepositoryInventory(self.root, source="git_index")._indexed_tree()
+        _git(self.root, "add", "-A")
+        _write(self.root / "data/blob.txt", "changed and longer\n")
+        modified, _error = self._entries("git_index")
+
+        self.assertIsNone(dirty)
+        self.assertIn(self.root / "docs/untracked.md", [entry.path for entry in untracked])
+        self.assertEqual(_shape(self._entries("walk")[0]), _shape(modified))
+
+    def test_generated_repository_passes_from_the_index(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            generate_repository(root, SyntheticProfile(routed_docs=9, router_depth=2, router_fanout=2, python_files=4))
+            result = run_checks({"repo_root": temp, "governance_root": temp, "inventory_source": "git_index"})
+            invalid = run_checks({"repo_root": temp, "governance_root": temp, "inventory_source": "index"})
+
+        self.assertEqual("PASSED", result["status"], result["errors"])
+        self.assertEqual("FAILED_VALIDATION", invalid["status"])
+        self.assertEqual(["inventory_source must be one of walk, git_index"], invalid["errors"])
+
+
+class ParseIndexTests(unittest.TestCase):
+    def _record(self, mode: str, stage: str, path: str, flags: str = "0") -> bytes:
+        return (
+            f"{mode} {'a' * 40} {stage}\t{path}\0  ctime: 1:0\n  mtime: 1:0\n  dev: 1\tino: 2\n"
+            f"  uid: 0\tgid: 0\n  size: 7\tflags: {flags}\n"
+        ).encode("utf-8")
+
+    def test_parses_regular_entries_with_awkward_names(self) -> None:
+        stdout = self._record("100644", "0", "docs/a b.md") + self._record("100755", "0", "bin/line\nbreak")
+
+        self.assertEqual([("docs/a b.md", 7), ("bin/line\nbreak", 7)], _parse_index(stdout))
+        self.assertEqual([], _parse_index(b""))
+
+    def test_stops_at_the_entry_limit_before_reading_the_rest(self) -> None:
+        first = self._record("100644", "0", "a.md")
+
+        self.assertEqual([("a.md", 7)], _parse_index(first, max_entries=1))
+        self.assertIsNone(_parse_index(first + self._record("100644", "0", "b.md") + b"garbage", max_entries=1))
+
+    def test_rejects_entries_a_walk_would_see_differently(self) -> None:
+        rejected = {
+            "symlink": self._record("120000", "0", "link"),
+            "gitlink": self._record("160000", "0", "vendor/module"),
+            "conflict": self._record("100644", "2", "docs/a.md"),
+            "assume unchanged": self._record("100644", "0", "docs/a.md", flags="8000"),
+            "skip worktree": self._record("100644", "0", "docs/a.md", flags="40004000"),
+            "truncated": self._record("100644", "0", "docs/a.md")[:-3],
+        }
+        for reason, stdout in rejected.items():
+            with self.subTest(reason=reason):
+                self.assertIsNone(_parse_index(stdout))
+
+
+if __name__ == "__main__":
+    unittest.main()
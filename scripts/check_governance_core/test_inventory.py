@@ -47,9 +47,11 @@ class PythonInventoryClassificationTests(unittest.TestCase):
             def wait(self, *, timeout: float) -> int:
                 raise subprocess.TimeoutExpired("git", timeout)
 
-        with patch.object(_git_capture, "TIMEOUT_SECONDS", 0.01), patch.object(
-            _git_capture, "CLEANUP_SECONDS", 0.01
-        ), patch.object(_git_capture.subprocess, "Popen", return_value=Process()):
+        with patch.object(_git_capture, "SELECTABLE_PIPES", False), patch.object(
+            _git_capture, "TIMEOUT_SECONDS", 0.01
+        ), patch.object(_git_capture, "CLEANUP_SECONDS", 0.01), patch.object(
+            _git_capture.subprocess, "Popen", return_value=Process()
+        ):
             started = _git_capture.time.monotonic()
             _stdout, _stderr, _returncode, error = _git_capture.bounded_capture(
                 ["git"], label="tracked files"
@@ -320,5 +322,68 @@ class ScopeAndRepositoryHygieneTests(unittest.TestCase):
         self.assertFalse(any("database/fixture.json" in error for error in errors), errors)
 
 
+class TreeIndexTests(unittest.TestCase):
+    def test_children_and_descendants_follow_snapshot_order(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp).resolve()
+            for relative in ("docs/b.md", "docs/a/a.md", "docs/a/deep/x.md", "docs/c/c.md", "other.md"):
+                _write(root / relative, "# x\n")
+            inventory = RepositoryInventory(root)
+            tree, error = inventory.tree_entries(root)
+            docs = root / "docs"
+
+            children = [entry.path.relative_to(root).as_posix() for entry in inventory.children_of(docs)]
+            descendants = inventory.descendants_of(docs)
+            subtree, subtree_error = inventory.tree_entries(docs)
+
+        self.assertIsNone(error)
+        self.assertEqual(["docs/a", "docs/b.md", "docs/c"], children)
+        self.assertEqual([entry for entry in tree if docs in entry.path.parents], list(descendants))
+        self.assertIsNone(subtree_error)
+        self.assertEqual(descendants, subtree)
+
+    def test_snapshot_is_a_preorder_so_each_subtree_is_one_contiguous_slice(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp).resolve()
+            for relative in ("docs/a/x.md", "docs/a/z/q.md", "docs/a-b/y.md", "docs/a.md", "docs/B.md"):
+                _write(root / relative, "# x\n")
+            inventory = RepositoryInventory(root)
+            tree, _error = inventory.tree_entries(root)
+
+            order = [entry.path.relative_to(root).as_posix() for entry in tree]
+            subtree = [entry.path.relative_to(root).as_posix() for entry in inventory.descendants_of(root / "docs/a")]
+            missing = inventory.descendants_of(root / "docs/a/missing")
+
+        self.assertEqual(
+            [
+                "docs",
+                "docs/a",
+                "docs/a/x.md",
+                "docs/a/z",
+                "docs/a/z/q.md",
+                "docs/a-b",
+                "docs/a-b/y.md",
+                "docs/a.md",
+                "docs/B.md",
+            ],
+            order,
+        )
+        self.assertEqual(["docs/a/x.md", "docs/a/z", "docs/a/z/q.md"], subtree)
+        self.assertEqual((), missing)
+
+    def test_paths_without_a_loaded_snapshot_have_no_children(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp).resolve()
+            _write(root / "docs/a.md", "# a\n")
+            inventory = RepositoryInventory(root)
+
+            self.assertEqual((), inventory.children_of(root / "docs"))
+            inventory.tree_entries(root / "docs")
+
+            self.assertEqual((), inventory.children_of(root))
+            self.assertEqual(["a.md"], [entry.path.name for entry in inventory.children_of(root / "docs")])
+            self.assertEqual((), inventory.descendants_of(root / "docs/a.md"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import _inventory, _path_resolution
+from scripts.check_governance_core._documents import DocumentStore
+from scripts.check_governance_core._inventory import RepositoryInventory
+from scripts.check_governance_core._path_resolution import PathResolutions
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+class PathResolutionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = Path(temp.name).resolve()
+        _write(self.root / "docs/a/x.md", "# x\n")
+        (self.root / "linked").symlink_to(self.root / "docs", target_is_directory=True)
+
+    def test_repeated_scan_roots_and_documents_make_no_syscalls(self) -> None:
+        real_alias_check = _inventory._is_directory_alias
+        with patch.object(_inventory, "_is_directory_alias", wraps=real_alias_check) as alias_check:
+            inventory = RepositoryInventory(self.root)
+            probes_after_init = alias_check.call_count
+            first = inventory.resolve_scan_root(self.root / "docs/a")
+            probes_after_first = alias_check.call_count
+            again = [inventory.resolve_scan_root(self.root / "docs/a"), inventory.resolve_scan_root(self.root / "docs")]
+        store = DocumentStore(resolutions=inventory.resolutions)
+        document = self.root / "docs/a/x.md"
+        with patch.object(_path_resolution.os, "lstat", wraps=_path_resolution.os.lstat) as lstat:
+            text = store.read_text(document)
+            reads_after_first = lstat.call_count
+            repeated = [store.read_text(document), store.markdown(document)[1]]
+
+        self.assertEqual((self.root / "docs/a", None), first)
+        self.assertEqual([first, (self.root / "docs", None)], again)
+        self.assertEqual(2, probes_after_first - probes_after_init)
+        self.assertEqual(probes_after_first, alias_check.call_count)
+        self.assertEqual(("# x\n", None), text)
+        self.assertEqual([text, None], repeated)
+        self.assertEqual(reads_after_first, lstat.call_count)
+
+    def test_resolution_matches_path_resolve_through_symlinks_and_missing_parts(self) -> None:
+        resolutions = PathResolutions()
+        for path in (
+            self.root / "linked/a/x.md",
+            self.root / "linked/missing/y.md",
+            self.root / "docs/a/../a/x.md",
+            self.root / "docs/a/x.md",
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(path.resolve(), resolutions.resolve(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -171,7 +171,8 @@ class PublicApiContractTests(unittest.TestCase):
         self.assertIn("unsupported request key", result["errors"][0])
 
     def test_rejects_invalid_public_request_value_types(self) -> None:
-        for request in ({"mode": []}, {"fail_on_safety_warnings": "false"}, {"repo_root": 42}):
+        invalid = ({"mode": []}, {"fail_on_safety_warnings": "false"}, {"repo_root": 42}, {"scan_workers": 0})
+        for request in invalid:
             with self.subTest(request=request):
                 result = run_checks(request)
                 self.assertEqual("FAILED_VALIDATION", result["status"], result)
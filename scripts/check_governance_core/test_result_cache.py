@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core.check_governance_core_main import run_checks
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+def _settle(root: Path) -> None:
+    """Backdate the fixture so cached stat data falls outside the racy window."""
+
+    past = time.time_ns() - 60_000_000_000
+    for directory, _names, files in os.walk(root):
+        for name in files:
+            os.utime(Path(directory) / name, ns=(past, past))
+        os.utime(directory, ns=(past, past))
+
+
+def _fixture(root: Path) -> None:
+    _write(root / "AGENTS.md", "# Agent\n")
+    _write(root / "agents-manifest.yaml", "version: 1\n")
+    _write(root / "docs/guide.md", "---\ndoc_type: guide\n---\n# Guide\n")
+    _write(root / "scripts/tool/tool_main.py", "VALUE = 1\n")
+    _settle(root)
+
+
+class ResultCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp.cleanup)
+        self.root = Path(self._temp.name) / "repo"
+        self.cache_dir = Path(self._temp.name) / "cache"
+        _fixture(self.root)
+        self.request = {
+            "repo_root": str(self.root),
+            "governance_root": str(self.root),
+            "cache_dir": str(self.cache_dir),
+            "metrics": True,
+        }
+
+    def _replayed(self, result: dict[str, object]) -> dict[str, int]:
+        return {str(record["id"]): record["metrics"]["result_cache_hits"] for record in result["checks"]}
+
+    def _strip_metrics(self, result: dict[str, object]) -> dict[str, object]:
+        stripped = {key: value for key, value in result.items() if key != "metrics"}
+        stripped["checks"] = [
+            {key: value for key, value in record.items() if key != "metrics"} for record in result["checks"]
+        ]
+        return stripped
+
+    def test_unchanged_rerun_replays_every_check_without_reading_files(self) -> None:
+        first = run_checks(self.request)
+        second = run_checks(self.request)
+
+        self.assertEqual(0, first["metrics"]["result_cache_hits"])
+        self.assertTrue(all(self._replayed(second).values()), second)
+        self.assertEqual(0, second["metrics"]["files_read"])
+        self.assertEqual(self._strip_metrics(first), self._strip_metrics(second))
+
+    def test_editing_a_document_reruns_only_checks_that_consumed_it(self) -> None:
+        run_checks(self.request)
+        _write(self.root / "docs/guide.md", "---\ndoc_type: guide\n---\n# Guide\n\nMore.\n")
+
+        replayed = self._replayed(run_checks(self.request))
+
+        self.assertEqual(0, replayed["docs"])
+        self.assertEqual(0, replayed["folder_architecture"])
+        self.assertEqual(1, replayed["python_safety"])
+        self.assertEqual(1, replayed["manifest"])
+
+    def test_adding_a_file_reruns_tree_consumers(self) -> None:
+        run_checks(self.request)
+        _write(self.root / "scripts/tool/extra.py", "import subprocess\n")
+
+        result = run_checks(self.request)
+        replayed = self._replayed(result)
+
+        self.assertEqual(0, replayed["python_safety"])
+        self.assertEqual(0, replayed["folder_architecture"])
+        uncached = run_checks({**self.request, "cache_dir": None})
+        self.assertEqual(self._strip_metrics(uncached), self._strip_metrics(result))
+
+    def test_checker_change_invalidates_every_entry(self) -> None:
+        run_checks(self.request)
+        with patch("scripts.check_governance_core._result_cache.checker_fingerprint", return_value="changed"):
+            result = run_checks(self.request)
+
+        self.assertFalse(any(self._replayed(result).values()), result)
+
+    @unittest.skipIf(shutil.which("git") is None, "git is not installed")
+    def test_inventory_source_change_does_not_replay_results(self) -> None:
+        _write(self.root / ".gitignore", "build/\n")
+        _write(self.root / "scripts/feature_0/build/gen.py", "print('generated')\n")
+        for arguments in (("init", "-q"), ("add", "-A")):
+            subprocess.run(["git", "-C", str(self.root), *arguments], check=True, capture_output=True, timeout=60)
+        _settle(self.root)
+        run_checks({**self.request, "inventory_source": "git_index"})
+
+        result = run_checks({**self.request, "inventory_source": "walk"})
+        uncached = run_checks({**self.request, "inventory_source": "walk", "cache_dir": None})
+
+        self.assertEqual(0, self._replayed(result)["python_safety"])
+        self.assertEqual(0, self._replayed(result)["folder_architecture"])
+        self.assertIn("PRINT_CALL", str(result["checks"]))
+        self.assertEqual(self._strip_metrics(uncached), self._strip_metrics(result))
+
+    def test_cache_dir_inside_repository_content_is_rejected(self) -> None:
+        result = run_checks({**self.request, "cache_dir": str(self.root / "cache")})
+
+        self.assertEqual("FAILED_VALIDATION", result["status"], result)
+        self.assertEqual(
+            ["cache_dir must be outside the repository content or inside its .git directory"],
+            result["errors"],
+        )
+        self.assertFalse((self.root / "cache").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -132,9 +132,9 @@ class RetainedCheckTests(unittest.TestCase):
             def wait(self, *, timeout: float) -> None:
                 raise subprocess.TimeoutExpired("git", timeout)
 
-        with patch.object(_git_capture, "MAX_STDOUT_BYTES", 1), patch.object(
-            _git_capture.subprocess, "Popen", return_value=Process()
-        ):
+        with patch.object(_git_capture, "SELECTABLE_PIPES", False), patch.object(
+            _git_capture, "MAX_STDOUT_BYTES", 1
+        ), patch.object(_git_capture.subprocess, "Popen", return_value=Process()):
             _stdout, _stderr, _returncode, error = _git_capture.bounded_capture(
                 ["git"], label="tracked files"
             )
@@ -176,9 +176,9 @@ class RetainedCheckTests(unittest.TestCase):
                 super().start()
 
         process = Process()
-        with patch.object(_git_capture.subprocess, "Popen", return_value=process), patch.object(
-            _git_capture.threading, "Thread", PartialStartThread
-        ):
+        with patch.object(_git_capture, "SELECTABLE_PIPES", False), patch.object(
+            _git_capture.subprocess, "Popen", return_value=process
+        ), patch.object(_git_capture.threading, "Thread", PartialStartThread):
             _stdout, _stderr, _returncode, error = _git_capture.bounded_capture(
                 ["git"], label="tracked files"
             )
@@ -314,6 +314,9 @@ class RetainedCheckTests(unittest.TestCase):
             def is_dir(self, *, follow_symlinks: bool) -> bool:
                 return True
 
+            def stat(self, *, follow_symlinks: bool) -> SimpleNamespace:
+                return SimpleNamespace(st_mtime_ns=0, st_ino=0)
+
         class Scan:
             def __enter__(self) -> list[Entry]:
                 return [Entry()]
@@ -326,7 +329,7 @@ class RetainedCheckTests(unittest.TestCase):
             with patch.object(_inventory.os, "scandir", return_value=Scan()), patch.object(
                 _inventory,
                 "_is_directory_alias",
-                side_effect=lambda path: path.parent == root,
+                side_effect=lambda path, _metadata=None: path.parent == root,
             ) as alias_check:
                 entries, error = RepositoryInventory(root).tree_entries(root)
 
@@ -342,6 +345,9 @@ class RetainedCheckTests(unittest.TestCase):
             def is_dir(self, *, follow_symlinks: bool) -> bool:
                 return True
 
+            def stat(self, *, follow_symlinks: bool) -> SimpleNamespace:
+                return SimpleNamespace(st_mtime_ns=0, st_ino=0)
+
             def is_symlink(self) -> bool:
                 return False
 
@@ -363,7 +369,7 @@ class RetainedCheckTests(unittest.TestCase):
                 with patch.object(_inventory.os, "scandir", return_value=Scan(order)), patch.object(
                     _inventory,
                     "_is_directory_alias",
-                    side_effect=lambda path: path.parent == root,
+                    side_effect=lambda path, _metadata=None: path.parent == root,
                 ):
                     _files, error = RepositoryInventory(root).python_files(root)
                     errors.append(error)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import _inventory
+from scripts.check_governance_core._documents import DocumentStore
+from scripts.check_governance_core._inventory import RepositoryInventory
+from scripts.check_governance_core._single_flight import SingleFlightCache
+
+
+THREADS = 8
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+def _together(function, count: int = THREADS) -> list[object]:
+    barrier = threading.Barrier(count)
+
+    def call() -> object:
+        barrier.wait()
+        return function()
+
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(call) for _index in range(count)]
+        return [future.result() for future in futures]
+
+
+class SingleFlightCacheTests(unittest.TestCase):
+    def test_concurrent_misses_share_one_load(self) -> None:
+        cache: SingleFlightCache[str, object] = SingleFlightCache()
+        calls: list[int] = []
+
+        def load() -> object:
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        values = _together(lambda: cache.get("key", load))
+
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(value is values[0] for value in values))
+
+    def test_failed_load_is_not_cached(self) -> None:
+        cache: SingleFlightCache[str, str] = SingleFlightCache()
+
+        def fail() -> str:
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            cache.get("key", fail)
+        self.assertEqual("value", cache.get("key", lambda: "value"))
+        self.assertEqual((("key", "value"),), cache.items())
+
+    def test_setdefault_keeps_the_first_value_across_threads(self) -> None:
+        cache: SingleFlightCache[str, int] = SingleFlightCache()
+        values = iter(range(THREADS))
+        lock = threading.Lock()
+
+        def store() -> int:
+            with lock:
+                value = next(values)
+            return cache.setdefault("key", value)
+
+        kept = _together(store)
+
+        self.assertEqual([kept[0]] * THREADS, kept)
+        self.assertEqual(kept[0], cache.completed("key"))
+        self.assertIsNone(cache.completed("other"))
+
+
+class SharedRunCacheTests(unittest.TestCase):
+    def test_document_store_reads_each_path_once_across_threads(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "guide.md"
+            _write(path, "# Guide\n")
+            store = DocumentStore()
+            real_open = Path.open
+            reads: list[Path] = []
+
+            def counting_open(self: Path, *args: object, **kwargs: object):
+                reads.append(self)
+                time.sleep(0.02)
+                return real_open(self, *args, **kwargs)
+
+            with patch.object(Path, "open", counting_open):
+                documents = _together(lambda: store.markdown(path))
+
+        self.assertEqual(1, len(reads))
+        self.assertTrue(all(document is documents[0] for document in documents))
+
+    def test_document_store_keeps_universal_newline_text(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "guide.md"
+            with path.open("wb") as handle:
+                handle.write(b"# Guide\r\nbody\rend\n")
+
+            self.assertEqual(("# Guide\nbody\nend\n", None), DocumentStore().read_text(path))
+
+    def test_inventory_scans_each_tree_once_across_threads(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            _write(root / "docs/guide.md", "# Guide\n")
+            _write(root / "scripts/tool.py", "VALUE = 1\n")
+            real_scandir = _inventory.os.scandir
+            with patch.object(_inventory.os, "scandir", wraps=real_scandir) as scandir:
+                RepositoryInventory(root).tree_entries(root)
+                sequential_calls = scandir.call_count
+                scandir.reset_mock()
+                inventory = RepositoryInventory(root)
+                results = _together(lambda: inventory.python_files(root))
+
+        self.assertEqual(sequential_calls, scandir.call_count)
+        self.assertEqual(((root / "scripts/tool.py",), None), results[0])
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_concurrent_roots_and_shards_match_the_sequential_inventory(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp).resolve()
+            for relative in ("docs/a/guide.md", "docs/b.md", "scripts/tool.py", "src/pkg/mod.py", "top.md"):
+                _write(root / relative, "x\n")
+            roots = [root, root / "docs", root / "docs/a", root / "scripts", root / "src/pkg"]
+
+            def observe(inventory: RepositoryInventory, target: Path) -> object:
+                return inventory.tree_entries(target), inventory.tree_stamp(target)
+
+            sequential = RepositoryInventory(root)
+            expected = [observe(sequential, target) for target in roots]
+            for _attempt in range(5):
+                inventory = RepositoryInventory(root, scan_workers=4)
+                order = iter(range(THREADS))
+                lock = threading.Lock()
+
+                def pick() -> object:
+                    with lock:
+                        index = next(order) % len(roots)
+                    return observe(inventory, roots[index])
+
+                _together(pick)
+                self.assertEqual(expected, [observe(inventory, target) for target in roots])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import _execution, check_governance_core_main
+from scripts.check_governance_core.check_governance_core_main import iter_checks, run_checks
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+class IterChecksTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp.cleanup)
+        self.root = Path(self._temp.name)
+        _write(self.root / "AGENTS.md", "# Agent\n")
+        _write(self.root / "agents-manifest.yaml", "version: 1\n")
+        _write(self.root / "docs/guide.md", "# Guide\n")
+        _write(self.root / "scripts/tool/noisy.py", "print('x')\n")
+        self.request = {"repo_root": str(self.root), "governance_root": str(self.root)}
+
+    def test_records_stream_before_a_summary_that_matches_run_checks(self) -> None:
+        for workers in (1, 4):
+            with self.subTest(workers=workers):
+                request = {**self.request, "workers": workers}
+                items = list(iter_checks(request))
+                result = run_checks(request)
+
+                *records, summary = items
+                self.assertTrue(all(record["type"] == "check" for record in records))
+                self.assertEqual("summary", summary["type"])
+                by_id = {record.pop("id"): record for record in records}
+                for record in result["checks"]:
+                    streamed = by_id[record["id"]]
+                    self.assertEqual(record["status"], streamed["status"])
+                    self.assertEqual(record["errors"], streamed["errors"])
+                    self.assertEqual(record["warnings"], streamed["warnings"])
+                for key in ("status", "planned", "eligible", "executed", "skipped", "failed"):
+                    self.assertEqual(result[key], summary[key], key)
+                self.assertEqual(len(result["errors"]), summary["error_count"])
+                self.assertEqual(len(result["warnings"]), summary["warning_count"])
+                self.assertEqual([], summary["errors"])
+
+    def test_each_record_is_yielded_before_the_next_check_runs(self) -> None:
+        real_run_check = _execution._run_check
+        started: list[str] = []
+
+        def tracking_run_check(check_id: str, *args: object) -> tuple[list[str], list[str]]:
+            started.append(check_id)
+            return real_run_check(check_id, *args)
+
+        with patch.object(_execution, "_run_check", tracking_run_check):
+            stream = iter_checks(self.request)
+            first = next(stream)
+            self.assertEqual([first["id"]], started)
+            second = next(stream)
+            self.assertEqual([first["id"], second["id"]], started)
+            stream.close()
+
+    def test_invalid_request_yields_one_failed_summary(self) -> None:
+        for request, error in (
+            ({**self.request, "unknown": 1}, "unsupported request key(s): unknown"),
+            ({**self.request, "mode": "nope"}, "mode must be one of full, docs, project_docs"),
+        ):
+            with self.subTest(error=error):
+                items = list(iter_checks(request))
+                self.assertEqual(1, len(items), items)
+                self.assertEqual("summary", items[0]["type"])
+                self.assertEqual("FAILED_VALIDATION", items[0]["status"])
+                self.assertEqual([error], items[0]["errors"])
+                self.assertEqual(1, items[0]["error_count"])
+
+    def test_cli_ndjson_prints_one_json_object_per_line(self) -> None:
+        stdout = io.StringIO()
+        check_governance_core_main._configure_logging()
+        with patch.object(check_governance_core_main, "_configure_logging"), patch.object(
+            check_governance_core_main.logger.handlers[0], "stream", stdout
+        ):
+            status = check_governance_core_main.main(
+                ["--repo-root", str(self.root), "--governance-root", str(self.root), "--format", "ndjson"]
+            )
+
+        lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(1, status)
+        self.assertEqual("summary", lines[-1]["type"])
+        self.assertEqual(len(lines[-1]["planned"]), len(lines) - 1)
+        self.assertTrue(all(line["type"] == "check" for line in lines[:-1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
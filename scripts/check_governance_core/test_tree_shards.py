@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import _inventory
+from scripts.check_governance_core._entry_table import EntryTable
+from scripts.check_governance_core._inventory import RepositoryInventory
+from scripts.check_governance_core._tree_walk import WalkLimits, walk_tree
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+class TreeShardTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = Path(temp.name).resolve()
+        for relative in ("docs/a/one.md", "docs/b.md", "src/pkg/mod.py", "top.md", ".git/HEAD"):
+            _write(self.root / relative, "x\n")
+
+    def test_composed_tree_matches_one_global_walk_with_fresh_stamps(self) -> None:
+        limits = WalkLimits(_inventory.MAX_VISITED_ENTRIES, 5.0, _inventory._is_directory_alias)
+        rows, error = walk_tree(self.root, limits)
+        sequential, sequential_error = RepositoryInventory(self.root).tree_entries(self.root)
+        parallel, parallel_error = RepositoryInventory(self.root, scan_workers=3).tree_entries(self.root)
+
+        self.assertIsNone(error)
+        self.assertIsNone(sequential_error)
+        self.assertIsNone(parallel_error)
+        self.assertEqual(EntryTable.from_rows(self.root, rows), sequential)
+        self.assertEqual(sequential, parallel)
+
+    def test_shard_that_exhausts_the_budget_fails_the_repository_but_not_earlier_siblings(self) -> None:
+        for index in range(8):
+            _write(self.root / f"var/blob{index}.txt", "x\n")
+        with patch.object(_inventory, "MAX_VISITED_ENTRIES", 10):
+            inventory = RepositoryInventory(self.root)
+            tree, tree_error = inventory.tree_entries(self.root)
+            with patch.object(_inventory, "walk_tree", side_effect=AssertionError("shard walked twice")):
+                docs, docs_error = inventory.tree_entries(self.root / "docs")
+                nested, nested_error = inventory.tree_entries(self.root / "docs/a")
+                markdown, markdown_error = inventory.markdown_files(self.root / "docs")
+            fresh, _fresh_error = RepositoryInventory(self.root).tree_entries(self.root / "docs")
+
+        self.assertEqual((), tree)
+        self.assertEqual("Repository tree inventory exceeded 10 entries", tree_error)
+        self.assertIsNone(docs_error)
+        self.assertEqual(fresh, docs)
+        self.assertIsNone(nested_error)
+        self.assertEqual([self.root / "docs/a/one.md"], [entry.path for entry in nested])
+        self.assertEqual(((self.root / "docs/a/one.md", self.root / "docs/b.md"), None), (markdown, markdown_error))
+
+    def test_shard_walks_share_the_repository_deadline_and_entry_budget(self) -> None:
+        for shard in range(4):
+            for index in range(5):
+                _write(self.root / f"shard{shard}/blob{index}.txt", "x\n")
+        calls: list[tuple[object, object]] = []
+        real_walk = _inventory.walk_tree
+
+        def walk(root: Path, *arguments: object, **options: object) -> object:
+            calls.append((options["started"], options["budget"]))
+            return real_walk(root, *arguments, **options)  # type: ignore[arg-type]
+
+        with (
+            patch.object(_inventory, "MAX_VISITED_ENTRIES", 20),
+            patch.object(_inventory, "walk_tree", side_effect=walk),
+        ):
+            tree, tree_error = RepositoryInventory(self.root, scan_workers=4).tree_entries(self.root)
+
+        self.assertEqual((), tree)
+        self.assertEqual("Repository tree inventory exceeded 20 entries", tree_error)
+        self.assertEqual(1, len({id(budget) for _started, budget in calls}))
+        self.assertEqual(1, len({started for started, _budget in calls}))
+        self.assertLess(calls[0][1].remaining, 0)  # type: ignore[attr-defined]
+
+    def test_shards_loaded_before_the_repository_are_not_walked_again(self) -> None:
+        inventory = RepositoryInventory(self.root)
+        docs, docs_error = inventory.tree_entries(self.root / "docs")
+        walked: list[Path] = []
+        real_walk = _inventory.walk_tree
+
+        def walk(root: Path, *arguments: object, **options: object) -> object:
+            walked.append(root)
+            return real_walk(root, *arguments, **options)  # type: ignore[arg-type]
+
+        with patch.object(_inventory, "walk_tree", side_effect=walk):
+            tree, tree_error = inventory.tree_entries(self.root)
+
+        self.assertIsNone(docs_error)
+        self.assertIsNone(tree_error)
+        self.assertEqual([self.root / "src"], walked)
+        self.assertEqual(list(docs), [entry for entry in tree if self.root / "docs" in entry.path.parents])
+
+    def test_shard_errors_are_reported_in_listing_order_for_any_worker_count(self) -> None:
+        for index in range(8):
+            _write(self.root / f"big/blob{index}.txt", "x\n")
+        real_alias_check = _inventory._is_directory_alias
+        errors = []
+        for workers in (1, 4):
+            with (
+                patch.object(_inventory, "MAX_VISITED_ENTRIES", 6),
+                patch.object(
+                    _inventory,
+                    "_is_directory_alias",
+                    side_effect=lambda path, metadata=None: path.name == "pkg" or real_alias_check(path, metadata),
+                ),
+            ):
+                errors.append(RepositoryInventory(self.root, scan_workers=workers).tree_entries(self.root)[1])
+
+        self.assertEqual(["Repository tree inventory exceeded 6 entries"] * 2, errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import _tree_snapshot
+from scripts.check_governance_core._inventory import RepositoryInventory
+from scripts.check_governance_core._tree_snapshot import TreeSnapshotStore, revalidate_tree
+from scripts.check_governance_core._tree_walk import SharedBudget, WalkLimits, is_directory_alias
+from scripts.check_governance_core.check_governance_core_main import run_checks
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+def _settle(root: Path) -> None:
+    """Backdate every directory so its listing falls outside the racy window."""
+
+    past = time.time_ns() - 60_000_000_000
+    for directory, _names, _files in os.walk(root):
+        os.utime(directory, ns=(past, past))
+
+
+class TreeSnapshotTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = (Path(temp.name) / "repo").resolve()
+        self.path = Path(temp.name) / "tree.json"
+        for relative in ("docs/a/one.md", "docs/b/two.md", "src/pkg/mod.py", "data/blob.txt", ".git/HEAD"):
+            _write(self.root / relative, "x\n")
+        _settle(self.root)
+
+    def _walk(self) -> tuple[tuple[object, ...], str | None, list[Path]]:
+        inventory = RepositoryInventory(self.root)
+        inventory.snapshots = TreeSnapshotStore(self.path, {"repo_root": str(self.root)})
+        listed: list[Path] = []
+        real_scan = _tree_snapshot.scan_directory
+
+        def scan(directory: Path, *args: object) -> object:
+            listed.append(directory)
+            return real_scan(directory, *args)
+
+        with patch.object(_tree_snapshot, "scan_directory", side_effect=scan):
+            entries, error = inventory.tree_entries(self.root)
+        self.assertIsNone(inventory.snapshots.save())
+        return entries, error, listed
+
+    def test_warm_walk_lists_only_changed_directories_and_matches_a_fresh_walk(self) -> None:
+        self._walk()
+        _write(self.root / "docs/b/three.md", "new\n")
+        _write(self.root / "docs/a/one.md", "grown content\n")
+        _write(self.root / "data/blob.txt", "grown content\n")
+
+        entries, error, listed = self._walk()
+        fresh, fresh_error = RepositoryInventory(self.root).tree_entries(self.root)
+
+        self.assertIsNone(error)
+        self.assertIsNone(fresh_error)
+        self.assertEqual([self.root / "docs/b"], listed)
+        stale = self.root / "data/blob.txt"
+        self.assertEqual(
+            [entry for entry in fresh if entry.path != stale],
+            [entry for entry in entries if entry.path != stale],
+        )
+        self.assertEqual(14, next(entry.size for entry in entries if entry.path == self.root / "docs/a/one.md"))
+        self.assertEqual(2, next(entry.size for entry in entries if entry.path == stale))
+
+    def test_shared_budget_is_charged_only_for_a_tree_the_rebuild_returns(self) -> None:
+        self._walk()
+        snapshot = TreeSnapshotStore(self.path, {"repo_root": str(self.root)}).get(self.root / "docs")
+        assert snapshot is not None
+        limits = WalkLimits(100, 5.0, is_directory_alias)
+        short, enough = SharedBudget(3), SharedBudget(10)
+
+        refused = revalidate_tree(self.root / "docs", snapshot, limits, refreshed_suffixes=frozenset(), budget=short)
+        rebuilt = revalidate_tree(self.root / "docs", snapshot, limits, refreshed_suffixes=frozenset(), budget=enough)
+
+        self.assertIsNone(refused)
+        self.assertEqual(3, short.remaining)
+        self.assertEqual((list(snapshot.entries.rows()), 0), rebuilt)
+        self.assertEqual(6, enough.remaining)
+
+    def test_recently_modified_directories_are_listed_again_until_they_settle(self) -> None:
+        os.utime(self.root / "src/pkg")
+        self._walk()
+
+        _entries, _error, listed = self._walk()
+        _settle(self.root)
+        self._walk()
+        _entries, _error, settled = self._walk()
+
+        self.assertEqual([self.root / "src/pkg"], listed)
+        self.assertEqual([], settled)
+
+    def test_new_directory_alias_is_reported_like_a_fresh_walk(self) -> None:
+        self._walk()
+        (self.root / "docs/link").symlink_to(self.root / "src", target_is_directory=True)
+
+        entries, error, _listed = self._walk()
+
+        self.assertEqual((), entries)
+        self.assertEqual(
+            f"Repository tree does not permit directory symlinks or aliases: {self.root / 'docs/link'}",
+            error,
+        )
+
+    def test_run_checks_persists_snapshots_only_under_cache_dir(self) -> None:
+        cache_dir = self.path.parent / "cache"
+        request = {"repo_root": str(self.root), "governance_root": str(self.root), "mode": "docs"}
+
+        uncached = run_checks(request)
+        first = run_checks({**request, "cache_dir": str(cache_dir)})
+        second = run_checks({**request, "cache_dir": str(cache_dir)})
+
+        self.assertEqual(uncached["errors"], first["errors"])
+        self.assertEqual(first["errors"], second["errors"])
+        self.assertEqual(1, len(list(cache_dir.glob("tree-*.json"))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import _inventory, _tree_walk
+from scripts.check_governance_core._inventory import RepositoryInventory
+from scripts.check_governance_core._metrics import CheckMetrics, measure
+from scripts.check_governance_core._tree_walk import SharedBudget, WalkLimits, walk_tree
+
+
+def _write(path: Path, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+
+
+class ParallelWalkTests(unittest.TestCase):
+    def test_parallel_walk_matches_the_sequential_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp).resolve()
+            for relative in ("docs/b.md", "docs/A/a.md", "docs/a/deep/x.md", "src/m.py", "top.md", ".git/HEAD"):
+                _write(root / relative, "x\n")
+            sequential, sequential_error = RepositoryInventory(root).tree_entries(root)
+            parallel, parallel_error = RepositoryInventory(root, scan_workers=4).tree_entries(root)
+
+        self.assertIsNone(sequential_error)
+        self.assertIsNone(parallel_error)
+        self.assertEqual(sequential, parallel)
+        self.assertNotIn(".git", {part for entry in parallel for part in entry.path.relative_to(root).parts})
+
+    def test_parallel_walk_keeps_entry_budget_and_alias_rejection(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp).resolve()
+            for relative in ("a/one.md", "b/two.md", "c/three.md"):
+                _write(root / relative, "x\n")
+            with patch.object(_inventory, "MAX_VISITED_ENTRIES", 4):
+                limited, limit_error = RepositoryInventory(root, scan_workers=3).tree_entries(root)
+            real_alias_check = _inventory._is_directory_alias
+            with patch.object(
+                _inventory,
+                "_is_directory_alias",
+                side_effect=lambda path, metadata=None: path.name in {"b", "c"} or real_alias_check(path, metadata),
+            ):
+                aliased, alias_error = RepositoryInventory(root, scan_workers=3).tree_entries(root)
+
+        self.assertEqual((), limited)
+        self.assertEqual("Repository tree inventory exceeded 4 entries", limit_error)
+        self.assertEqual((), aliased)
+        self.assertEqual(f"Repository tree does not permit directory symlinks or aliases: {root / 'b'}", alias_error)
+
+    def test_parallel_walk_reports_the_failure_the_sequential_walk_reaches_first(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp).resolve()
+            for relative in ("a/x/one.md", "b/two.md", "target/three.md"):
+                _write(root / relative, "x\n")
+            (root / "a/x/y").symlink_to(root / "target", target_is_directory=True)
+            (root / "b/z").symlink_to(root / "target", target_is_directory=True)
+            limits = WalkLimits(_inventory.MAX_VISITED_ENTRIES, 5.0, _inventory._is_directory_alias)
+            errors = [walk_tree(root, limits, workers=workers)[1] for workers in (1, 3)]
+
+        expected = f"Repository tree does not permit directory symlinks or aliases: {root / 'a/x/y'}"
+        self.assertEqual([expected, expected], errors)
+
+    def test_one_level_of_concurrent_scans_shares_a_single_entry_budget(self) -> None:
+        taken: list[bool] = []
+
+        class RecordingBudget(SharedBudget):
+            def take(self) -> bool:
+                taken.append(super().take())
+                return taken[-1]
+
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp).resolve()
+            for relative in ("a/1.md", "a/2.md", "a/3.md", "b/1.md", "b/2.md", "b/3.md", "c/1.md", "c/2.md"):
+                _write(root / relative, "x\n")
+            limits = WalkLimits(5, 5.0, _inventory._is_directory_alias)
+            with patch.object(_tree_walk, "SharedBudget", RecordingBudget):
+                rows, error = walk_tree(root, limits, workers=3)
+
+        self.assertEqual(([], "Repository tree inventory exceeded 5 entries"), (rows, error))
+        self.assertEqual(5, taken.count(True))
+
+
+class WalkSyscallTests(unittest.TestCase):
+    def test_each_entry_costs_one_stat_and_no_directory_is_resolved(self) -> None:
+        counts = []
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp).resolve()
+            for relative in ("docs/a/x.md", "docs/b.md", "src/m.py", "top.md", ".git/HEAD"):
+                _write(root / relative, "x\n")
+            (root / "link.md").symlink_to(root / "top.md")
+            for workers in (1, 3):
+                inventory = RepositoryInventory(root, scan_workers=workers)
+                inventory.resolve_scan_root(root)
+                metrics = CheckMetrics()
+                with measure(metrics), patch.object(Path, "resolve", side_effect=AssertionError("resolved")):
+                    entries, error = inventory.tree_entries(root)
+                self.assertIsNone(error)
+                self.assertEqual(8, len(entries))
+                counts.append((metrics.counters["tree_scandir_calls"], metrics.counters["tree_stat_calls"]))
+
+        # Four listings: the root, docs, docs/a, and src. One stat per listed entry (.git included),
+        # a second for the symlink, and one stamp per walked root: the repository and its two shards.
+        self.assertEqual([(4, 13), (4, 13)], counts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.check_governance_core import check_governance_core_main
+from scripts.check_governance_core._documents import DocumentStore
+
+
+def _write(path: Path, value: str, *, settled: bool = True) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(value)
+    if settled:
+        past = time.time_ns() - 60_000_000_000
+        for target in (path, *path.parents[:3]):
+            os.utime(target, ns=(past, past))
+
+
+class WarmDocumentStoreTests(unittest.TestCase):
+    def test_unchanged_documents_are_reused_without_reading(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "docs/guide.md"
+            _write(path, "# Guide\n")
+            first = DocumentStore()
+            document, _error = first.markdown(path)
+            real_open = Path.open
+            reads: list[Path] = []
+
+            def counting_open(self: Path, *args: object, **kwargs: object):
+                reads.append(self)
+                return real_open(self, *args, **kwargs)
+
+            with patch.object(Path, "open", counting_open):
+                reused, _error = DocumentStore(first).markdown(path)
+            _write(path, "# Guide\n\nEdited.\n")
+            edited, _error = DocumentStore(first).markdown(path)
+
+        self.assertIs(document, reused)
+        self.assertEqual([], reads)
+        self.assertIsNotNone(edited)
+        self.assertIsNot(document, edited)
+
+    def test_recently_modified_documents_are_read_again(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "guide.md"
+            _write(path, "# Guide\n", settled=False)
+            first = DocumentStore()
+            text, _error = first.read_text(path)
+
+            again, _error = DocumentStore(first).read_text(path)
+
+        self.assertEqual(text, again)
+        self.assertIsNot(text, again)
+
+
+class WatchModeTests(unittest.TestCase):
+    def test_watch_reports_initial_run_and_only_changed_checks_afterwards(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            _write(root / "AGENTS.md", "# Agent\n")
+            _write(root / "docs/guide.md", "# Guide\n")
+            request = {"repo_root": str(root), "governance_root": str(root), "mode": "docs"}
+            polls: list[int] = []
+
+            def edit_on_second_poll(_seconds: float) -> None:
+                polls.append(1)
+                if len(polls) == 2:
+                    _write(root / "docs/guide.md", "# Guide\n\nEdited.\n")
+
+            stdout = io.StringIO()
+            check_governance_core_main._configure_logging()
+            with patch.object(check_governance_core_main.time, "sleep", edit_on_second_poll), patch.object(
+                check_governance_core_main.logger.handlers[0], "stream", stdout
+            ):
+                status = check_governance_core_main._watch(request, profile=False, cycles=4, interval=0)
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(1, status)
+        self.assertEqual(2, sum(line.startswith("Governance core:") for line in lines), lines)
+        self.assertEqual(["Changed: docs"], [line for line in lines if line.startswith("Changed:")])
+
+
+if __name__ == "__main__":
+    unittest.main()